@@ -7,20 +7,52 @@ Automated cleanup of aged Atlas resources:
 
 Environment Variables:
     ATLAS_PUBLIC_KEY, ATLAS_PRIVATE_KEY, ATLAS_ORG_ID
+    ATLAS_CLIENT_ID, ATLAS_CLIENT_SECRET (optional, service account instead of keys)
     ATLAS_API_BASE_URL (optional)
+    MAX_PROJECT_WORKERS, MAX_DELETE_WORKERS (optional, concurrency limits)
+    HTTP_CACHE_TTL (optional, seconds to cache GETs; requires requests-cache)
+    MAX_ITEMS_BUDGET (optional, max items fetched per paginated endpoint)
 
-Usage: python cleanup_aged_projects_and_clusters.py [--no-confirm]
+Usage: python cleanup_aged_projects_and_clusters.py [--no-confirm] [--resume]
 """
 
 import argparse
+import atexit
 import logging
+import math
 import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
 
 import requests
 from dotenv import load_dotenv
-from requests.auth import HTTPDigestAuth
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase, HTTPBasicAuth, HTTPDigestAuth
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+except ImportError:  # Optional: only needed when HTTP_CACHE_TTL is set
+    requests_cache = None
+
+try:
+    import ciso8601
+except ImportError:  # Optional: faster C parser for ISO-8601 timestamps
+    ciso8601 = None
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON decoding for large pages
+    orjson = None
 
 # Load environment variables and configure constants
 load_dotenv()
@@ -28,23 +60,199 @@ load_dotenv()
 ATLAS_API_BASE_URL = os.getenv(
     "ATLAS_API_BASE_URL", "https://cloud.mongodb.com/api/atlas/v2"
 )
+ATLAS_OAUTH_TOKEN_URL = os.getenv(
+    "ATLAS_OAUTH_TOKEN_URL", "https://cloud.mongodb.com/api/oauth/token"
+)
 CURRENT_DATE_UTC = datetime.now(timezone.utc)
 USER_DELETION_THRESHOLD = 90
 CLUSTER_DELETION_THRESHOLD = 120
+ISO_UTC_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+# Database users that must never be deleted
+PROTECTED_USERNAMES = frozenset({"__onprem_monitoring", "admin"})
+# Concurrency limits, kept low by default to stay within Atlas API rate limits
+MAX_PROJECT_WORKERS = int(os.getenv("MAX_PROJECT_WORKERS", "8"))
+MAX_DELETE_WORKERS = int(os.getenv("MAX_DELETE_WORKERS", "5"))
+MAX_FETCH_WORKERS = MAX_PROJECT_WORKERS * 2
+MAX_PAGE_WORKERS = 4
+# Every worker thread across the shared pools can hold one connection at a time
+MAX_CONNECTIONS = (
+    MAX_PROJECT_WORKERS + MAX_FETCH_WORKERS + MAX_DELETE_WORKERS + MAX_PAGE_WORKERS
+)
+# Records finished projects so an interrupted run can be resumed with --resume
+CHECKPOINT_DB = "logs/reaper_state.sqlite"
+ITEMS_PER_PAGE = 500  # Largest page size the Atlas Admin API accepts
+# Per-project collections are usually small, so ask for less padding per page
+SMALL_ITEMS_PER_PAGE = 100
+# Safety limit on items collected from one paginated endpoint
+MAX_ITEMS_BUDGET = int(os.getenv("MAX_ITEMS_BUDGET", "50000"))
+# Seconds to cache GET responses on disk between runs (0 disables caching)
+HTTP_CACHE_TTL = int(os.getenv("HTTP_CACHE_TTL", "0"))
+
+# Read-only so the shared defaults cannot be mutated by a single call site
+ATLAS_HEADERS = MappingProxyType(
+    {
+        "Content-Type": "application/json",
+        "Accept": "application/vnd.atlas.2025-03-12+json",
+    }
+)
+REQUEST_TIMEOUT = 30  # Seconds
+
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("logs/reaper.log"), logging.StreamHandler()],
+class RecordQueueHandler(QueueHandler):
+    """Enqueue records untouched so formatting happens on the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+# Configure logging: workers only enqueue records, a background thread formats
+# and writes them
+LOG_QUEUE = queue.Queue(-1)
+LOG_FORMATTER = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+LOG_LISTENER = QueueListener(
+    LOG_QUEUE,
+    logging.FileHandler("logs/reaper.log", delay=True),
+    logging.StreamHandler(),
 )
+for handler in LOG_LISTENER.handlers:
+    handler.setFormatter(LOG_FORMATTER)
+logging.basicConfig(level=logging.INFO, handlers=[RecordQueueHandler(LOG_QUEUE)])
+LOG_LISTENER.start()
+atexit.register(LOG_LISTENER.stop)  # Flush queued records before exit
 logger = logging.getLogger("atlas_reaper")
 
 
-def validate_atlas_credentials() -> None:
-    """Validate required Atlas environment variables."""
-    required_vars = ["ATLAS_PUBLIC_KEY", "ATLAS_PRIVATE_KEY", "ATLAS_ORG_ID"]
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+def create_retry() -> Retry:
+    """Retry policy for rate-limited and transient server errors.
+
+    Backoff is exponential, honours Retry-After, and is jittered where urllib3
+    supports it so concurrent workers do not retry in lockstep. Once retries
+    run out the final response is returned rather than raised as RetryError,
+    so a last 429 still reaches GOVERNOR.update.
+    """
+    options = dict(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "DELETE"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    try:
+        return Retry(backoff_jitter=0.2, **options)
+    except TypeError:  # urllib3 < 2.0 has no backoff_jitter
+        return Retry(**options)
+
+
+def create_session() -> requests.Session:
+    """Create the shared, pooled HTTP session for Atlas API calls.
+
+    GET responses are cached on disk (and revalidated via ETag) when
+    HTTP_CACHE_TTL is set and requests-cache is installed.
+    """
+    if requests_cache and HTTP_CACHE_TTL > 0:
+        session = requests_cache.CachedSession(
+            cache_name="logs/atlas_http_cache",
+            backend="sqlite",
+            expire_after=HTTP_CACHE_TTL,
+            allowable_methods=["GET"],
+            cache_control=True,
+        )
+    else:
+        session = requests.Session()
+        if HTTP_CACHE_TTL > 0:
+            logger.warning(
+                "HTTP_CACHE_TTL is set but requests-cache is not installed; "
+                "GET responses will not be cached"
+            )
+
+    session.headers.update(ATLAS_HEADERS)
+
+    # Size the pool so every concurrent worker keeps a warm connection
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=MAX_CONNECTIONS,
+            max_retries=create_retry(),
+        ),
+    )
+    return session
+
+
+SESSION = create_session()
+
+# Shared across all projects so the total number of in-flight DELETEs is capped
+DELETE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=MAX_DELETE_WORKERS, thread_name_prefix="atlas-delete"
+)
+# Long-lived workers for per-project listings, so no threads are spawned per project
+FETCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=MAX_FETCH_WORKERS, thread_name_prefix="atlas-fetch"
+)
+# Bounds the concurrent page fan-out across all listings, not per listing
+PAGE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=MAX_PAGE_WORKERS, thread_name_prefix="atlas-page"
+)
+# Set on Ctrl-C so workers still running stop sending DELETEs
+SHUTDOWN_EVENT = threading.Event()
+
+
+class RateLimitGovernor:
+    """Hold back every worker once Atlas reports the rate limit is exhausted."""
+
+    def __init__(self, default_pause: float = 1.0):
+        self.default_pause = default_pause
+        self.resume_at = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Sleep until any pause requested by the API has elapsed."""
+        delay = self.resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def update(self, response: requests.Response) -> None:
+        """Schedule a pause from the rate limit headers of a response."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        exhausted = isinstance(remaining, str) and remaining.strip() == "0"
+        if response.status_code != 429 and not exhausted:
+            return
+
+        retry_after = response.headers.get("Retry-After")
+        pause = (
+            float(retry_after)
+            if isinstance(retry_after, str) and retry_after.isdigit()
+            else self.default_pause
+        )
+        logger.warning(f"Atlas rate limit reached, pausing requests for {pause}s")
+        with self.lock:
+            self.resume_at = max(self.resume_at, time.monotonic() + pause)
+
+
+GOVERNOR = RateLimitGovernor()
+
+# Serializes access to the checkpoint connection shared by project workers
+CHECKPOINT_LOCK = threading.Lock()
+
+
+def use_service_account() -> bool:
+    """Check whether service account (OAuth) credentials are configured."""
+    return bool(os.getenv("ATLAS_CLIENT_ID") and os.getenv("ATLAS_CLIENT_SECRET"))
+
+
+def validate_atlas_credentials() -> Mapping[str, str]:
+    """Validate required Atlas environment variables and return their values.
+
+    Each variable is read once; the returned mapping is read-only so it can be
+    shared safely with the worker threads.
+    """
+    if use_service_account():
+        required_vars = ["ATLAS_CLIENT_ID", "ATLAS_CLIENT_SECRET", "ATLAS_ORG_ID"]
+    else:
+        required_vars = ["ATLAS_PUBLIC_KEY", "ATLAS_PRIVATE_KEY", "ATLAS_ORG_ID"]
+    credentials = {var: os.getenv(var) for var in required_vars}
+    missing_vars = [var for var, value in credentials.items() if not value]
 
     if missing_vars:
         raise ValueError(
@@ -52,6 +260,7 @@ def validate_atlas_credentials() -> None:
         )
 
     logger.info("Atlas API credentials validated")
+    return MappingProxyType(credentials)
 
 
 def get_env_variable(var_name: str) -> str:
@@ -62,19 +271,77 @@ def get_env_variable(var_name: str) -> str:
     return value
 
 
+def get_service_account_token(client_id: str, client_secret: str) -> Tuple[str, float]:
+    """Exchange service account credentials for an OAuth access token.
+
+    Returns the token and its lifetime in seconds.
+    """
+    response = SESSION.post(
+        ATLAS_OAUTH_TOKEN_URL,
+        auth=HTTPBasicAuth(client_id, client_secret),
+        data={"grant_type": "client_credentials"},
+        # Drop the session's JSON Content-Type so the form body is labelled
+        headers={"Accept": "application/json", "Content-Type": None},
+        timeout=REQUEST_TIMEOUT,
+    )
+    response.raise_for_status()
+    data = parse_json(response)
+    return data["access_token"], float(data.get("expires_in", 3600))
+
+
+class BearerAuth(AuthBase):
+    """Attach a service account bearer token, refreshing it shortly before expiry."""
+
+    def __init__(self, client_id: str, client_secret: str):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def token(self) -> str:
+        """Return a valid access token, fetching a new one when needed."""
+        with self._lock:
+            if self._token is None or self._expires_at - time.monotonic() < 60:
+                self._token, lifetime = get_service_account_token(
+                    self.client_id, self.client_secret
+                )
+                self._expires_at = time.monotonic() + lifetime
+            return self._token
+
+    def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
+        request.headers["Authorization"] = f"Bearer {self.token()}"
+        return request
+
+
+def create_atlas_auth(credentials: Mapping[str, str]) -> AuthBase:
+    """Create request auth, preferring a bearer token over API key Digest auth.
+
+    Digest auth needs a 401 challenge before the first request on each worker
+    thread; a service account token is sent up front on every request.
+    """
+    if "ATLAS_CLIENT_ID" in credentials:
+        logger.info("Authenticating with Atlas service account")
+        auth = BearerAuth(
+            credentials["ATLAS_CLIENT_ID"], credentials["ATLAS_CLIENT_SECRET"]
+        )
+        # Fetch the first token now so bad credentials fail before any work starts
+        auth.token()
+        return auth
+
+    return HTTPDigestAuth(
+        credentials["ATLAS_PUBLIC_KEY"], credentials["ATLAS_PRIVATE_KEY"]
+    )
+
+
 def make_atlas_api_request(
-    method: str, url: str, auth: HTTPDigestAuth, **kwargs
+    method: str, url: str, **kwargs
 ) -> Optional[requests.Response]:
     """Make Atlas API request with consistent error handling."""
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/vnd.atlas.2025-03-12+json",
-    }
-
+    GOVERNOR.wait()
     try:
-        response = requests.request(
-            method, url, auth=auth, headers=headers, timeout=30, **kwargs
-        )
+        response = SESSION.request(method, url, timeout=REQUEST_TIMEOUT, **kwargs)
+        GOVERNOR.update(response)
         response.raise_for_status()
         return response
     except requests.exceptions.RequestException as e:
@@ -82,90 +349,191 @@ def make_atlas_api_request(
         return None
 
 
-def get_all_paginated_items(
-    url: str, auth: HTTPDigestAuth, item_key: str = "results"
-) -> List[Dict[str, Any]]:
-    """Retrieve all items from paginated Atlas API endpoint."""
-    all_items = []
-    page = 1
+def parse_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when installed."""
+    if orjson:
+        return orjson.loads(response.content)
+    return response.json()
 
-    while page <= 100:  # Safety limit
-        response = make_atlas_api_request(
-            "GET", url, auth, params={"pageNum": page, "itemsPerPage": 500}
-        )
-        if not response:
-            break
 
+def iter_paginated_pages(
+    url: str, item_key: str = "results", page_size: int = ITEMS_PER_PAGE
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield each page of items from a paginated Atlas API endpoint as it arrives.
+
+    When the first page reports totalCount, the remaining pages are fetched
+    concurrently; otherwise the server's "next" link is followed page by page.
+    At most MAX_ITEMS_BUDGET items are yielded in total.
+    """
+
+    def fetch_page(page_url: str, params: Optional[Dict[str, int]] = None) -> Any:
+        response = make_atlas_api_request("GET", page_url, params=params)
+        if not response:
+            return None
         try:
-            data = response.json()
+            return parse_json(response)
         except ValueError:
-            break
+            return None
 
-        if not data:
-            break
+    item_count = 0
+    first_page = True
+    # Atlas defaults to the first page, so only later fan-out pages need pageNum
+    data = fetch_page(url, {"itemsPerPage": page_size})
 
+    while data:
         # Handle list response (non-paginated)
         if isinstance(data, list):
-            all_items.extend(data)
-            break
+            yield data[:MAX_ITEMS_BUDGET]
+            return
 
         # Handle dict response with results key (paginated)
-        if item_key in data and data[item_key]:
-            all_items.extend(data[item_key])
-        else:
-            break
+        if not data.get(item_key):
+            return
+        page = data[item_key][: MAX_ITEMS_BUDGET - item_count]
+        item_count += len(page)
+        yield page
 
         # Check for next page
-        if not any(link.get("rel") == "next" for link in data.get("links", [])):
-            break
-        page += 1
+        next_url = next(
+            (
+                link.get("href")
+                for link in data.get("links", [])
+                if link.get("rel") == "next"
+            ),
+            None,
+        )
+        if not next_url:
+            return
+
+        if item_count >= MAX_ITEMS_BUDGET:
+            logger.warning(
+                f"Stopped paging {url} at the {MAX_ITEMS_BUDGET} item budget; "
+                f"results are truncated"
+            )
+            return
+
+        # The page count is known up front, so request the rest in parallel
+        total_count = data.get("totalCount")
+        if first_page and isinstance(total_count, int) and total_count > item_count:
+            if total_count > MAX_ITEMS_BUDGET:
+                logger.warning(
+                    f"{url} reports {total_count} items; only the first "
+                    f"{MAX_ITEMS_BUDGET} will be fetched"
+                )
+            wanted = min(total_count, MAX_ITEMS_BUDGET)
+            num_pages = math.ceil(wanted / item_count)
+            page_params = [
+                {"pageNum": page_num, "itemsPerPage": page_size}
+                for page_num in range(2, num_pages + 1)
+            ]
+            # map() hands pages back in order as soon as each one is ready
+            for page_data in PAGE_EXECUTOR.map(
+                lambda params: fetch_page(url, params), page_params
+            ):
+                if isinstance(page_data, dict) and page_data.get(item_key):
+                    page = page_data[item_key][: MAX_ITEMS_BUDGET - item_count]
+                    item_count += len(page)
+                    yield page
+            return
+
+        first_page = False
+        # The next link already carries the paging query string
+        data = fetch_page(next_url)
+
 
+def get_all_paginated_items(
+    url: str, item_key: str = "results", page_size: int = ITEMS_PER_PAGE
+) -> List[Dict[str, Any]]:
+    """Retrieve all items from paginated Atlas API endpoint."""
+    pages = list(iter_paginated_pages(url, item_key, page_size))
+
+    # Size the result once from the collected pages instead of growing it
+    all_items: List[Any] = [None] * sum(len(page) for page in pages)
+    offset = 0
+    for page in pages:
+        all_items[offset : offset + len(page)] = page
+        offset += len(page)
     return all_items
 
 
-def get_atlas_projects(org_id: str, auth: HTTPDigestAuth) -> List[Dict[str, Any]]:
+def get_atlas_projects(org_id: str) -> List[Dict[str, Any]]:
     """Get all projects for organization."""
     url = f"{ATLAS_API_BASE_URL}/groups"
-    projects = get_all_paginated_items(url, auth)
+    projects = get_all_paginated_items(url)
     logger.info(f"Found {len(projects)} projects")
     return projects
 
 
-def get_atlas_database_users(
-    project_id: str, auth: HTTPDigestAuth
-) -> List[Dict[str, Any]]:
+def get_atlas_database_users(project_id: str) -> List[Dict[str, Any]]:
     """Get all database users for project."""
     url = f"{ATLAS_API_BASE_URL}/groups/{project_id}/databaseUsers"
-    return get_all_paginated_items(url, auth)
+    return get_all_paginated_items(url, page_size=SMALL_ITEMS_PER_PAGE)
+
+
+def submit_database_user_deletions(project_id: str) -> List[Future]:
+    """Queue deletions of a project's database users.
+
+    The whole listing is fetched first: deleting while later pages are still
+    being read shifts the page offsets and silently skips users.
+    """
+    users = get_atlas_database_users(project_id)
+    return [
+        DELETE_EXECUTOR.submit(
+            delete_atlas_resource,
+            "database_user",
+            project_id,
+            user["username"],
+            user.get("databaseName", "admin"),
+        )
+        for user in users
+        if user.get("username") and user["username"] not in PROTECTED_USERNAMES
+    ]
 
 
-def get_atlas_project_users(
-    project_id: str, auth: HTTPDigestAuth
-) -> List[Dict[str, Any]]:
+def get_atlas_project_users(project_id: str) -> List[Dict[str, Any]]:
     """Get all Atlas users for project."""
     url = f"{ATLAS_API_BASE_URL}/groups/{project_id}/users"
-    return get_all_paginated_items(url, auth)
+    return get_all_paginated_items(url, page_size=SMALL_ITEMS_PER_PAGE)
 
 
-def get_atlas_clusters(project_id: str, auth: HTTPDigestAuth) -> List[Dict[str, Any]]:
+def get_atlas_org_users(org_id: str) -> List[Dict[str, Any]]:
+    """Get all Atlas users in the organization, including their project roles."""
+    url = f"{ATLAS_API_BASE_URL}/orgs/{org_id}/users"
+    return get_all_paginated_items(url)
+
+
+def map_users_to_projects(
+    org_users: List[Dict[str, Any]],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Group organization users by the IDs of the projects they have roles in."""
+    project_users: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for user in org_users:
+        roles = user.get("roles") or []
+        # Newer API versions nest project roles under groupRoleAssignments
+        if isinstance(roles, dict):
+            roles = roles.get("groupRoleAssignments") or []
+        # A user holds one entry per role, so count each project only once
+        for group_id in {role.get("groupId") for role in roles} - {None}:
+            project_users[group_id].append(user)
+    return dict(project_users)
+
+
+def get_atlas_clusters(project_id: str) -> List[Dict[str, Any]]:
     """Get all clusters for project."""
     url = f"{ATLAS_API_BASE_URL}/groups/{project_id}/clusters"
-    return get_all_paginated_items(url, auth)
+    return get_all_paginated_items(url, page_size=SMALL_ITEMS_PER_PAGE)
 
 
-def get_atlas_group_invitations(
-    project_id: str, auth: HTTPDigestAuth
-) -> List[Dict[str, Any]]:
+def get_atlas_group_invitations(project_id: str) -> List[Dict[str, Any]]:
     """Get all group (project) invitations."""
     url = f"{ATLAS_API_BASE_URL}/groups/{project_id}/invites"
-    return get_all_paginated_items(url, auth)
+    return get_all_paginated_items(url)
 
 
 def delete_atlas_resource(
     resource_type: str,
     project_id: str,
     resource_id: str,
-    auth: HTTPDigestAuth,
     db_name: str = "admin",
 ) -> bool:
     """Generic function to delete Atlas resources."""
@@ -173,6 +541,7 @@ def delete_atlas_resource(
         "database_user": f"{ATLAS_API_BASE_URL}/groups/{project_id}/databaseUsers/{db_name}/{resource_id}",
         "project_user": f"{ATLAS_API_BASE_URL}/groups/{project_id}/users/{resource_id}",
         "cluster": f"{ATLAS_API_BASE_URL}/groups/{project_id}/clusters/{resource_id}",
+        "group_invitation": f"{ATLAS_API_BASE_URL}/groups/{project_id}/invites/{resource_id}",
     }
 
     url = endpoints.get(resource_type)
@@ -180,7 +549,11 @@ def delete_atlas_resource(
         logger.error(f"Unknown resource type: {resource_type}")
         return False
 
-    response = make_atlas_api_request("DELETE", url, auth)
+    if SHUTDOWN_EVENT.is_set():
+        logger.warning(f"  Skipped {resource_type} {resource_id}: run interrupted")
+        return False
+
+    response = make_atlas_api_request("DELETE", url)
     success = response and response.status_code in [200, 202, 204]
 
     if success:
@@ -191,41 +564,40 @@ def delete_atlas_resource(
     return success
 
 
-def delete_atlas_group_invitation(
-    project_id: str, invitation_id: str, auth: HTTPDigestAuth
-) -> bool:
-    """Delete group (project) invitation."""
-    url = f"{ATLAS_API_BASE_URL}/groups/{project_id}/invites/{invitation_id}"
-    response = make_atlas_api_request("DELETE", url, auth)
-
-    if response and response.status_code in [200, 202, 204]:
-        logger.info(f"  Deleted group invitation: {invitation_id}")
-        return True
-
-    logger.error(f"  Failed to delete group invitation: {invitation_id}")
-    return False
+def wait_for_deletions(futures: List[Future]) -> Tuple[int, int]:
+    """Wait for submitted deletions and return (successful, failed) counts."""
+    successful = failed = 0
+    for future in futures:
+        try:
+            deleted = future.result()
+        except Exception as e:
+            logger.error(f"  Deletion raised an unexpected error: {str(e)}")
+            deleted = False
+        if deleted:
+            successful += 1
+        else:
+            failed += 1
+    return successful, failed
 
 
-def delete_all_group_invitations(
-    project_id: str, project_name: str, auth: HTTPDigestAuth
-) -> Tuple[int, int]:
+def delete_all_group_invitations(project_id: str, project_name: str) -> Tuple[int, int]:
     """Delete all group (project) invitations."""
-    invitations = get_atlas_group_invitations(project_id, auth)
+    invitations = get_atlas_group_invitations(project_id)
 
     if not invitations:
         return 0, 0
 
     logger.info(f"Found {len(invitations)} group invitations for {project_name}")
 
-    successful = failed = 0
-    for invitation in invitations:
-        invitation_id = invitation.get("id")
-        if invitation_id and delete_atlas_group_invitation(
-            project_id, invitation_id, auth
-        ):
-            successful += 1
-        else:
-            failed += 1
+    futures = [
+        DELETE_EXECUTOR.submit(
+            delete_atlas_resource, "group_invitation", project_id, invitation["id"]
+        )
+        for invitation in invitations
+        if invitation.get("id")
+    ]
+    successful, failed = wait_for_deletions(futures)
+    failed += len(invitations) - len(futures)  # Invitations without an ID
 
     logger.info(
         f"Group invitation cleanup for {project_name}: {successful} successful, {failed} failed"
@@ -255,42 +627,193 @@ def show_warning_and_confirm(org_id: str, no_confirm: bool = False) -> bool:
 
 
 def cleanup_project_resources(
-    project_id: str, project_name: str, auth: HTTPDigestAuth
-) -> None:
-    """Clean up all resources in a project."""
-    # Delete all group invitations first
-    delete_all_group_invitations(project_id, project_name, auth)
-
-    # Delete database users
-    db_users = get_atlas_database_users(project_id, auth)
-    for user in db_users:
-        username = user.get("username")
-        if username and username not in ["__onprem_monitoring", "admin"]:
-            delete_atlas_resource(
-                "database_user",
-                project_id,
-                username,
-                auth,
-                user.get("databaseName", "admin"),
-            )
+    project_id: str,
+    project_name: str,
+    atlas_users: Optional[List[Dict[str, Any]]] = None,
+) -> Tuple[int, int]:
+    """Clean up all resources in a project.
+
+    Atlas users already known from the organization listing can be passed in;
+    otherwise they are fetched for the project.
+
+    Returns (successful, failed) deletion counts, including invitations.
+    """
+    # The listings are independent, so fetch the user lists while the group
+    # invitations are fetched and deleted; database users are queued for
+    # deletion as soon as their listing is complete
+    db_deletions_future = FETCH_EXECUTOR.submit(
+        submit_database_user_deletions, project_id
+    )
+    atlas_users_future = None
+    if atlas_users is None:
+        atlas_users_future = FETCH_EXECUTOR.submit(get_atlas_project_users, project_id)
+
+    invites_deleted, invites_failed = delete_all_group_invitations(
+        project_id, project_name
+    )
+    if atlas_users_future:
+        atlas_users = atlas_users_future.result()
+
+    # Remove Atlas users alongside the database user deletions already queued
+    futures = db_deletions_future.result()
+    futures += [
+        DELETE_EXECUTOR.submit(
+            delete_atlas_resource, "project_user", project_id, user["id"]
+        )
+        for user in atlas_users
+        if user.get("id")
+    ]
+    successful, failed = wait_for_deletions(futures)
+    logger.info(
+        f"User cleanup for {project_name}: {successful} successful, {failed} failed"
+    )
+    return successful + invites_deleted, failed + invites_failed
+
 
-    # Remove Atlas users
-    atlas_users = get_atlas_project_users(project_id, auth)
-    for user in atlas_users:
-        user_id = user.get("id")
-        if user_id:
-            delete_atlas_resource("project_user", project_id, user_id, auth)
+def cleanup_project_clusters(project_id: str, project_name: str) -> Tuple[int, int]:
+    """Delete all clusters in a project.
 
+    Returns (successful, failed) deletion counts.
+    """
+    clusters = get_atlas_clusters(project_id)
+    futures = [
+        DELETE_EXECUTOR.submit(
+            delete_atlas_resource, "cluster", project_id, cluster["name"]
+        )
+        for cluster in clusters
+        if cluster.get("name")
+    ]
+    successful, failed = wait_for_deletions(futures)
+    if futures:
+        logger.info(
+            f"Cluster cleanup for {project_name}: {successful} successful, {failed} failed"
+        )
+    return successful, failed
 
-def cleanup_project_clusters(
-    project_id: str, project_name: str, auth: HTTPDigestAuth
-) -> None:
-    """Delete all clusters in a project."""
-    clusters = get_atlas_clusters(project_id, auth)
-    for cluster in clusters:
-        cluster_name = cluster.get("name")
-        if cluster_name:
-            delete_atlas_resource("cluster", project_id, cluster_name, auth)
+
+def parse_atlas_timestamp(value: str) -> datetime:
+    """Parse an Atlas ISO-8601 timestamp, using ciso8601 when installed."""
+    if ciso8601:
+        return ciso8601.parse_datetime(value)
+    if sys.version_info >= (3, 11):  # fromisoformat accepts a trailing "Z"
+        return datetime.fromisoformat(value)
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def open_checkpoint(path: str = CHECKPOINT_DB) -> sqlite3.Connection:
+    """Open the checkpoint database of projects already cleaned up."""
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS done "
+        "(project_id TEXT PRIMARY KEY, phase TEXT, ts TEXT)"
+    )
+    conn.commit()
+    return conn
+
+
+def get_checkpoint(conn: sqlite3.Connection, project_id: str) -> Optional[str]:
+    """Return the last phase completed for a project, if any."""
+    with CHECKPOINT_LOCK:
+        row = conn.execute(
+            "SELECT phase FROM done WHERE project_id = ?", (project_id,)
+        ).fetchone()
+    return row[0] if row else None
+
+
+def save_checkpoint(conn: sqlite3.Connection, project_id: str, phase: str) -> None:
+    """Record that a project finished the given cleanup phase."""
+    with CHECKPOINT_LOCK:
+        conn.execute(
+            "INSERT OR REPLACE INTO done (project_id, phase, ts) VALUES (?, ?, ?)",
+            (project_id, phase, datetime.now(timezone.utc).isoformat()),
+        )
+        conn.commit()
+
+
+def process_project(
+    project: Dict[str, Any],
+    user_cutoff: str,
+    cluster_cutoff: str,
+    checkpoint: Optional[sqlite3.Connection] = None,
+    project_users: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+) -> Tuple[int, int, int]:
+    """Clean up a single project based on its age.
+
+    Cutoffs are UTC ISO-8601 strings, which sort chronologically, so
+    created timestamps are compared without parsing them. When a checkpoint
+    is given, phases already recorded for the project are skipped. When
+    project_users (from map_users_to_projects) is given, the project's Atlas
+    users are taken from it instead of being fetched per project.
+
+    Returns (processed, cleaned, errors) counters for the project.
+    """
+    project_id = project.get("id")
+    project_name = project.get("name", "Unknown")
+    created_str = project.get("created")
+
+    if not (project_id and project_name and created_str):
+        logger.warning(f"Skipping project with missing data: {project}")
+        return 0, 0, 1
+
+    if created_str >= user_cutoff:
+        logger.info(f"Skipping {project_name} (not old enough)")
+        return 1, 0, 0
+
+    try:
+        created_date = parse_atlas_timestamp(created_str)
+    except ValueError:
+        logger.error(f"Invalid date format for project {project_name}: {created_str}")
+        return 0, 0, 1
+
+    phase = get_checkpoint(checkpoint, project_id) if checkpoint else None
+    if phase == "complete":
+        logger.info(f"Skipping {project_name} (already cleaned up in this run)")
+        return 1, 1, 0
+
+    age_days = (CURRENT_DATE_UTC - created_date).days
+    failed = 0
+    if phase == "resources":
+        logger.info(f"Resuming {project_name} after its users and invitations")
+    else:
+        logger.info(
+            f"Cleaning up project {project_name} (age: {age_days} days, "
+            f"older than {USER_DELETION_THRESHOLD} days)"
+        )
+        atlas_users = (
+            project_users.get(project_id, []) if project_users is not None else None
+        )
+        _, failed = cleanup_project_resources(project_id, project_name, atlas_users)
+        # Only checkpoint a phase with no failed deletions, so --resume retries it
+        if checkpoint and not failed:
+            save_checkpoint(checkpoint, project_id, "resources")
+
+    # The project listing already reports clusterCount, so skip the GET
+    if created_str < cluster_cutoff and project.get("clusterCount") == 0:
+        logger.info(f"No clusters to delete in {project_name}")
+    elif created_str < cluster_cutoff:
+        logger.info(
+            f"Deleting clusters in {project_name} (older than {CLUSTER_DELETION_THRESHOLD} days)"
+        )
+        _, clusters_failed = cleanup_project_clusters(project_id, project_name)
+        failed += clusters_failed
+
+    if failed:
+        logger.error(f"{failed} deletions failed in {project_name}")
+        return 1, 1, 1
+
+    if checkpoint:
+        save_checkpoint(checkpoint, project_id, "complete")
+    return 1, 1, 0
+
+
+def cancel_pending_work(executor: ThreadPoolExecutor) -> None:
+    """Stop queued projects and deletions after an interrupt.
+
+    Requests already in flight finish; nothing new is sent.
+    """
+    SHUTDOWN_EVENT.set()
+    executor.shutdown(wait=False, cancel_futures=True)
+    DELETE_EXECUTOR.shutdown(wait=False, cancel_futures=True)
 
 
 def main():
@@ -303,21 +826,26 @@ def main():
         action="store_true",
         help="Skip confirmation prompt and proceed with cleanup",
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip projects already cleaned up by an interrupted previous run",
+    )
     args = parser.parse_args()
+    checkpoint = None
 
     try:
         logger.info("Starting MongoDB Atlas Reaper Script")
-        validate_atlas_credentials()
+        credentials = validate_atlas_credentials()
 
-        org_id = get_env_variable("ATLAS_ORG_ID")
+        org_id = credentials["ATLAS_ORG_ID"]
         if not show_warning_and_confirm(org_id, no_confirm=args.no_confirm):
             print("Operation cancelled.")
             return 0
 
-        auth = HTTPDigestAuth(
-            get_env_variable("ATLAS_PUBLIC_KEY"), get_env_variable("ATLAS_PRIVATE_KEY")
-        )
-        projects = get_atlas_projects(org_id, auth)
+        # Attach auth to the shared session once instead of passing it around
+        SESSION.auth = create_atlas_auth(credentials)
+        projects = get_atlas_projects(org_id)
 
         if not projects:
             logger.warning("No projects found")
@@ -332,49 +860,62 @@ def main():
         logger.info(
             f"Cluster deletion threshold: {cluster_threshold.strftime('%Y-%m-%d')}"
         )
-
-        total_processed = total_cleaned = total_errors = 0
-
-        for project in projects:
-            project_id = project.get("id")
-            project_name = project.get("name", "Unknown")
-            created_str = project.get("created")
-
-            if not all([project_id, project_name, created_str]):
-                logger.warning(f"Skipping project with missing data: {project}")
-                total_errors += 1
-                continue
-
-            try:
-                created_date = datetime.fromisoformat(
-                    created_str.replace("Z", "+00:00")
+        user_cutoff = user_threshold.strftime(ISO_UTC_FORMAT)
+        cluster_cutoff = cluster_threshold.strftime(ISO_UTC_FORMAT)
+
+        # Projects newer than the user cutoff need no API calls at all
+        aged_projects = [
+            project
+            for project in projects
+            if not project.get("created") or project["created"] < user_cutoff
+        ]
+        total_processed = len(projects) - len(aged_projects)
+        total_cleaned = total_errors = 0
+        logger.info(f"Skipping {total_processed} projects (not old enough)")
+
+        if aged_projects:
+            checkpoint = open_checkpoint(CHECKPOINT_DB)
+            if not args.resume:
+                # A fresh run starts from an empty checkpoint
+                checkpoint.execute("DELETE FROM done")
+                checkpoint.commit()
+
+            # One org-wide listing replaces a /users GET per aged project
+            project_users = map_users_to_projects(get_atlas_org_users(org_id))
+            if not project_users:
+                logger.warning(
+                    "No project roles found in the organization user listing; "
+                    "fetching Atlas users per project"
                 )
-            except ValueError:
-                logger.error(
-                    f"Invalid date format for project {project_name}: {created_str}"
-                )
-                total_errors += 1
-                continue
-
-            total_processed += 1
-            age_days = (CURRENT_DATE_UTC - created_date).days
-            logger.info(f"Processing {project_name} (age: {age_days} days)")
-
-            if created_date < user_threshold:
-                logger.info(
-                    f"Cleaning up project {project_name} (older than {USER_DELETION_THRESHOLD} days)"
-                )
-                total_cleaned += 1
-
-                cleanup_project_resources(project_id, project_name, auth)
-
-                if created_date < cluster_threshold:
-                    logger.info(
-                        f"Deleting clusters in {project_name} (older than {CLUSTER_DELETION_THRESHOLD} days)"
+                project_users = None
+
+            with ThreadPoolExecutor(max_workers=MAX_PROJECT_WORKERS) as executor:
+                futures = [
+                    executor.submit(
+                        process_project,
+                        project,
+                        user_cutoff,
+                        cluster_cutoff,
+                        checkpoint,
+                        project_users,
                     )
-                    cleanup_project_clusters(project_id, project_name, auth)
-            else:
-                logger.info(f"Skipping {project_name} (not old enough)")
+                    for project in aged_projects
+                ]
+                try:
+                    for future in as_completed(futures):
+                        try:
+                            processed, cleaned, errors = future.result()
+                        except Exception as e:
+                            # One failing project should not abort the rest of the run
+                            logger.error(f"Project cleanup failed: {str(e)}")
+                            processed, cleaned, errors = 0, 0, 1
+                        total_processed += processed
+                        total_cleaned += cleaned
+                        total_errors += errors
+                except BaseException:
+                    # Otherwise leaving the with block waits for every queued project
+                    cancel_pending_work(executor)
+                    raise
 
         logger.info(
             f"Completed: {total_processed} processed, {total_cleaned} cleaned, {total_errors} errors"
@@ -387,6 +928,10 @@ def main():
     except Exception as e:
         logger.error(f"Unexpected error: {str(e)}")
         return 1
+    finally:
+        SESSION.close()
+        if checkpoint:
+            checkpoint.close()
 
 
 if __name__ == "__main__":
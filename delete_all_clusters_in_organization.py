@@ -14,6 +14,7 @@ Environment Variables:
     ATLAS_PRIVATE_KEY: MongoDB Atlas API Private Key
     ATLAS_ORG_ID: Atlas Organization ID
     ATLAS_API_BASE_URL: (Optional) Atlas API Base URL
+    MAX_DELETE_WORKERS: (Optional) Number of clusters deleted concurrently
 
 Usage:
     python delete_all_clusters_in_organization.py
@@ -25,11 +26,22 @@ Safety Warning:
 
 import logging
 import os
-from typing import Optional
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Deque, Dict, Iterator, List, Optional
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPDigestAuth
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON decoding for large pages
+    orjson = None
 
 # Load environment variables
 load_dotenv()
@@ -41,6 +53,14 @@ ATLAS_API_BASE_URL = os.getenv(
 PUBLIC_KEY = os.getenv("ATLAS_PUBLIC_KEY")
 PRIVATE_KEY = os.getenv("ATLAS_PRIVATE_KEY")
 ORGANIZATION_ID = os.getenv("ATLAS_ORG_ID")
+# Cluster deletions are independent, so they are issued from a bounded pool
+MAX_DELETE_WORKERS = int(os.getenv("MAX_DELETE_WORKERS", "5"))
+ATLAS_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/vnd.atlas.2025-02-19+json",
+}
+# Atlas allows 100 requests per minute per project; stay just under it
+PROJECT_REQUESTS_PER_MINUTE = 95
 
 # Configure logging
 logging.basicConfig(
@@ -54,6 +74,64 @@ logging.basicConfig(
 logger = logging.getLogger("delete_all_clusters")
 
 
+def create_session() -> requests.Session:
+    """
+    Create a shared HTTP session so Atlas calls reuse pooled keep-alive connections.
+
+    Returns:
+        Session with a connection pool sized for the deletion workers
+    """
+    session = requests.Session()
+    session.headers.update(ATLAS_HEADERS)
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            # One connection per deletion worker plus the listing thread
+            pool_maxsize=MAX_DELETE_WORKERS + 1,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "DELETE"],
+                respect_retry_after_header=True,
+            ),
+        ),
+    )
+    return session
+
+
+SESSION = create_session()
+
+
+class ProjectRateLimiter:
+    """Sliding-window limit on the number of requests sent to each project."""
+
+    def __init__(self, max_calls: int, period: float = 60.0):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls: Dict[str, Deque[float]] = defaultdict(deque)
+        self._lock = threading.Lock()
+
+    def acquire(self, project_id: str) -> None:
+        """Block until another request to the project fits in the window."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                calls = self._calls[project_id]
+                while calls and now - calls[0] >= self.period:
+                    calls.popleft()
+                if len(calls) < self.max_calls:
+                    calls.append(now)
+                    return
+                wait = self.period - (now - calls[0])
+            time.sleep(wait)
+
+
+PROJECT_LIMITER = ProjectRateLimiter(PROJECT_REQUESTS_PER_MINUTE)
+# Set on Ctrl-C so deletion workers still running stop sending DELETEs
+SHUTDOWN_EVENT = threading.Event()
+
+
 # Validate required credentials
 def validate_atlas_credentials():
     """Validate that all required Atlas environment variables are set."""
@@ -68,7 +146,7 @@ def validate_atlas_credentials():
 
     if missing_vars:
         logger.error(
-            f"Missing required environment variables: {', '.join(missing_vars)}"
+            "Missing required environment variables: %s", ", ".join(missing_vars)
         )
         logger.error("Please ensure all required variables are set in your .env file")
         raise ValueError(
@@ -93,156 +171,248 @@ def make_atlas_api_request(
         Response object if successful, None if failed
     """
     try:
-        response = requests.request(method, url, timeout=30, **kwargs)
+        response = SESSION.request(method, url, timeout=30, **kwargs)
         response.raise_for_status()
         return response
     except requests.exceptions.RequestException as e:
-        logger.error(f"API request failed: {method} {url} - {str(e)}")
+        logger.error("API request failed: %s %s - %s", method, url, e)
         return None
 
 
-def get_all_paginated_projects(org_id: str, auth, headers: dict) -> list:
+def parse_json(response: requests.Response):
     """
-    Retrieve all projects from a paginated Atlas API endpoint.
+    Decode a JSON response body, using orjson when it is installed.
 
     Args:
-        org_id: The organization ID
-        auth: HTTPDigestAuth object for authentication
-        headers: Request headers
+        response: Response returned by make_atlas_api_request
 
     Returns:
-        List of all projects across all pages
+        Decoded body, or an empty dict when the body is empty
+    """
+    if not response.content:
+        return {}
+    if orjson:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def iter_projects(
+    org_id: str, auth=None, headers: Optional[dict] = None
+) -> Iterator[dict]:
+    """
+    Yield projects from the paginated Atlas API endpoint one page at a time.
+
+    Args:
+        org_id: The organization ID
+        auth: HTTPDigestAuth object for authentication (defaults to the session's)
+        headers: Request headers (defaults to the session's)
+
+    Yields:
+        Each project as soon as the page containing it has been fetched
     """
-    all_projects = []
     projects_url = f"{ATLAS_API_BASE_URL}/orgs/{org_id}/groups"
+    page_url = projects_url
     params = {"itemsPerPage": 500}  # Max items per page
     current_page = 1
     max_pages = 100  # Safety limit
 
     while True:
-        params["pageNum"] = current_page
         response = make_atlas_api_request(
-            "GET", projects_url, headers=headers, auth=auth, params=params
+            "GET", page_url, headers=headers, auth=auth, params=params
         )
 
         # Check if API request failed
         if not response:
-            logger.error(f"API request failed for {projects_url} (page {current_page})")
-            break
+            logger.error(
+                "API request failed for %s (page %s)", projects_url, current_page
+            )
+            return
 
-        data = response.json()
+        data = parse_json(response)
         projects = data.get("results", [])
 
         if not projects:
-            break
-
-        all_projects.extend(projects)
-        logger.info(f"Retrieved {len(projects)} projects from page {current_page}")
-
-        # Check if there are more pages (Atlas uses a "links" array with "next" relation)
-        if not any(link.get("rel") == "next" for link in data.get("links", [])):
-            break
+            return
+
+        logger.info("Retrieved %s projects from page %s", len(projects), current_page)
+        yield from projects
+
+        # Follow the server's "next" link (Atlas uses a "links" array with "next" relation)
+        next_url = next(
+            (
+                link.get("href")
+                for link in data.get("links", [])
+                if link.get("rel") == "next"
+            ),
+            None,
+        )
+        if not next_url:
+            return
 
         current_page += 1
         if current_page > max_pages:  # Safety break
             logger.warning(
-                f"Reached max_pages ({max_pages}) limit for {projects_url}. "
-                f"Not all projects might be fetched."
+                "Reached max_pages (%s) limit for %s. Not all projects might be fetched.",
+                max_pages,
+                projects_url,
             )
-            break
+            return
 
-    logger.info(f"Total projects retrieved: {len(all_projects)}")
-    return all_projects
+        # The next link already carries the paging query string
+        page_url = next_url
+        params = None
 
 
-def delete_all_clusters_in_org(org_id: str) -> bool:
+def get_all_paginated_projects(
+    org_id: str, auth=None, headers: Optional[dict] = None
+) -> list:
     """
-    Delete all clusters within Atlas projects in an organization.
+    Retrieve all projects from a paginated Atlas API endpoint.
 
     Args:
-        org_id: The ID of the Atlas organization
+        org_id: The organization ID
+        auth: HTTPDigestAuth object for authentication (defaults to the session's)
+        headers: Request headers (defaults to the session's)
 
     Returns:
-        True if operation completed successfully, False otherwise
+        List of all projects across all pages
     """
-    if not org_id:
-        logger.error("Organization ID is required but not provided")
-        return False
-
-    logger.info(f"Starting cluster deletion for organization: {org_id}")
+    all_projects = list(iter_projects(org_id, auth, headers))
+    logger.info("Total projects retrieved: %s", len(all_projects))
+    return all_projects
 
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/vnd.atlas.2025-02-19+json",
-    }
-    auth = HTTPDigestAuth(PUBLIC_KEY, PRIVATE_KEY)
 
-    # Get all projects in the organization (with pagination support)
-    projects = get_all_paginated_projects(org_id, auth, headers)
+def delete_cluster(project_id: str, project_name: str, cluster_name: str) -> bool:
+    """
+    Delete a single cluster.
 
-    if not projects:
-        logger.error("Failed to fetch projects from organization or no projects found")
-        return False
+    Args:
+        project_id: The ID of the project containing the cluster
+        project_name: The project name, used for logging
+        cluster_name: The name of the cluster to delete
 
-    logger.info(f"Found {len(projects)} projects in organization")
+    Returns:
+        True if the deletion was accepted, False otherwise
+    """
+    logger.info("Deleting cluster: %s in project %s", cluster_name, project_name)
 
-    total_clusters_deleted = 0
-    total_failures = 0
+    delete_url = f"{ATLAS_API_BASE_URL}/groups/{project_id}/clusters/{cluster_name}"
+    PROJECT_LIMITER.acquire(project_id)
+    if SHUTDOWN_EVENT.is_set():
+        logger.warning("Skipped cluster %s: operation interrupted", cluster_name)
+        return False
 
-    for project in projects:
-        project_id = project.get("id")
-        project_name = project.get("name", "Unknown")
+    delete_response = make_atlas_api_request("DELETE", delete_url)
 
-        if not project_id:
-            logger.warning(f"Skipping project with missing ID: {project_name}")
-            continue
+    if delete_response and delete_response.status_code == 202:
+        logger.info("Successfully initiated deletion for cluster: %s", cluster_name)
+        return True
 
-        logger.info(f"Processing project: {project_name} (ID: {project_id})")
+    logger.error("Failed to delete cluster: %s", cluster_name)
+    return False
 
-        # Get all clusters in the project
-        clusters_url = f"{ATLAS_API_BASE_URL}/groups/{project_id}/clusters"
-        clusters_response = make_atlas_api_request(
-            "GET", clusters_url, headers=headers, auth=auth
-        )
 
-        if not clusters_response:
-            logger.error(f"Failed to fetch clusters for project {project_name}")
-            total_failures += 1
-            continue
+def delete_all_clusters_in_org(org_id: str) -> bool:
+    """
+    Delete all clusters within Atlas projects in an organization.
 
-        clusters = clusters_response.json().get("results", [])
-        logger.info(f"Found {len(clusters)} clusters in project {project_name}")
+    Args:
+        org_id: The ID of the Atlas organization
 
-        for cluster in clusters:
-            cluster_name = cluster.get("name")
+    Returns:
+        True if operation completed successfully, False otherwise
+    """
+    if not org_id:
+        logger.error("Organization ID is required but not provided")
+        return False
 
-            if not cluster_name:
-                logger.warning(
-                    f"Skipping cluster with missing name in project {project_name}"
-                )
-                continue
+    logger.info("Starting cluster deletion for organization: %s", org_id)
 
-            logger.info(f"Deleting cluster: {cluster_name} in project {project_name}")
+    # Attach auth once so every worker reuses it along with the session headers
+    SESSION.auth = HTTPDigestAuth(PUBLIC_KEY, PRIVATE_KEY)
 
-            # Delete the cluster
-            delete_url = (
-                f"{ATLAS_API_BASE_URL}/groups/{project_id}/clusters/{cluster_name}"
-            )
-            delete_response = make_atlas_api_request(
-                "DELETE", delete_url, headers=headers, auth=auth
-            )
+    total_projects = 0
+    total_clusters_deleted = 0
+    total_failures = 0
+    futures: List[Future] = []
+
+    # Projects are streamed page by page and deletions start as soon as each
+    # project's clusters are listed, so listing overlaps with deleting
+    with ThreadPoolExecutor(max_workers=MAX_DELETE_WORKERS) as executor:
+        try:
+            for project in iter_projects(org_id):
+                total_projects += 1
+                project_id = project.get("id")
+                project_name = project.get("name", "Unknown")
+
+                if not project_id:
+                    logger.warning("Skipping project with missing ID: %s", project_name)
+                    continue
+
+                logger.info("Processing project: %s (ID: %s)", project_name, project_id)
+
+                # Get all clusters in the project
+                clusters_url = f"{ATLAS_API_BASE_URL}/groups/{project_id}/clusters"
+                PROJECT_LIMITER.acquire(project_id)
+                clusters_response = make_atlas_api_request("GET", clusters_url)
+
+                if not clusters_response:
+                    logger.error(
+                        "Failed to fetch clusters for project %s", project_name
+                    )
+                    total_failures += 1
+                    continue
+
+                try:
+                    clusters = parse_json(clusters_response).get("results", [])
+                except ValueError as e:
+                    logger.error(
+                        "Invalid cluster list for project %s: %s", project_name, e
+                    )
+                    total_failures += 1
+                    continue
 
-            if delete_response and delete_response.status_code == 202:
                 logger.info(
-                    f"Successfully initiated deletion for cluster: {cluster_name}"
+                    "Found %s clusters in project %s", len(clusters), project_name
                 )
-                total_clusters_deleted += 1
-            else:
-                logger.error(f"Failed to delete cluster: {cluster_name}")
-                total_failures += 1
+
+                for cluster in clusters:
+                    cluster_name = cluster.get("name")
+
+                    if not cluster_name:
+                        logger.warning(
+                            "Skipping cluster with missing name in project %s",
+                            project_name,
+                        )
+                        continue
+
+                    futures.append(
+                        executor.submit(
+                            delete_cluster, project_id, project_name, cluster_name
+                        )
+                    )
+
+            for future in as_completed(futures):
+                if future.result():
+                    total_clusters_deleted += 1
+                else:
+                    total_failures += 1
+        except BaseException:
+            # Otherwise leaving the with block runs every queued deletion first
+            SHUTDOWN_EVENT.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    if not total_projects:
+        logger.error("Failed to fetch projects from organization or no projects found")
+        return False
+
+    logger.info("Found %s projects in organization", total_projects)
 
     logger.info(
-        f"Operation completed. Clusters deleted: {total_clusters_deleted}, Failures: {total_failures}"
+        "Operation completed. Clusters deleted: %s, Failures: %s",
+        total_clusters_deleted,
+        total_failures,
     )
     return total_failures == 0
 
@@ -279,7 +449,7 @@ def main():
         print("\nOperation interrupted.")
         return 1
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", e)
         print(f"Unexpected error: {str(e)}")
         return 1
 
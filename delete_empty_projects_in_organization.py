@@ -14,6 +14,7 @@ Environment Variables:
     ATLAS_PRIVATE_KEY: MongoDB Atlas API Private Key
     ATLAS_ORG_ID: Atlas Organization ID
     ATLAS_API_BASE_URL: (Optional) Atlas API Base URL
+    MAX_PROJECT_WORKERS: (Optional) Number of projects inspected concurrently
 
 Usage:
     python delete_empty_projects_in_organization.py [--dry-run] [--auto-confirm]
@@ -30,12 +31,19 @@ Safety Warning:
 import json
 import logging
 import os
-import time
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPDigestAuth
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON decoding and report writing
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -55,6 +63,17 @@ load_dotenv()
 ATLAS_API_BASE_URL = os.getenv(
     "ATLAS_API_BASE_URL", "https://cloud.mongodb.com/api/atlas/v2"
 )
+# Cluster listings are independent per project, so they are fetched in parallel
+MAX_PROJECT_WORKERS = int(os.getenv("MAX_PROJECT_WORKERS", "8"))
+
+
+def parse_json(response: requests.Response) -> Dict:
+    """Decode a JSON response body with orjson when installed; empty bodies give {}"""
+    if not response.content:
+        return {}
+    if orjson:
+        return orjson.loads(response.content)
+    return response.json()
 
 
 class AtlasAPI:
@@ -69,15 +88,42 @@ class AtlasAPI:
         if not all([self.public_key, self.private_key, self.org_id]):
             raise ValueError("Missing required Atlas API credentials in .env file")
 
+        # One session for all calls, so connections and Digest auth state are reused
+        self.session = requests.Session()
+        self.session.auth = HTTPDigestAuth(self.public_key, self.private_key)
+        self.session.headers.update({"Accept": "application/vnd.atlas.2025-02-19+json"})
+        # Exponential backoff that honours Retry-After on 429 and transient 5xx
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_maxsize=MAX_PROJECT_WORKERS,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["GET", "DELETE"],
+                    respect_retry_after_header=True,
+                ),
+            ),
+        )
+
         # Verify credentials by making a test request
         self._verify_credentials()
 
     def _verify_credentials(self):
-        """Verify API credentials and org_id by fetching organizations"""
-        endpoint = "/orgs"
-        orgs, success = self._make_request("get", endpoint, retry=1)
+        """Verify API credentials and org_id with a single organization lookup"""
+        endpoint = f"/orgs/{self.org_id}"
+        result, success = self._make_request("get", endpoint)
 
         if not success:
+            # 404 means the keys work but cannot see the organization
+            if result.get("status_code") == 404:
+                logger.error(
+                    "Organization ID %s not found or not accessible", self.org_id
+                )
+                raise ValueError(
+                    f"Organization ID {self.org_id} not found. Check ATLAS_ORG_ID."
+                )
             logger.error(
                 "Failed to verify API credentials. Check your public/private keys."
             )
@@ -85,18 +131,9 @@ class AtlasAPI:
                 "Failed to authenticate with Atlas API. Check your credentials."
             )
 
-        # Verify that org_id exists in the list of accessible orgs
-        org_ids = [org.get("id") for org in orgs.get("results", [])]
-        if self.org_id not in org_ids:
-            logger.error(
-                f"Organization ID {self.org_id} not found in accessible organizations: {org_ids}"
-            )
-            raise ValueError(
-                f"Organization ID {self.org_id} not found. Available orgs: {org_ids}"
-            )
-
         logger.info(
-            f"Successfully authenticated with Atlas API. Organization ID {self.org_id} is valid."
+            "Successfully authenticated with Atlas API. Organization ID %s is valid.",
+            self.org_id,
         )
 
     def _make_request(
@@ -104,98 +141,104 @@ class AtlasAPI:
         method: str,
         endpoint: str,
         data: Optional[Dict] = None,
-        retry: int = 1,
         params: Optional[Dict] = None,
     ) -> Tuple[Dict, bool]:
         """
-        Makes a request to the Atlas API with retry mechanism
+        Makes a request to the Atlas API; transient errors are retried by the session
         Returns a tuple of (response_data, success_flag)
         """
-        url = f"{self.base_url}{endpoint}"
-        headers = {"Accept": "application/vnd.atlas.2025-02-19+json"}
-        auth = HTTPDigestAuth(self.public_key, self.private_key)
+        # Pagination "next" links are already absolute URLs
+        url = endpoint if endpoint.startswith("http") else f"{self.base_url}{endpoint}"
 
-        for attempt in range(retry + 1):
-            try:
-                if method.lower() == "get":
-                    response = requests.get(
-                        url, auth=auth, headers=headers, params=params
-                    )
-                elif method.lower() == "post":
-                    response = requests.post(
-                        url, auth=auth, headers=headers, json=data, params=params
-                    )
-                elif method.lower() == "delete":
-                    response = requests.delete(
-                        url, auth=auth, headers=headers, params=params
-                    )
-
-                # Log the full response for debugging
-                if response.status_code != 200:
-                    logger.warning(
-                        f"API response: {response.status_code} - {response.text}"
-                    )
-
-                response.raise_for_status()
-                return response.json(), True
-
-            except requests.exceptions.RequestException as e:
-                logger.warning(
-                    f"API request failed (attempt {attempt+1}/{retry+1}): {str(e)}"
-                )
-                if hasattr(e, "response") and e.response is not None:
-                    logger.warning(f"Response content: {e.response.text}")
-
-                if attempt < retry:
-                    time.sleep(2)  # Wait before retrying
-                else:
-                    return {"error": str(e)}, False
+        try:
+            response = self.session.request(
+                method.upper(), url, json=data, params=params, timeout=30
+            )
 
-    def get_projects_in_org(self) -> List[Dict]:
-        """Get all projects in the organization with pagination support"""
-        all_projects = []
+            # Accepted / No Content responses carry nothing worth decoding
+            if response.status_code in (202, 204):
+                return {}, True
+
+            # The body is only decoded for the DEBUG log below
+            if response.status_code != 200:
+                logger.warning("API response: %s", response.status_code)
+
+            response.raise_for_status()
+            return parse_json(response), True
+
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.warning("API request failed: %s", e)
+            error = {"error": str(e)}
+            response = getattr(e, "response", None)
+            if response is not None:
+                error["status_code"] = response.status_code
+                # Decoding the body is only worth it when it will be logged
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Response content: %s", response.text)
+            return error, False
+
+    def iter_projects(self) -> Iterator[Dict]:
+        """Yield projects in the organization page by page as they are fetched"""
         endpoint = f"/groups"
-        base_params = {"orgId": self.org_id, "itemsPerPage": 500}  # Max items per page
+        page_endpoint = endpoint
+        params = {"orgId": self.org_id, "itemsPerPage": 500}  # Max items per page
         current_page = 1
         max_pages = 100  # Safety limit
 
         while True:
-            params = {**base_params, "pageNum": current_page}
-            result, success = self._make_request(
-                "get", endpoint, retry=2, params=params
-            )
+            result, success = self._make_request("get", page_endpoint, params=params)
 
             if not success:
-                logger.error(f"API request failed for {endpoint} (page {current_page})")
-                break
+                logger.error(
+                    "API request failed for %s (page %s)", endpoint, current_page
+                )
+                return
 
             projects = result.get("results", [])
 
             if not projects:
-                break
+                return
 
-            all_projects.extend(projects)
-            logger.info(f"Retrieved {len(projects)} projects from page {current_page}")
-
-            # Check if there are more pages (Atlas uses a "links" array with "next" relation)
-            if not any(link.get("rel") == "next" for link in result.get("links", [])):
-                break
+            logger.info(
+                "Retrieved %s projects from page %s", len(projects), current_page
+            )
+            yield from projects
+
+            # Follow the server's "next" link (Atlas uses a "links" array with "next" relation)
+            next_url = next(
+                (
+                    link.get("href")
+                    for link in result.get("links", [])
+                    if link.get("rel") == "next"
+                ),
+                None,
+            )
+            if not next_url:
+                return
 
             current_page += 1
             if current_page > max_pages:  # Safety break
                 logger.warning(
-                    f"Reached max_pages ({max_pages}) limit for {endpoint}. "
-                    f"Not all projects might be fetched."
+                    "Reached max_pages (%s) limit for %s. Not all projects might be fetched.",
+                    max_pages,
+                    endpoint,
                 )
-                break
+                return
+
+            # The next link is absolute and already carries the paging query string
+            page_endpoint = next_url
+            params = None
 
-        logger.info(f"Total projects retrieved: {len(all_projects)}")
+    def get_projects_in_org(self) -> List[Dict]:
+        """Get all projects in the organization with pagination support"""
+        all_projects = list(self.iter_projects())
+        logger.info("Total projects retrieved: %s", len(all_projects))
         return all_projects
 
     def get_clusters_in_project(self, project_id: str) -> List[Dict]:
         """Get all clusters in a project"""
         endpoint = f"/groups/{project_id}/clusters"
-        result, success = self._make_request("get", endpoint, retry=2)
+        result, success = self._make_request("get", endpoint)
 
         if success:
             return result.get("results", [])
@@ -207,7 +250,7 @@ class AtlasAPI:
         Returns success flag
         """
         endpoint = f"/groups/{project_id}"
-        _, success = self._make_request("delete", endpoint, retry=2)
+        _, success = self._make_request("delete", endpoint)
         return success
 
 
@@ -228,78 +271,60 @@ class AtlasEmptyProjectsCleaner:
         Parameters:
         dry_run (bool): If True, only report projects to be deleted without actually deleting them
         """
-        # Get all projects in the organization
-        projects = self.api.get_projects_in_org()
+        # Projects are streamed page by page. The listing already reports
+        # clusterCount; projects without it have their clusters fetched
+        # concurrently while later pages are still being retrieved
+        valid_projects = []
+        pending: Dict[str, Future] = {}
+        with ThreadPoolExecutor(max_workers=MAX_PROJECT_WORKERS) as executor:
+            for project in self.api.iter_projects():
+                if not project.get("id"):
+                    logger.warning("Project without ID found: %s", project)
+                    continue
+                valid_projects.append(project)
+                if project.get("clusterCount") is None:
+                    pending[project["id"]] = executor.submit(
+                        self.api.get_clusters_in_project, project["id"]
+                    )
+
+            cluster_counts = [
+                (
+                    project["clusterCount"]
+                    if project.get("clusterCount") is not None
+                    else len(pending[project["id"]].result())
+                )
+                for project in valid_projects
+            ]
 
-        if not projects:
+        if not valid_projects:
             logger.info("No projects found in organization")
             return
 
-        logger.info(f"Found {len(projects)} projects in organization")
+        logger.info("Found %s projects in organization", len(valid_projects))
 
-        # Track projects and their status
-        for project in projects:
-            project_id = project.get("id")
+        # Classify projects before anything is deleted
+        empty_projects = []
+        for project, cluster_count in zip(valid_projects, cluster_counts):
+            project_id = project["id"]
             project_name = project.get("name")
 
-            if not project_id:
-                logger.warning(f"Project without ID found: {project}")
-                continue
-
-            # Get clusters in this project
-            clusters = self.api.get_clusters_in_project(project_id)
-            cluster_count = len(clusters)
-
             logger.info(
-                f"Project '{project_name}' (ID: {project_id}) has {cluster_count} clusters"
+                "Project '%s' (ID: %s) has %s clusters",
+                project_name,
+                project_id,
+                cluster_count,
             )
 
             if cluster_count == 0:
                 # This is an empty project that should be deleted
-                if dry_run:
-                    logger.info(
-                        f"[DRY RUN] Would delete empty project '{project_name}' (ID: {project_id})"
-                    )
-                    self.deleted_projects.append(
-                        {
-                            "id": project_id,
-                            "name": project_name,
-                            "deleted": False,
-                            "reason": "dry_run",
-                        }
-                    )
-                else:
-                    logger.info(
-                        f"Deleting empty project '{project_name}' (ID: {project_id})"
-                    )
-                    if self.api.delete_project(project_id):
-                        logger.info(
-                            f"Successfully deleted project '{project_name}' (ID: {project_id})"
-                        )
-                        self.deleted_projects.append(
-                            {
-                                "id": project_id,
-                                "name": project_name,
-                                "deleted": True,
-                                "reason": "success",
-                            }
-                        )
-                    else:
-                        logger.error(
-                            f"Failed to delete project '{project_name}' (ID: {project_id})"
-                        )
-                        self.deleted_projects.append(
-                            {
-                                "id": project_id,
-                                "name": project_name,
-                                "deleted": False,
-                                "reason": "api_error",
-                            }
-                        )
+                empty_projects.append(project)
             else:
                 # Project has clusters, should be skipped
                 logger.info(
-                    f"Skipping project '{project_name}' (ID: {project_id}) as it has {cluster_count} clusters"
+                    "Skipping project '%s' (ID: %s) as it has %s clusters",
+                    project_name,
+                    project_id,
+                    cluster_count,
                 )
                 self.skipped_projects.append(
                     {
@@ -309,6 +334,58 @@ class AtlasEmptyProjectsCleaner:
                     }
                 )
 
+        if dry_run:
+            for project in empty_projects:
+                logger.info(
+                    "[DRY RUN] Would delete empty project '%s' (ID: %s)",
+                    project.get("name"),
+                    project["id"],
+                )
+                self.deleted_projects.append(
+                    {
+                        "id": project["id"],
+                        "name": project.get("name"),
+                        "deleted": False,
+                        "reason": "dry_run",
+                    }
+                )
+            return
+
+        # The only destructive step: delete the empty projects concurrently
+        with ThreadPoolExecutor(max_workers=MAX_PROJECT_WORKERS) as executor:
+            try:
+                self.deleted_projects.extend(
+                    executor.map(self._delete_empty_project, empty_projects)
+                )
+            except BaseException:
+                # Leaving the with block would otherwise wait for every queued deletion
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    def _delete_empty_project(self, project: Dict) -> Dict:
+        """Delete one empty project and return its report entry"""
+        project_id = project["id"]
+        project_name = project.get("name")
+
+        logger.info("Deleting empty project '%s' (ID: %s)", project_name, project_id)
+        if self.api.delete_project(project_id):
+            logger.info(
+                "Successfully deleted project '%s' (ID: %s)", project_name, project_id
+            )
+            reason = "success"
+        else:
+            logger.error(
+                "Failed to delete project '%s' (ID: %s)", project_name, project_id
+            )
+            reason = "api_error"
+
+        return {
+            "id": project_id,
+            "name": project_name,
+            "deleted": reason == "success",
+            "reason": reason,
+        }
+
     def generate_report(self):
         """Generate a summary report of the operation"""
         successful_deletions = sum(1 for p in self.deleted_projects if p.get("deleted"))
@@ -326,11 +403,15 @@ class AtlasEmptyProjectsCleaner:
             "skipped_projects": self.skipped_projects,
         }
 
-        # Save report to file
-        with open("logs/atlas_empty_projects_report.json", "w") as f:
-            json.dump(report, f, indent=2, default=str)
+        # Save report to file, serialized in one call by orjson when installed
+        if orjson:
+            with open("logs/atlas_empty_projects_report.json", "wb") as f:
+                f.write(orjson.dumps(report, default=str, option=orjson.OPT_INDENT_2))
+        else:
+            with open("logs/atlas_empty_projects_report.json", "w") as f:
+                json.dump(report, f, indent=2, default=str)
 
-        logger.info(f"Report saved to logs/atlas_empty_projects_report.json")
+        logger.info("Report saved to logs/atlas_empty_projects_report.json")
 
         return report
 
@@ -419,11 +500,11 @@ def main():
         print("\nOperation interrupted.")
         return 1
     except ValueError as e:
-        logger.error(f"Configuration error: {str(e)}")
+        logger.error("Configuration error: %s", e)
         print(f"Configuration error: {str(e)}")
         return 1
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         print(f"Unexpected error: {str(e)}")
         return 1
 
@@ -13,26 +13,41 @@ Environment Variables:
     ATLAS_PUBLIC_KEY: MongoDB Atlas API Public Key
     ATLAS_PRIVATE_KEY: MongoDB Atlas API Private Key
     ATLAS_ORG_ID: Atlas Organization ID
+    ATLAS_CLIENT_ID, ATLAS_CLIENT_SECRET: (Optional) Service account used instead of keys
     ATLAS_API_BASE_URL: (Optional) Atlas API Base URL
+    MAX_INVITE_WORKERS: (Optional) Number of invitations sent concurrently
 
 Usage:
-    python invite_users_to_organization.py [--no-confirm]
+    python invite_users_to_organization.py [--no-confirm | --yes]
 
 Note:
-    Modify EMAILS_TO_PROVISION list in the script to specify target users.
-    Use --no-confirm to skip the confirmation prompt.
+    List target users in invitees.csv, one email address per row.
+    Use --no-confirm (or --yes / -y) to skip the confirmation prompt.
 """
 
 import argparse
 import csv
 import logging
+import math
 import os
+import re
+import sys
+import threading
 import time
-from typing import List, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from itertools import chain, islice
+from typing import Deque, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 
 import requests
 from dotenv import load_dotenv
-from requests.auth import HTTPDigestAuth
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase, HTTPBasicAuth, HTTPDigestAuth
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON decoding for large users pages
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -52,32 +67,211 @@ load_dotenv()
 ATLAS_API_BASE_URL = os.getenv(
     "ATLAS_API_BASE_URL", "https://cloud.mongodb.com/api/atlas/v2"
 )
+ATLAS_OAUTH_TOKEN_URL = os.getenv(
+    "ATLAS_OAUTH_TOKEN_URL", "https://cloud.mongodb.com/api/oauth/token"
+)
 PUBLIC_KEY = os.getenv("ATLAS_PUBLIC_KEY")
 PRIVATE_KEY = os.getenv("ATLAS_PRIVATE_KEY")
+CLIENT_ID = os.getenv("ATLAS_CLIENT_ID")
+CLIENT_SECRET = os.getenv("ATLAS_CLIENT_SECRET")
 ORGANIZATION_ID = os.getenv("ATLAS_ORG_ID")
 # Rate limit: 10 invitations per minute for the invite endpoint
 RATE_LIMIT_DELAY_SECONDS = float(os.getenv("RATE_LIMIT_DELAY_SECONDS", "6.0"))
+# Invitations may be sent in a burst as long as no more than this many fall
+# within any window of INVITES_PER_WINDOW * RATE_LIMIT_DELAY_SECONDS seconds
+INVITES_PER_WINDOW = 10
+# Invitations are independent, so a burst is sent from a small worker pool
+MAX_INVITE_WORKERS = int(os.getenv("MAX_INVITE_WORKERS", "5"))
+# Users are listed in pages of this size; pages after the first are fetched
+# concurrently once the total count is known
+USERS_PAGE_SIZE = 500
+MAX_USER_PAGE_WORKERS = 8
+# Organization roles granted to every invited user; shared by all payloads
+INVITE_ROLES = ["ORG_GROUP_CREATOR"]
+# Invitees listed before the confirmation prompt; the rest of the CSV is
+# streamed straight to the workers without being held in memory
+INVITEE_PREVIEW_LIMIT = 20
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+
+def use_service_account() -> bool:
+    """Check whether service account (OAuth) credentials are configured."""
+    return bool(CLIENT_ID and CLIENT_SECRET)
+
+
+def get_service_account_token(client_id: str, client_secret: str) -> Tuple[str, float]:
+    """
+    Exchange service account credentials for an OAuth access token.
 
+    Args:
+        client_id: Service account client ID
+        client_secret: Service account client secret
 
-# Load email addresses from CSV file
-def load_emails_from_csv(csv_file_path: str) -> List[str]:
+    Returns:
+        Tuple of (access token, lifetime in seconds)
     """
-    Load email addresses from a CSV file.
+    response = SESSION.post(
+        ATLAS_OAUTH_TOKEN_URL,
+        auth=HTTPBasicAuth(client_id, client_secret),
+        data={"grant_type": "client_credentials"},
+        headers={"Accept": "application/json"},
+        timeout=30,
+    )
+    response.raise_for_status()
+    data = parse_json(response)
+    return data["access_token"], float(data.get("expires_in", 3600))
+
+
+class BearerAuth(AuthBase):
+    """Attach a service account bearer token, refreshing it shortly before expiry."""
+
+    def __init__(self, client_id: str, client_secret: str):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def token(self) -> str:
+        """Return a valid access token, fetching a new one when needed."""
+        with self._lock:
+            if self._token is None or self._expires_at - time.monotonic() < 60:
+                self._token, lifetime = get_service_account_token(
+                    self.client_id, self.client_secret
+                )
+                self._expires_at = time.monotonic() + lifetime
+            return self._token
+
+    def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
+        request.headers["Authorization"] = f"Bearer {self.token()}"
+        return request
+
+
+def create_atlas_auth() -> AuthBase:
+    """
+    Create request auth, preferring a service account over API key Digest auth.
+
+    Digest auth needs a 401 challenge on every new connection; a bearer token is
+    sent up front on every request.
+    """
+    if use_service_account():
+        return BearerAuth(CLIENT_ID, CLIENT_SECRET)
+    # The session keeps the Digest nonce, so later requests skip the 401 challenge
+    return HTTPDigestAuth(PUBLIC_KEY, PRIVATE_KEY)
+
+
+def create_session() -> requests.Session:
+    """
+    Create a shared HTTP session so Atlas calls reuse pooled keep-alive connections.
+
+    Returns:
+        Session with Atlas auth preset and a small connection pool
+    """
+    session = requests.Session()
+    session.auth = create_atlas_auth()
+    # Rate limit retries are handled in make_atlas_api_request
+    session.mount(
+        "https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+    )
+    return session
+
+
+SESSION = create_session()
+# Set on Ctrl-C so invitation workers still running stop sending invitations
+SHUTDOWN_EVENT = threading.Event()
+
+
+class RateLimiter:
+    """
+    Limit the number of invitations sent.
+
+    Uses a local sliding window until Atlas reports its own budget through
+    X-RateLimit-Remaining / X-RateLimit-Reset response headers; from then on
+    each request spends one call of the reported budget and waits for the
+    reset once it is used up, so concurrent workers cannot overshoot it.
+
+    Each script runs on its own, so this is deliberately a copy of the
+    limiter in provision_projects_for_users.py; keep the two in step.
+    """
+
+    def __init__(self, max_calls: int, period: float):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls: Deque[float] = deque()
+        self._lock = threading.Lock()
+        self._server_driven = False
+        self._remaining = 0
+        self._reset_at = 0.0
+
+    def acquire(self) -> None:
+        """Block until another invitation is allowed."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if self._server_driven and now >= self._reset_at:
+                    # The reported window is over; use the local window until
+                    # a response reports the new budget
+                    self._server_driven = False
+                if self._server_driven:
+                    if self._remaining > 0:
+                        self._remaining -= 1
+                        return
+                    wait = self._reset_at - now
+                else:
+                    while self._calls and now - self._calls[0] >= self.period:
+                        self._calls.popleft()
+                    if len(self._calls) < self.max_calls:
+                        self._calls.append(now)
+                        return
+                    wait = self.period - (now - self._calls[0])
+            logger.debug(f"Waiting {wait:.1f} seconds before next invitation...")
+            time.sleep(wait)
+
+    def after_response(self, response: requests.Response) -> None:
+        """Update the budget from the rate limit headers of a response, if any."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+
+        try:
+            remaining = int(remaining)
+            reset = float(response.headers.get("X-RateLimit-Reset", 0))
+        except (TypeError, ValueError):
+            return
+
+        # The reset is either an epoch timestamp or a number of seconds
+        wait = reset - time.time() if reset > 1e9 else reset
+        if wait <= 0:
+            wait = self.period / self.max_calls
+
+        with self._lock:
+            now = time.monotonic()
+            if self._server_driven:
+                # Responses to earlier requests may report a budget that calls
+                # made since have already spent
+                self._remaining = min(self._remaining, remaining)
+            else:
+                self._server_driven = True
+                self._remaining = remaining
+            self._reset_at = max(self._reset_at, now + wait)
+
+
+def iter_emails_from_csv(csv_file_path: str) -> Iterator[str]:
+    """
+    Yield email addresses from a CSV file one row at a time.
 
     Args:
         csv_file_path: Path to the CSV file containing email addresses
 
-    Returns:
-        List of email addresses
+    Yields:
+        Each non-empty email address, stripped of surrounding whitespace
     """
-    emails = []
     try:
         with open(csv_file_path, "r", encoding="utf-8-sig", newline="") as csvfile:
             reader = csv.reader(csvfile)
             for row in reader:
                 if row and row[0].strip():  # Skip empty rows
-                    emails.append(row[0].strip())
-        logger.info(f"Loaded {len(emails)} email addresses from {csv_file_path}")
+                    yield row[0].strip()
     except FileNotFoundError:
         logger.error(f"CSV file not found: {csv_file_path}")
         raise
@@ -85,11 +279,21 @@ def load_emails_from_csv(csv_file_path: str) -> List[str]:
         logger.error(f"Error reading CSV file {csv_file_path}: {str(e)}")
         raise
 
-    return emails
 
+# Load email addresses from CSV file
+def load_emails_from_csv(csv_file_path: str) -> List[str]:
+    """
+    Load email addresses from a CSV file.
+
+    Args:
+        csv_file_path: Path to the CSV file containing email addresses
 
-# Email list will be loaded at runtime in main()
-EMAILS_TO_PROVISION: List[str] = []
+    Returns:
+        List of email addresses
+    """
+    emails = list(iter_emails_from_csv(csv_file_path))
+    logger.info(f"Loaded {len(emails)} email addresses from {csv_file_path}")
+    return emails
 
 
 # Validate required credentials
@@ -97,10 +301,13 @@ def validate_atlas_credentials():
     """Validate that all required Atlas environment variables are set."""
     missing_vars = []
 
-    if not PUBLIC_KEY:
-        missing_vars.append("ATLAS_PUBLIC_KEY")
-    if not PRIVATE_KEY:
-        missing_vars.append("ATLAS_PRIVATE_KEY")
+    if use_service_account():
+        logger.info("Authenticating with Atlas service account")
+    else:
+        if not PUBLIC_KEY:
+            missing_vars.append("ATLAS_PUBLIC_KEY")
+        if not PRIVATE_KEY:
+            missing_vars.append("ATLAS_PRIVATE_KEY")
     if not ORGANIZATION_ID:
         missing_vars.append("ATLAS_ORG_ID")
 
@@ -124,10 +331,7 @@ def validate_email(email: str) -> bool:
     Returns:
         True if email appears valid, False otherwise
     """
-    import re
-
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return re.match(pattern, email) is not None
+    return EMAIL_PATTERN.match(email) is not None
 
 
 def make_atlas_api_request(
@@ -149,7 +353,7 @@ def make_atlas_api_request(
 
     for attempt in range(max_retries + 1):
         try:
-            response = requests.request(method, url, timeout=30, **kwargs)
+            response = SESSION.request(method, url, timeout=30, **kwargs)
 
             # Handle 409 Conflict (invitation already exists) - return response for caller to handle
             # Check this BEFORE raise_for_status() to avoid exception
@@ -226,7 +430,48 @@ def make_atlas_api_request(
     return None
 
 
-def get_existing_org_users(org_id: str) -> set:
+def parse_json(response: requests.Response):
+    """
+    Decode a JSON response body, using orjson when it is installed.
+
+    Args:
+        response: Response returned by make_atlas_api_request
+
+    Returns:
+        Decoded body, or an empty dict when the body is empty
+    """
+    if not response.content:
+        return {}
+    if orjson:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def get_users_page(url: str, headers: dict, page: int):
+    """
+    Fetch and decode one page of organization users.
+
+    Args:
+        url: The organization users URL
+        headers: Request headers
+        page: Page number to fetch (1-based)
+
+    Returns:
+        Decoded response body, or None if the request or decoding failed
+    """
+    params = {"pageNum": page, "itemsPerPage": USERS_PAGE_SIZE}
+    response = make_atlas_api_request("GET", url, headers=headers, params=params)
+    if not response:
+        return None
+
+    try:
+        return parse_json(response)
+    except (ValueError, AttributeError) as e:
+        logger.warning(f"Failed to parse users response: {str(e)}")
+        return None
+
+
+def get_existing_org_users(org_id: str) -> FrozenSet[str]:
     """
     Get all existing users in an Atlas organization (including pending invitations).
 
@@ -234,80 +479,152 @@ def get_existing_org_users(org_id: str) -> set:
         org_id: The ID of the Atlas organization
 
     Returns:
-        Set of email addresses (usernames) of existing users
+        Lowercased email addresses (usernames) of existing users
     """
     if not org_id:
         logger.warning("Organization ID is required to fetch existing users")
-        return set()
+        return frozenset()
 
     url = f"{ATLAS_API_BASE_URL}/orgs/{org_id}/users"
     headers = {
         "Accept": "application/vnd.atlas.2025-02-19+json",
     }
-    auth = HTTPDigestAuth(PUBLIC_KEY, PRIVATE_KEY)
 
     existing_users = set()
-    page = 1
     max_pages = 100  # Safety limit
 
-    while page <= max_pages:
-        # Add pagination parameters
-        params = {"pageNum": page, "itemsPerPage": 500}
-        response = make_atlas_api_request(
-            "GET", url, headers=headers, auth=auth, params=params
+    def add_users(users: list) -> None:
+        for user in users:
+            username = user.get("username")
+            if username:
+                existing_users.add(username.lower())  # Case-insensitive comparison
+
+    data = get_users_page(url, headers, 1)
+    if data is None:
+        # If first page fails, log warning but return empty set (fail-safe)
+        logger.warning(
+            "Failed to fetch existing users from organization. "
+            "Will proceed with invitations (may result in duplicates)."
         )
-
-        if not response:
-            if page == 1:
-                # If first page fails, log warning but return empty set (fail-safe)
-                logger.warning(
-                    "Failed to fetch existing users from organization. "
-                    "Will proceed with invitations (may result in duplicates)."
+        return frozenset()
+
+    # Handle list response (non-paginated)
+    if isinstance(data, list):
+        add_users(data)
+    elif data.get("results"):
+        add_users(data["results"])
+        total_count = data.get("totalCount")
+
+        if isinstance(total_count, int):
+            # The page count is known up front, so the remaining pages are
+            # fetched concurrently
+            num_pages = min(math.ceil(total_count / USERS_PAGE_SIZE), max_pages)
+            with ThreadPoolExecutor(max_workers=MAX_USER_PAGE_WORKERS) as executor:
+                pages = executor.map(
+                    lambda page: get_users_page(url, headers, page),
+                    range(2, num_pages + 1),
                 )
-            break
-
-        try:
-            data = response.json()
-        except (ValueError, AttributeError) as e:
-            logger.warning(f"Failed to parse users response: {str(e)}")
-            break
-
-        # Handle list response (non-paginated)
-        if isinstance(data, list):
-            for user in data:
-                username = user.get("username")
-                if username:
-                    existing_users.add(username.lower())  # Case-insensitive comparison
-            break
-
-        # Handle dict response with results key (paginated)
-        if "results" in data and data["results"]:
-            for user in data["results"]:
-                username = user.get("username")
-                if username:
-                    existing_users.add(username.lower())  # Case-insensitive comparison
+                for page_data in pages:
+                    if isinstance(page_data, dict):
+                        add_users(page_data.get("results", []))
         else:
-            break
+            # Without a total, follow the "next" links one page at a time
+            page = 1
+            while page < max_pages and any(
+                link.get("rel") == "next" for link in data.get("links", [])
+            ):
+                page += 1
+                data = get_users_page(url, headers, page)
+                if not isinstance(data, dict) or not data.get("results"):
+                    break
+                add_users(data["results"])
 
-        # Check for next page
-        links = data.get("links", [])
-        has_next = any(link.get("rel") == "next" for link in links)
-        if not has_next:
-            break
+    logger.info(f"Found {len(existing_users)} existing users in organization")
+    return frozenset(existing_users)
 
-        page += 1
 
-    logger.info(f"Found {len(existing_users)} existing users in organization")
-    return existing_users
+def invite_user(url: str, headers: dict, email: str, limiter: RateLimiter) -> bool:
+    """
+    Send a single organization invitation.
 
+    Args:
+        url: The organization invites URL
+        headers: Request headers
+        email: Email address to invite
+        limiter: Rate limiter shared by all invitations
 
-def invite_users_to_org(org_id: str, emails: List[str]) -> bool:
+    Returns:
+        True if the user was invited or already had an invitation, False otherwise
+    """
+    limiter.acquire()
+    if SHUTDOWN_EVENT.is_set():
+        logger.warning(f"Skipped invitation for {email}: operation interrupted")
+        return False
+
+    logger.info(f"Inviting user: {email}")
+
+    payload = {"roles": INVITE_ROLES, "username": email}
+
+    response = make_atlas_api_request("POST", url, json=payload, headers=headers)
+    if response is not None:
+        limiter.after_response(response)
+
+    if response is None:
+        logger.error(f"Failed to invite {email} - API request returned None")
+        return False
+    if response.status_code in [200, 201]:
+        logger.info(f"Successfully invited {email} to the organization")
+        return True
+    if response.status_code == 409:
+        logger.warning(
+            f"Invitation already exists for {email} (409 Conflict). Skipping."
+        )
+        return True  # Treat as success since invitation already exists
+
+    logger.error(
+        f"Failed to invite {email} - Unexpected status code: {response.status_code}"
+    )
+    return False
+
+
+def iter_unique_valid_emails(
+    emails: Iterable[str], invalid_emails: List[str]
+) -> Iterator[str]:
+    """
+    Yield each valid email once, skipping case-insensitive duplicates.
+
+    Args:
+        emails: Email addresses to screen; may be a lazy iterator
+        invalid_emails: List that invalid addresses are appended to
+
+    Yields:
+        Each unique, well-formed email address in input order
+    """
+    seen_emails: Set[str] = set()
+    for email in emails:
+        # Skip repeated addresses so they are not validated or sent twice
+        email_lower = email.lower()
+        if email_lower in seen_emails:
+            logger.info(f"Skipping duplicate email in input: {email}")
+            continue
+        seen_emails.add(email_lower)
+
+        # Validate email format
+        if not validate_email(email):
+            logger.error(f"Invalid email format: {email}")
+            invalid_emails.append(email)
+            continue
+
+        yield email
+
+
+def invite_users_to_org(org_id: str, emails: Iterable[str]) -> bool:
     """
     Invite users to an Atlas organization.
 
     Args:
         org_id: The ID of the Atlas organization
-        emails: List of email addresses to invite
+        emails: Email addresses to invite; may be a lazy iterator
 
     Returns:
         True if all invitations were successful, False otherwise
@@ -316,11 +633,20 @@ def invite_users_to_org(org_id: str, emails: List[str]) -> bool:
         logger.error("Organization ID is required but not provided")
         return False
 
-    if not emails:
+    invalid_emails: List[str] = []
+    candidates = iter_unique_valid_emails(emails, invalid_emails)
+
+    # Only read ahead to the first usable address; if there is none, the
+    # organization's users never need to be fetched
+    first_email = next(candidates, None)
+    if first_email is None:
+        if invalid_emails:
+            logger.error("No valid email addresses to invite")
+            return False
         logger.warning("No email addresses provided for invitation")
         return True
 
-    logger.info(f"Starting invitation process for {len(emails)} users")
+    logger.info("Starting invitation process")
 
     # Fetch existing users once at the start
     existing_users = get_existing_org_users(org_id)
@@ -330,61 +656,47 @@ def invite_users_to_org(org_id: str, emails: List[str]) -> bool:
         "Content-Type": "application/json",
         "Accept": "application/vnd.atlas.2025-02-19+json",
     }
-    auth = HTTPDigestAuth(PUBLIC_KEY, PRIVATE_KEY)
 
     successful_invites = 0
     failed_invites = 0
     skipped_existing = 0
+    futures: List[Future] = []
 
-    for email in emails:
-        # Validate email format
-        if not validate_email(email):
-            logger.error(f"Invalid email format: {email}")
-            failed_invites += 1
-            continue
-
-        # Check if user already exists (case-insensitive comparison)
-        if email.lower() in existing_users:
-            logger.info(
-                f"User {email} already exists in the organization. Skipping invitation."
-            )
-            successful_invites += 1  # Treat as success since user already exists
-            skipped_existing += 1
-            continue
-
-        logger.info(f"Inviting user: {email}")
-
-        payload = {"roles": ["ORG_GROUP_CREATOR"], "username": email}
-
-        response = make_atlas_api_request(
-            "POST", url, json=payload, headers=headers, auth=auth
-        )
-
-        if response is None:
-            logger.error(f"Failed to invite {email} - API request returned None")
-            failed_invites += 1
-        elif response.status_code in [200, 201]:
-            logger.info(f"Successfully invited {email} to the organization")
-            successful_invites += 1
-        elif response.status_code == 409:
-            logger.warning(
-                f"Invitation already exists for {email} (409 Conflict). Skipping."
-            )
-            successful_invites += 1  # Treat as success since invitation already exists
-        else:
-            logger.error(
-                f"Failed to invite {email} - Unexpected status code: {response.status_code}"
-            )
-            failed_invites += 1
+    # Invitations are sent as fast as the rate limit window allows (10 per minute)
+    limiter = RateLimiter(
+        INVITES_PER_WINDOW, INVITES_PER_WINDOW * RATE_LIMIT_DELAY_SECONDS
+    )
+    # Each invitation is queued as soon as its email is read, so sending starts
+    # while the rest of the input is still being consumed
+    with ThreadPoolExecutor(max_workers=MAX_INVITE_WORKERS) as executor:
+        try:
+            for email in chain([first_email], candidates):
+                # Check if user already exists (case-insensitive comparison)
+                if email.lower() in existing_users:
+                    logger.info(
+                        f"User {email} already exists in the organization. Skipping invitation."
+                    )
+                    # Treat as success since user already exists
+                    successful_invites += 1
+                    skipped_existing += 1
+                    continue
 
-        # Add delay between requests to respect rate limits (10 invitations per minute)
-        # Skip delay after the last email to avoid unnecessary wait
-        if email != emails[-1]:
-            logger.debug(
-                f"Waiting {RATE_LIMIT_DELAY_SECONDS} seconds before next invitation..."
-            )
-            time.sleep(RATE_LIMIT_DELAY_SECONDS)
+                futures.append(
+                    executor.submit(invite_user, url, headers, email, limiter)
+                )
 
+            for future in as_completed(futures):
+                if future.result():
+                    successful_invites += 1
+                else:
+                    failed_invites += 1
+        except BaseException:
+            # Otherwise leaving the with block still sends every queued invitation
+            SHUTDOWN_EVENT.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    failed_invites += len(invalid_emails)
     logger.info(
         f"Invitation process completed. Successful: {successful_invites}, "
         f"Failed: {failed_invites}, Skipped (already exists): {skipped_existing}"
@@ -394,16 +706,16 @@ def invite_users_to_org(org_id: str, emails: List[str]) -> bool:
 
 def main():
     """Main function with comprehensive error handling."""
-    global EMAILS_TO_PROVISION
     try:
         logger.info("Starting MongoDB Atlas user invitation tool")
 
         # Validate credentials at runtime
         validate_atlas_credentials()
 
-        # Load emails from CSV at runtime
+        # Stream emails from the CSV; only the preview is read up front
+        emails = iter_emails_from_csv("invitees.csv")
         try:
-            EMAILS_TO_PROVISION = load_emails_from_csv("invitees.csv")
+            preview = list(islice(emails, INVITEE_PREVIEW_LIMIT + 1))
         except FileNotFoundError:
             logger.error(
                 "invitees.csv not found. Please create the file with email addresses."
@@ -413,9 +725,9 @@ def main():
             )
             return 1
 
-        if not EMAILS_TO_PROVISION:
+        if not preview:
             logger.warning("No emails configured for invitation")
-            print("No emails configured in EMAILS_TO_PROVISION list.")
+            print("No emails found in invitees.csv.")
             return 0
 
         # Parse command line arguments
@@ -424,17 +736,24 @@ def main():
         )
         parser.add_argument(
             "--no-confirm",
+            "--yes",
+            "-y",
+            dest="no_confirm",
             action="store_true",
             help="Skip confirmation prompt and proceed with invitations",
         )
         args = parser.parse_args()
 
         print(
-            f"About to invite {len(EMAILS_TO_PROVISION)} users to organization {ORGANIZATION_ID}"
+            f"About to invite users from invitees.csv to organization {ORGANIZATION_ID}"
+        )
+        # Write the preview at once rather than one print per address
+        sys.stdout.write(
+            "Users to invite:\n"
+            + "".join(f"  - {email}\n" for email in preview[:INVITEE_PREVIEW_LIMIT])
+            + ("  - ...and more\n" if len(preview) > INVITEE_PREVIEW_LIMIT else "")
         )
-        print("Users to invite:")
-        for email in EMAILS_TO_PROVISION:
-            print(f"  - {email}")
+        sys.stdout.flush()
 
         if args.no_confirm:
             print("\n⚠️  Running without confirmation (--no-confirm flag set)")
@@ -446,7 +765,8 @@ def main():
                 print("Operation cancelled.")
                 return 0
 
-        success = invite_users_to_org(ORGANIZATION_ID, EMAILS_TO_PROVISION)
+        # Previewed rows are already consumed, so chain them back in front
+        success = invite_users_to_org(ORGANIZATION_ID, chain(preview, emails))
 
         if success:
             logger.info("All invitations completed successfully")
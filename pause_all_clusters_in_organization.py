@@ -14,22 +14,44 @@ Environment Variables:
     ATLAS_PRIVATE_KEY: MongoDB Atlas API Private Key
     ATLAS_ORG_ID: Atlas Organization ID
     ATLAS_API_BASE_URL: (Optional) Atlas API Base URL
+    MAX_PAUSE_WORKERS: (Optional) Number of concurrent Atlas requests
+    HTTP_CACHE_TTL: (Optional) Seconds to cache GETs; requires requests-cache
 
 Usage:
-    python pause_all_clusters_in_organization.py
+    python pause_all_clusters_in_organization.py [--yes] [--dry-run]
+        [--org-id ORG_ID] [--concurrency N]
 
 Safety Warning:
     This script performs operations that will pause all clusters in the organization.
     Paused clusters will be inaccessible until resumed. Use with caution.
 """
 
+import argparse
 import logging
+import math
 import os
-from typing import Optional
+import queue
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+from urllib.parse import quote
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPDigestAuth
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+except ImportError:  # Optional: only needed when HTTP_CACHE_TTL is set
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON decoding for large cluster listings
+    orjson = None
 
 # Load environment variables
 load_dotenv()
@@ -41,34 +63,131 @@ ATLAS_API_BASE_URL = os.getenv(
 PUBLIC_KEY = os.getenv("ATLAS_PUBLIC_KEY")
 PRIVATE_KEY = os.getenv("ATLAS_PRIVATE_KEY")
 ORGANIZATION_ID = os.getenv("ATLAS_ORG_ID")
+# URL templates built once; path segments are percent-encoded before filling
+CLUSTERS_URL_TPL = ATLAS_API_BASE_URL + "/groups/%s/clusters"
+PAUSE_URL_TPL = CLUSTERS_URL_TPL + "/%s"
+# Cluster listings and pauses are independent, so they run from a bounded pool
+MAX_PAUSE_WORKERS = int(os.getenv("MAX_PAUSE_WORKERS", "8"))
+PAGE_SIZE = 500  # Max items per page for Atlas listings
+# Seconds to cache GET responses on disk between runs (0 disables caching)
+HTTP_CACHE_TTL = int(os.getenv("HTTP_CACHE_TTL", "0"))
+ATLAS_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/vnd.atlas.2025-02-19+json",
+}
+
+
+class RecordQueueHandler(QueueHandler):
+    """Enqueue records untouched so formatting happens on the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+# Workers only enqueue log records; a background listener formats and writes
+# them once setup_logging() has run
+LOG_QUEUE = queue.Queue(-1)
+LOG_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("pause_all_clusters")
+
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
+def setup_logging() -> QueueListener:
+    """
+    Configure logging to logs/pause_all_clusters.log and the console.
+
+    Returns:
+        The started listener; stop it to flush queued records
+    """
+    os.makedirs("logs", exist_ok=True)
+    listener = QueueListener(
+        LOG_QUEUE,
         logging.FileHandler("logs/pause_all_clusters.log"),
         logging.StreamHandler(),
-    ],
-)
-logger = logging.getLogger("pause_all_clusters")
+    )
+    for handler in listener.handlers:
+        handler.setFormatter(LOG_FORMATTER)
+    logging.basicConfig(level=logging.INFO, handlers=[RecordQueueHandler(LOG_QUEUE)])
+    listener.start()
+    return listener
+
+
+def create_session() -> requests.Session:
+    """
+    Create a shared HTTP session so Atlas calls reuse pooled keep-alive connections.
+
+    Project and cluster listings are cached on disk when HTTP_CACHE_TTL is set
+    and requests-cache is installed; pause PATCHes always reach Atlas.
+
+    Returns:
+        Session with the Atlas headers and a retrying connection pool
+    """
+    if requests_cache and HTTP_CACHE_TTL > 0:
+        session = requests_cache.CachedSession(
+            cache_name="logs/atlas_http_cache",
+            backend="sqlite",
+            expire_after=HTTP_CACHE_TTL,
+            allowable_methods=["GET"],
+        )
+    else:
+        session = requests.Session()
+        if HTTP_CACHE_TTL > 0:
+            logger.warning(
+                "HTTP_CACHE_TTL is set but requests-cache is not installed; "
+                "GET responses will not be cached"
+            )
+
+    session.headers.update(ATLAS_HEADERS)
+    session.mount("https://", create_adapter())
+    return session
+
+
+def create_adapter() -> HTTPAdapter:
+    """
+    Create a retrying connection pool sized for MAX_PAUSE_WORKERS.
+
+    Returns:
+        HTTPAdapter that retries throttled and failed requests
+    """
+    return HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=MAX_PAUSE_WORKERS,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            # Pausing is idempotent, so PATCH is safe to retry
+            allowed_methods=["GET", "PATCH"],
+            respect_retry_after_header=True,
+        ),
+    )
+
+
+SESSION = create_session()
 
 
 # Validate required credentials
-def validate_atlas_credentials():
-    """Validate that all required Atlas environment variables are set."""
+def validate_atlas_credentials(org_id: Optional[str] = None):
+    """
+    Validate that all required Atlas environment variables are set.
+
+    Args:
+        org_id: Organization ID given on the command line, which stands in
+            for ATLAS_ORG_ID
+    """
     missing_vars = []
 
     if not PUBLIC_KEY:
         missing_vars.append("ATLAS_PUBLIC_KEY")
     if not PRIVATE_KEY:
         missing_vars.append("ATLAS_PRIVATE_KEY")
-    if not ORGANIZATION_ID:
+    if not (org_id or ORGANIZATION_ID):
         missing_vars.append("ATLAS_ORG_ID")
 
     if missing_vars:
         logger.error(
-            f"Missing required environment variables: {', '.join(missing_vars)}"
+            "Missing required environment variables: %s", ", ".join(missing_vars)
         )
         logger.error("Please ensure all required variables are set in your .env file")
         raise ValueError(
@@ -84,83 +203,230 @@ def make_atlas_api_request(
     """
     Make an Atlas API request with proper error handling.
 
+    Error statuses are returned rather than raised; 429 and 5xx responses have
+    already been retried by the session's adapter by the time they get here.
+
     Args:
         method: HTTP method (GET, POST, PATCH, etc.)
         url: Full URL for the request
         **kwargs: Additional arguments to pass to requests
 
     Returns:
-        Response object if successful, None if failed
+        Response object (callers check status_code), None if the request
+        could not be completed
     """
     try:
-        response = requests.request(method, url, timeout=30, **kwargs)
-        response.raise_for_status()
-        return response
+        response = SESSION.request(method, url, timeout=30, **kwargs)
     except requests.exceptions.RequestException as e:
-        logger.error(f"API request failed: {method} {url} - {str(e)}")
+        logger.error("API request failed: %s %s - %s", method, url, e)
+        return None
+
+    if not 200 <= response.status_code < 300:
+        logger.error(
+            "API request failed: %s %s - HTTP %s", method, url, response.status_code
+        )
+    return response
+
+
+def parse_json(response: requests.Response):
+    """
+    Decode a JSON response body, using orjson when it is installed.
+
+    Args:
+        response: Response returned by make_atlas_api_request
+
+    Returns:
+        Decoded body, or an empty dict when the body is empty
+    """
+    if not response.content:
+        return {}
+    if orjson:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def get_results_page(
+    url: str, page: int, auth=None, headers: Optional[dict] = None
+) -> Optional[dict]:
+    """
+    Fetch one page of a paginated Atlas listing.
+
+    Args:
+        url: The listing URL
+        page: Page number to fetch (1-based)
+        auth: Authentication override (defaults to the session's)
+        headers: Request headers (defaults to the session's)
+
+    Returns:
+        Decoded response body, or None if the request failed
+    """
+    params = {"itemsPerPage": PAGE_SIZE, "pageNum": page, "includeCount": "true"}
+    response = make_atlas_api_request(
+        "GET", url, headers=headers, auth=auth, params=params
+    )
+
+    if response is None or not 200 <= response.status_code < 300:
+        logger.error("API request failed for %s (page %s)", url, page)
+        return None
+
+    try:
+        return parse_json(response)
+    except ValueError as e:
+        logger.error("Failed to parse response from %s (page %s) - %s", url, page, e)
+        return None
+
+
+def get_all_paginated_results(
+    url: str, auth=None, headers: Optional[dict] = None
+) -> Optional[list]:
+    """
+    Retrieve every item from a paginated Atlas listing.
+
+    Once the first page reports totalCount, the remaining pages are fetched
+    concurrently; otherwise the "next" links are followed one page at a time.
+
+    Args:
+        url: The listing URL
+        auth: Authentication override (defaults to the session's)
+        headers: Request headers (defaults to the session's)
+
+    Returns:
+        List of all items across all pages, or None if the first page failed
+    """
+    max_pages = 100  # Safety limit
+
+    data = get_results_page(url, 1, auth, headers)
+    if data is None:
         return None
 
+    all_results = list(data.get("results", []))
+    total_count = data.get("totalCount")
+
+    if isinstance(total_count, int):
+        num_pages = math.ceil(total_count / PAGE_SIZE)
+        if num_pages > max_pages:
+            logger.warning(
+                "Reached max_pages (%s) limit for %s. "
+                "Not all results might be fetched.",
+                max_pages,
+                url,
+            )
+            num_pages = max_pages
+
+        if num_pages > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_PAUSE_WORKERS, num_pages - 1)
+            ) as executor:
+                pages = executor.map(
+                    lambda page: get_results_page(url, page, auth, headers),
+                    range(2, num_pages + 1),
+                )
+                for page_data in pages:
+                    if page_data is not None:
+                        all_results.extend(page_data.get("results", []))
+    else:
+        page = 1
+        while any(link.get("rel") == "next" for link in data.get("links", [])):
+            page += 1
+            if page > max_pages:  # Safety break
+                logger.warning(
+                    "Reached max_pages (%s) limit for %s. "
+                    "Not all results might be fetched.",
+                    max_pages,
+                    url,
+                )
+                break
+
+            data = get_results_page(url, page, auth, headers)
+            if not data or not data.get("results"):
+                break
+            all_results.extend(data["results"])
+
+    return all_results
 
-def get_all_paginated_projects(org_id: str, auth, headers: dict) -> list:
+
+def get_all_paginated_projects(
+    org_id: str, auth=None, headers: Optional[dict] = None
+) -> list:
     """
     Retrieve all projects from a paginated Atlas API endpoint.
 
     Args:
         org_id: The organization ID
-        auth: HTTPDigestAuth object for authentication
-        headers: Request headers
+        auth: HTTPDigestAuth object for authentication (defaults to the session's)
+        headers: Request headers (defaults to the session's)
 
     Returns:
         List of all projects across all pages
     """
-    all_projects = []
     projects_url = f"{ATLAS_API_BASE_URL}/orgs/{org_id}/groups"
-    params = {"itemsPerPage": 500}  # Max items per page
-    current_page = 1
-    max_pages = 100  # Safety limit
+    all_projects = get_all_paginated_results(projects_url, auth, headers) or []
 
-    while True:
-        params["pageNum"] = current_page
-        response = make_atlas_api_request(
-            "GET", projects_url, headers=headers, auth=auth, params=params
-        )
+    logger.info("Total projects retrieved: %s", len(all_projects))
+    return all_projects
 
-        # Check if API request failed
-        if not response:
-            logger.error(f"API request failed for {projects_url} (page {current_page})")
-            break
 
-        data = response.json()
-        projects = data.get("results", [])
+def get_project_clusters(project_id: str, project_name: str) -> Optional[list]:
+    """
+    List the clusters in a project.
 
-        if not projects:
-            break
+    Args:
+        project_id: The ID of the project
+        project_name: The project name, used for logging
 
-        all_projects.extend(projects)
-        logger.info(f"Retrieved {len(projects)} projects from page {current_page}")
+    Returns:
+        List of clusters, or None if the request failed
+    """
+    logger.info("Processing project: %s (ID: %s)", project_name, project_id)
 
-        # Check if there are more pages (Atlas uses a "links" array with "next" relation)
-        if not any(link.get("rel") == "next" for link in data.get("links", [])):
-            break
+    clusters_url = CLUSTERS_URL_TPL % quote(project_id, safe="")
+    clusters = get_all_paginated_results(clusters_url)
 
-        current_page += 1
-        if current_page > max_pages:  # Safety break
-            logger.warning(
-                f"Reached max_pages ({max_pages}) limit for {projects_url}. "
-                f"Not all projects might be fetched."
-            )
-            break
+    if clusters is None:
+        logger.error("Failed to fetch clusters for project %s", project_name)
+        return None
 
-    logger.info(f"Total projects retrieved: {len(all_projects)}")
-    return all_projects
+    logger.info("Found %s clusters in project %s", len(clusters), project_name)
+    return clusters
 
 
-def pause_all_clusters_in_org(org_id: str) -> bool:
+def pause_cluster(project_id: str, project_name: str, cluster_name: str) -> bool:
+    """
+    Pause a single cluster.
+
+    Args:
+        project_id: The ID of the project containing the cluster
+        project_name: The project name, used for logging
+        cluster_name: The name of the cluster to pause
+
+    Returns:
+        True if the pause was accepted, False otherwise
+    """
+    logger.info("Pausing cluster: %s in project %s", cluster_name, project_name)
+
+    pause_url = PAUSE_URL_TPL % (
+        quote(project_id, safe=""),
+        quote(cluster_name, safe=""),
+    )
+    pause_data = {"paused": True}
+    pause_response = make_atlas_api_request("PATCH", pause_url, json=pause_data)
+
+    if pause_response is not None and pause_response.status_code in [200, 202]:
+        # Per-cluster success is debug noise; the run summary reports the totals
+        logger.debug("Successfully initiated pause for cluster: %s", cluster_name)
+        return True
+
+    logger.error("Failed to pause cluster: %s", cluster_name)
+    return False
+
+
+def pause_all_clusters_in_org(org_id: str, dry_run: bool = False) -> bool:
     """
     Pause all clusters within Atlas projects in an organization.
 
     Args:
         org_id: The ID of the Atlas organization
+        dry_run: If True, only log the clusters that would be paused
 
     Returns:
         True if operation completed successfully, False otherwise
@@ -169,111 +435,171 @@ def pause_all_clusters_in_org(org_id: str) -> bool:
         logger.error("Organization ID is required but not provided")
         return False
 
-    logger.info(f"Starting cluster pause operation for organization: {org_id}")
+    logger.info("Starting cluster pause operation for organization: %s", org_id)
 
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/vnd.atlas.2025-02-19+json",
-    }
-    auth = HTTPDigestAuth(PUBLIC_KEY, PRIVATE_KEY)
+    # Attach auth once so every request reuses it along with the session headers
+    SESSION.auth = HTTPDigestAuth(PUBLIC_KEY, PRIVATE_KEY)
 
     # Get all projects in the organization (with pagination support)
-    projects = get_all_paginated_projects(org_id, auth, headers)
+    projects = get_all_paginated_projects(org_id)
 
     if not projects:
         logger.error("Failed to fetch projects from organization or no projects found")
         return False
 
-    logger.info(f"Found {len(projects)} projects in organization")
-
-    total_clusters_paused = 0
-    total_failures = 0
-    total_already_paused = 0
-
-    for project in projects:
-        project_id = project.get("id")
-        project_name = project.get("name", "Unknown")
-
-        if not project_id:
-            logger.warning(f"Skipping project with missing ID: {project_name}")
-            continue
-
-        logger.info(f"Processing project: {project_name} (ID: {project_id})")
-
-        # Get all clusters in the project
-        clusters_url = f"{ATLAS_API_BASE_URL}/groups/{project_id}/clusters"
-        clusters_response = make_atlas_api_request(
-            "GET", clusters_url, headers=headers, auth=auth
-        )
-
-        if not clusters_response:
-            logger.error(f"Failed to fetch clusters for project {project_name}")
-            total_failures += 1
-            continue
-
-        clusters = clusters_response.json().get("results", [])
-        logger.info(f"Found {len(clusters)} clusters in project {project_name}")
-
-        for cluster in clusters:
-            cluster_name = cluster.get("name")
-            current_paused_state = cluster.get("paused", False)
-
-            if not cluster_name:
-                logger.warning(
-                    f"Skipping cluster with missing name in project {project_name}"
+    logger.info("Found %s projects in organization", len(projects))
+
+    # Outcome per cluster ("paused", "already" or "failed"), tallied once at the end
+    outcomes: Counter = Counter()
+    pause_futures: List[Future] = []
+
+    # Cluster listings for all projects run concurrently, and each cluster's
+    # pause is queued as soon as its project's listing returns
+    with ThreadPoolExecutor(max_workers=MAX_PAUSE_WORKERS) as executor:
+        try:
+            listing_futures = {}
+            for project in projects:
+                project_id = project.get("id")
+                project_name = project.get("name", "Unknown")
+
+                if not project_id:
+                    logger.warning("Skipping project with missing ID: %s", project_name)
+                    continue
+
+                listing_futures[
+                    executor.submit(get_project_clusters, project_id, project_name)
+                ] = (project_id, project_name)
+
+            for listing in as_completed(listing_futures):
+                project_id, project_name = listing_futures[listing]
+                clusters = listing.result()
+
+                if clusters is None:
+                    outcomes["failed"] += 1
+                    continue
+
+                # Only running, named clusters reach the request stage; the rest
+                # are summarised in one line per project
+                to_pause = [
+                    cluster
+                    for cluster in clusters
+                    if cluster.get("name") and not cluster.get("paused", False)
+                ]
+                already_paused = sum(1 for cluster in clusters if cluster.get("paused"))
+                outcomes["already"] += already_paused
+                logger.info(
+                    "%s: %s to pause, %s skipped (%s already paused)",
+                    project_name,
+                    len(to_pause),
+                    len(clusters) - len(to_pause),
+                    already_paused,
                 )
-                continue
-
-            if current_paused_state:
-                logger.info(f"Cluster {cluster_name} is already paused, skipping")
-                total_already_paused += 1
-                continue
 
-            logger.info(f"Pausing cluster: {cluster_name} in project {project_name}")
+                if dry_run:
+                    for cluster in to_pause:
+                        logger.info(
+                            "Dry run: would pause cluster %s in project %s",
+                            cluster["name"],
+                            project_name,
+                        )
+                    outcomes["would_pause"] += len(to_pause)
+                    continue
+
+                pause_futures.extend(
+                    executor.submit(
+                        pause_cluster, project_id, project_name, cluster["name"]
+                    )
+                    for cluster in to_pause
+                )
 
-            # Pause the cluster
-            pause_url = (
-                f"{ATLAS_API_BASE_URL}/groups/{project_id}/clusters/{cluster_name}"
-            )
-            pause_data = {"paused": True}
-            pause_response = make_atlas_api_request(
-                "PATCH", pause_url, headers=headers, auth=auth, json=pause_data
+            outcomes.update(
+                "paused" if future.result() else "failed"
+                for future in as_completed(pause_futures)
             )
-
-            if pause_response and pause_response.status_code in [200, 202]:
-                logger.info(f"Successfully initiated pause for cluster: {cluster_name}")
-                total_clusters_paused += 1
-            else:
-                logger.error(f"Failed to pause cluster: {cluster_name}")
-                total_failures += 1
+        except BaseException:
+            # Otherwise leaving the with block still sends every queued pause
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    if dry_run:
+        logger.info(
+            "Dry run completed. Clusters that would be paused: %s, "
+            "Already paused: %s, Failures: %s",
+            outcomes["would_pause"],
+            outcomes["already"],
+            outcomes["failed"],
+        )
+        return outcomes["failed"] == 0
 
     logger.info(
-        f"Operation completed. Clusters paused: {total_clusters_paused}, "
-        f"Already paused: {total_already_paused}, Failures: {total_failures}"
+        "Operation completed. Clusters paused: %s, Already paused: %s, Failures: %s",
+        outcomes["paused"],
+        outcomes["already"],
+        outcomes["failed"],
     )
-    return total_failures == 0
+    return outcomes["failed"] == 0
 
 
 def main():
     """Main function with comprehensive error handling."""
+    global MAX_PAUSE_WORKERS
+    log_listener = setup_logging()
     try:
+        # Parse command line arguments
+        parser = argparse.ArgumentParser(
+            description="Pause all clusters in a MongoDB Atlas organization"
+        )
+        parser.add_argument(
+            "--yes",
+            "-y",
+            action="store_true",
+            help="Skip confirmation prompt and pause clusters",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="List the clusters that would be paused without pausing them",
+        )
+        parser.add_argument(
+            "--org-id",
+            default=None,
+            help="Atlas organization ID (defaults to ATLAS_ORG_ID)",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=MAX_PAUSE_WORKERS,
+            help=f"Number of concurrent Atlas requests (default {MAX_PAUSE_WORKERS})",
+        )
+        args = parser.parse_args()
+
         # Validate credentials
-        validate_atlas_credentials()
+        validate_atlas_credentials(args.org_id)
+        org_id = args.org_id or ORGANIZATION_ID
+
+        if args.concurrency != MAX_PAUSE_WORKERS:
+            # Resize the worker pools and the connection pool that feeds them
+            MAX_PAUSE_WORKERS = max(1, args.concurrency)
+            SESSION.mount("https://", create_adapter())
 
         logger.info("Starting MongoDB Atlas cluster pause tool")
 
-        # Confirm operation
-        print("⚠️  WARNING: This will pause ALL clusters in the organization!")
-        print(f"Organization ID: {ORGANIZATION_ID}")
-        print("Paused clusters will be inaccessible until resumed.")
-        confirm = input("Type 'PAUSE ALL CLUSTERS' to confirm: ")
+        if args.dry_run:
+            logger.info("Running in DRY RUN mode - no clusters will be paused")
+            print("🔍 DRY RUN MODE: No clusters will actually be paused")
+        elif not args.yes:
+            # Confirm operation
+            print("⚠️  WARNING: This will pause ALL clusters in the organization!")
+            print(f"Organization ID: {org_id}")
+            print("Paused clusters will be inaccessible until resumed.")
+            confirm = input("Type 'PAUSE ALL CLUSTERS' to confirm: ")
 
-        if confirm != "PAUSE ALL CLUSTERS":
-            logger.info("Operation cancelled by user")
-            print("Operation cancelled.")
-            return 0
+            if confirm != "PAUSE ALL CLUSTERS":
+                logger.info("Operation cancelled by user")
+                print("Operation cancelled.")
+                return 0
 
-        success = pause_all_clusters_in_org(ORGANIZATION_ID)
+        success = pause_all_clusters_in_org(org_id, dry_run=args.dry_run)
 
         if success:
             logger.info("All operations completed successfully")
@@ -287,9 +613,12 @@ def main():
         print("\nOperation interrupted.")
         return 1
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", e)
         print(f"Unexpected error: {str(e)}")
         return 1
+    finally:
+        SESSION.close()
+        log_listener.stop()
 
 
 if __name__ == "__main__":
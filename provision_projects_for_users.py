@@ -15,6 +15,8 @@ Environment Variables:
     ATLAS_PRIVATE_KEY: MongoDB Atlas API Private Key
     ATLAS_ORG_ID: Atlas Organization ID
     ATLAS_API_BASE_URL: (Optional) Atlas API Base URL
+    MAX_PROVISION_WORKERS: (Optional) Number of emails processed concurrently
+    ATLAS_REQUESTS_PER_MINUTE: (Optional) Cap on Atlas API requests per minute
 
 Usage:
     python provision_projects_for_users.py --action <action> [--emails email1 email2 ...]
@@ -30,12 +32,17 @@ Actions:
 import json
 import logging
 import os
+import random
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPDigestAuth
 
 # Configure logging
@@ -56,6 +63,17 @@ load_dotenv()
 ATLAS_API_BASE_URL = os.getenv(
     "ATLAS_API_BASE_URL", "https://cloud.mongodb.com/api/atlas/v2"
 )
+# Each email's project and cluster calls are independent of other emails', so
+# emails are processed concurrently from a bounded pool
+MAX_PROVISION_WORKERS = int(os.getenv("MAX_PROVISION_WORKERS", "5"))
+# Exponential backoff between retries: 0.25s, 0.5s, 1s, ... capped, plus jitter
+RETRY_BASE_DELAY_SECONDS = 0.25
+RETRY_MAX_DELAY_SECONDS = 30
+# Client-side cap that keeps bursts from concurrent workers under Atlas's
+# per-minute API limit instead of hitting it and retrying 429s
+ATLAS_REQUESTS_PER_MINUTE = int(os.getenv("ATLAS_REQUESTS_PER_MINUTE", "100"))
+# Seconds a successful GET response is reused before Atlas is asked again
+GET_CACHE_TTL_SECONDS = 30
 
 # Define the list of email addresses here
 EMAILS_TO_PROVISION = [
@@ -67,10 +85,85 @@ EMAILS_TO_PROVISION = [
 ]
 
 
+class RateLimiter:
+    """
+    Limit the number of Atlas API requests sent.
+
+    Uses a local sliding window until Atlas reports its own budget through
+    X-RateLimit-Remaining / X-RateLimit-Reset response headers; from then on
+    each request spends one call of the reported budget and waits for the
+    reset once it is used up, so concurrent workers cannot overshoot it.
+
+    Each script runs on its own, so this is deliberately a copy of the
+    limiter in invite_users_to_organization.py; keep the two in step.
+    """
+
+    def __init__(self, max_calls: int, period: float):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls: Deque[float] = deque()
+        self._lock = threading.Lock()
+        self._server_driven = False
+        self._remaining = 0
+        self._reset_at = 0.0
+
+    def acquire(self) -> None:
+        """Block until another request is allowed."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if self._server_driven and now >= self._reset_at:
+                    # The reported window is over; use the local window until
+                    # a response reports the new budget
+                    self._server_driven = False
+                if self._server_driven:
+                    if self._remaining > 0:
+                        self._remaining -= 1
+                        return
+                    wait = self._reset_at - now
+                else:
+                    while self._calls and now - self._calls[0] >= self.period:
+                        self._calls.popleft()
+                    if len(self._calls) < self.max_calls:
+                        self._calls.append(now)
+                        return
+                    wait = self.period - (now - self._calls[0])
+            logger.debug(f"Waiting {wait:.1f} seconds before next API request...")
+            time.sleep(wait)
+
+    def after_response(self, response: requests.Response) -> None:
+        """Update the budget from the rate limit headers of a response, if any."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+
+        try:
+            remaining = int(remaining)
+            reset = float(response.headers.get("X-RateLimit-Reset", 0))
+        except (TypeError, ValueError):
+            return
+
+        # The reset is either an epoch timestamp or a number of seconds
+        wait = reset - time.time() if reset > 1e9 else reset
+        if wait <= 0:
+            wait = self.period / self.max_calls
+
+        with self._lock:
+            now = time.monotonic()
+            if self._server_driven:
+                # Responses to earlier requests may report a budget that calls
+                # made since have already spent
+                self._remaining = min(self._remaining, remaining)
+            else:
+                self._server_driven = True
+                self._remaining = remaining
+            self._reset_at = max(self._reset_at, now + wait)
+
+
 class AtlasAPI:
     """Handles all interactions with MongoDB Atlas API v2"""
 
-    def __init__(self):
+    def __init__(self, cache_ttl: float = GET_CACHE_TTL_SECONDS):
         self.base_url = ATLAS_API_BASE_URL
         self.public_key = os.getenv("ATLAS_PUBLIC_KEY")
         self.private_key = os.getenv("ATLAS_PRIVATE_KEY")
@@ -80,10 +173,25 @@ class AtlasAPI:
         self.failed_requests = []
         self.total_requests = 0
         self.successful_requests = 0
+        # Requests are made from several worker threads
+        self._tracking_lock = threading.Lock()
+        # Shared by every request, including retries
+        self.limiter = RateLimiter(ATLAS_REQUESTS_PER_MINUTE, 60)
+        # GET responses by endpoint, as (expires_at, data); 0 disables caching
+        self.cache_ttl = cache_ttl
+        self._get_cache: Dict[str, Tuple[float, Dict]] = {}
+        self._cache_lock = threading.Lock()
 
         if not all([self.public_key, self.private_key, self.org_id]):
             raise ValueError("Missing required Atlas API credentials in .env file")
 
+        # One session for all calls, so connections and Digest auth state are reused
+        self.session = requests.Session()
+        self.session.auth = HTTPDigestAuth(self.public_key, self.private_key)
+        self.session.headers.update({"Accept": "application/vnd.atlas.2025-02-19+json"})
+        # One pooled connection per email worker; retries are handled in _make_request
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=MAX_PROVISION_WORKERS))
+
         # Verify credentials by making a test request
         self._verify_credentials()
 
@@ -121,21 +229,24 @@ class AtlasAPI:
         Makes a request to the Atlas API with retry mechanism
         Returns a tuple of (response_data, success_flag)
         """
+        if method.lower() == "get":
+            cached = self._get_cached(endpoint)
+            if cached is not None:
+                return cached, True
+
         url = f"{self.base_url}{endpoint}"
-        headers = {"Accept": "application/vnd.atlas.2025-02-19+json"}
-        auth = HTTPDigestAuth(self.public_key, self.private_key)
 
         # Track this request
-        self.total_requests += 1
+        with self._tracking_lock:
+            self.total_requests += 1
 
         for attempt in range(retry + 1):
             try:
-                if method.lower() == "get":
-                    response = requests.get(url, auth=auth, headers=headers)
-                elif method.lower() == "post":
-                    response = requests.post(url, auth=auth, headers=headers, json=data)
-                elif method.lower() == "delete":
-                    response = requests.delete(url, auth=auth, headers=headers)
+                self.limiter.acquire()
+                response = self.session.request(
+                    method.upper(), url, json=data, timeout=30
+                )
+                self.limiter.after_response(response)
 
                 r = response.json()
 
@@ -144,15 +255,15 @@ class AtlasAPI:
 
                     if r["error"] == 409 and r["errorCode"] == "GROUP_ALREADY_EXISTS":
                         logger.info(f"Project {r["parameters"][0]} already exists.")
-                        self.successful_requests += (
-                            1  # Treat as success since project exists
-                        )
+                        with self._tracking_lock:
+                            # Treat as success since project exists
+                            self.successful_requests += 1
                         return r, False
                     elif r["error"] == 409 and r["errorCode"] == "USER_ALREADY_EXISTS":
                         logger.info(f"User {r["parameters"][0]} already exists.")
-                        self.successful_requests += (
-                            1  # Treat as success since user exists
-                        )
+                        with self._tracking_lock:
+                            # Treat as success since user exists
+                            self.successful_requests += 1
                         return r, False
                     else:
                         logger.warning(
@@ -171,28 +282,27 @@ class AtlasAPI:
                         self.failed_requests.append(failure_info)
 
                 response.raise_for_status()
-                self.successful_requests += 1
+                with self._tracking_lock:
+                    self.successful_requests += 1
+                self._update_cache(method, endpoint, r)
                 return r, True
 
             except requests.exceptions.RequestException as e:
                 logger.warning(
                     f"API request failed (attempt {attempt+1}/{retry+1}): {str(e)}"
                 )
-                if hasattr(e, "response") and e.response is not None:
-                    logger.warning(f"Response content: {e.response.text}")
+                error_response = getattr(e, "response", None)
+                if error_response is not None:
+                    logger.warning(f"Response content: {error_response.text}")
 
-                if attempt < retry:
-                    time.sleep(2)  # Wait before retrying
+                if attempt < retry and self._is_retryable(error_response):
+                    time.sleep(self._retry_delay(attempt, error_response))
                 else:
                     # Record this failure after all retries exhausted
                     failure_info = {
                         "method": method.upper(),
                         "endpoint": endpoint,
-                        "status_code": (
-                            getattr(e.response, "status_code", "N/A")
-                            if hasattr(e, "response") and e.response
-                            else "N/A"
-                        ),
+                        "status_code": getattr(error_response, "status_code", "N/A"),
                         "error": str(e),
                         "error_code": "REQUEST_EXCEPTION",
                         "attempt": attempt + 1,
@@ -201,6 +311,64 @@ class AtlasAPI:
                     self.failed_requests.append(failure_info)
                     return {"error": str(e)}, False
 
+    def _get_cached(self, endpoint: str) -> Optional[Dict]:
+        """Return a fresh cached GET response for an endpoint, if any"""
+        with self._cache_lock:
+            entry = self._get_cache.get(endpoint)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if time.monotonic() >= expires_at:
+                del self._get_cache[endpoint]
+                return None
+            return data
+
+    def _update_cache(self, method: str, endpoint: str, data: Dict):
+        """
+        Cache a successful GET, or drop cached listings a successful write
+        may have changed (the written resource, its collection and children)
+        """
+        if self.cache_ttl <= 0:
+            return
+
+        with self._cache_lock:
+            if method.lower() == "get":
+                self._get_cache[endpoint] = (time.monotonic() + self.cache_ttl, data)
+                return
+
+            path = endpoint.split("?")[0]
+            parent = path.rsplit("/", 1)[0]
+            for key in list(self._get_cache):
+                key_path = key.split("?")[0]
+                if key_path in (path, parent) or key_path.startswith(path + "/"):
+                    del self._get_cache[key]
+
+    @staticmethod
+    def _is_retryable(response: Optional[requests.Response]) -> bool:
+        """Client errors other than throttling fail the same way on every attempt"""
+        if response is None:
+            return True
+        status_code = response.status_code
+        return status_code == HTTPStatus.TOO_MANY_REQUESTS or not (
+            400 <= status_code < 500
+        )
+
+    @staticmethod
+    def _retry_delay(attempt: int, response: Optional[requests.Response]) -> float:
+        """
+        Seconds to wait before the next attempt: the server's Retry-After when
+        given, otherwise exponential backoff with jitter
+        """
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            try:
+                return max(0.0, float(retry_after))
+            except (TypeError, ValueError):
+                pass  # Absent or an HTTP date; fall back to backoff
+
+        delay = min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * 2**attempt)
+        return delay + random.uniform(0, RETRY_BASE_DELAY_SECONDS)
+
     def get_projects_in_org(self) -> List[Dict]:
         """Get all projects in the organization"""
         # API v2 uses this endpoint format for projects
@@ -360,6 +528,8 @@ class AtlasOwnershipTracker:
     def __init__(self, file_path: str = "logs/atlas_ownership.json"):
         self.file_path = file_path
         self.ownership_map = {}
+        # Serializes updates and saves from concurrent provisioning workers
+        self._lock = threading.Lock()
         self._load_mapping()
 
     def _load_mapping(self):
@@ -382,12 +552,13 @@ class AtlasOwnershipTracker:
 
     def add_project(self, email: str, project_id: str, project_name: str):
         """Add a project mapping for an email"""
-        self.ownership_map[email] = {
-            "project_id": project_id,
-            "project_name": project_name,
-            "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
-        }
-        self._save_mapping()
+        with self._lock:
+            self.ownership_map[email] = {
+                "project_id": project_id,
+                "project_name": project_name,
+                "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            self._save_mapping()
 
     def get_project_id(self, email: str) -> Optional[str]:
         """Get the project ID for an email if it exists"""
@@ -397,11 +568,12 @@ class AtlasOwnershipTracker:
 
     def remove_project(self, email: str):
         """Remove a project mapping for an email"""
-        if email in self.ownership_map:
-            del self.ownership_map[email]
-            self._save_mapping()
-            return True
-        return False
+        with self._lock:
+            if email in self.ownership_map:
+                del self.ownership_map[email]
+                self._save_mapping()
+                return True
+            return False
 
     def get_all_mappings(self) -> Dict:
         """Get all email to project mappings"""
@@ -423,6 +595,30 @@ class AtlasProvisioner:
             "delete_clusters": {"success": 0, "failed": 0, "failed_emails": []},
             "delete_projects": {"success": 0, "failed": 0, "failed_emails": []},
         }
+        self._results_lock = threading.Lock()
+
+    def _record_result(self, operation: str, email: str, success: bool):
+        """Record the outcome of an operation for one email"""
+        with self._results_lock:
+            results = self.operation_results[operation]
+            if success:
+                results["success"] += 1
+            else:
+                results["failed"] += 1
+                results["failed_emails"].append(email)
+
+    def _run_for_emails(self, func: Callable[[str], Any], emails: List[str]) -> List:
+        """
+        Run func for each email on the worker pool and return the results in order
+        Queued emails are cancelled on Ctrl-C instead of being processed
+        """
+        with ThreadPoolExecutor(max_workers=MAX_PROVISION_WORKERS) as executor:
+            try:
+                return list(executor.map(func, emails))
+            except BaseException:
+                # Leaving the with block would otherwise wait for every queued email
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
 
     def provision_for_emails(self, emails: List[str]):
         """
@@ -438,8 +634,10 @@ class AtlasProvisioner:
         existing_projects = self.api.get_projects_in_org()
         existing_project_map = {p.get("name"): p.get("id") for p in existing_projects}
 
-        for email in unique_emails:
-            self._provision_for_email(email, existing_project_map)
+        self._run_for_emails(
+            lambda email: self._provision_for_email(email, existing_project_map),
+            unique_emails,
+        )
 
     def _provision_for_email(self, email: str, existing_project_map: Dict):
         """
@@ -467,8 +665,7 @@ class AtlasProvisioner:
 
                 if not success or not project_id:
                     logger.error(f"Failed to create project for {email}")
-                    self.operation_results["provision"]["failed"] += 1
-                    self.operation_results["provision"]["failed_emails"].append(email)
+                    self._record_result("provision", email, False)
                     return
 
                 logger.info(f"Created project {project_id} for {email}")
@@ -514,23 +711,21 @@ class AtlasProvisioner:
                     logger.info(
                         f"Created cluster {cluster_name} in project {project_id}"
                     )
-                    self.operation_results["provision"]["success"] += 1
+                    self._record_result("provision", email, True)
                 else:
                     logger.error(
                         f"Failed to create cluster in project {project_id} for {email}"
                     )
-                    self.operation_results["provision"]["failed"] += 1
-                    self.operation_results["provision"]["failed_emails"].append(email)
+                    self._record_result("provision", email, False)
             else:
                 logger.info(
                     f"Project {project_id} already has {len(clusters)} clusters"
                 )
-                self.operation_results["provision"]["success"] += 1
+                self._record_result("provision", email, True)
 
         except Exception as e:
             logger.error(f"Exception during provisioning for {email}: {str(e)}")
-            self.operation_results["provision"]["failed"] += 1
-            self.operation_results["provision"]["failed_emails"].append(email)
+            self._record_result("provision", email, False)
 
     def delete_clusters_for_emails(self, emails: List[str]):
         """
@@ -543,13 +738,9 @@ class AtlasProvisioner:
             f"Processing cluster deletion for {len(unique_emails)} unique emails"
         )
 
-        emails_with_deleted_clusters = []
-
-        for email in unique_emails:
-            if self._delete_clusters_for_email(email):
-                emails_with_deleted_clusters.append(email)
+        attempted = self._run_for_emails(self._delete_clusters_for_email, unique_emails)
 
-        return emails_with_deleted_clusters
+        return [email for email, found in zip(unique_emails, attempted) if found]
 
     def _delete_clusters_for_email(self, email: str) -> bool:
         """
@@ -586,17 +777,15 @@ class AtlasProvisioner:
                     all_successful = False
 
             if all_successful:
-                self.operation_results["delete_clusters"]["success"] += 1
+                self._record_result("delete_clusters", email, True)
             else:
-                self.operation_results["delete_clusters"]["failed"] += 1
-                self.operation_results["delete_clusters"]["failed_emails"].append(email)
+                self._record_result("delete_clusters", email, False)
 
             return True
 
         except Exception as e:
             logger.error(f"Exception during cluster deletion for {email}: {str(e)}")
-            self.operation_results["delete_clusters"]["failed"] += 1
-            self.operation_results["delete_clusters"]["failed_emails"].append(email)
+            self._record_result("delete_clusters", email, False)
             return False
 
     def delete_projects_for_emails(self, emails: List[str]):
@@ -609,8 +798,7 @@ class AtlasProvisioner:
             f"Processing project deletion for {len(unique_emails)} unique emails"
         )
 
-        for email in unique_emails:
-            self._delete_project_for_email(email)
+        self._run_for_emails(self._delete_project_for_email, unique_emails)
 
     def _delete_project_for_email(self, email: str):
         """
@@ -630,16 +818,14 @@ class AtlasProvisioner:
                 logger.info(f"Successfully deleted project {project_id}")
                 # Remove from tracking
                 self.tracker.remove_project(email)
-                self.operation_results["delete_projects"]["success"] += 1
+                self._record_result("delete_projects", email, True)
             else:
                 logger.error(f"Failed to delete project {project_id}")
-                self.operation_results["delete_projects"]["failed"] += 1
-                self.operation_results["delete_projects"]["failed_emails"].append(email)
+                self._record_result("delete_projects", email, False)
 
         except Exception as e:
             logger.error(f"Exception during project deletion for {email}: {str(e)}")
-            self.operation_results["delete_projects"]["failed"] += 1
-            self.operation_results["delete_projects"]["failed_emails"].append(email)
+            self._record_result("delete_projects", email, False)
 
     def delete_all_clusters(self):
         """
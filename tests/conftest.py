@@ -2,6 +2,7 @@
 Shared fixtures and test configuration for atlas-mgmt-examples tests.
 """
 
+import json
 import os
 import sys
 from unittest.mock import MagicMock, patch
@@ -69,6 +70,9 @@ def mock_response():
         response.status_code = status_code
         response.json.return_value = json_data or {}
         response.text = str(json_data or {})
+        # Real bytes, so parse_json decodes the same body when orjson is installed
+        response.content = json.dumps(json_data or {}).encode()
+        response.headers = {}
 
         if raise_error:
             response.raise_for_status.side_effect = Exception("API Error")
@@ -153,14 +157,14 @@ def sample_invitations():
 def paginated_response_factory():
     """Factory to create paginated API responses."""
 
-    def _create_paginated_response(results, has_next=False):
+    def _create_paginated_response(results, has_next=False, total_count=None):
         links = []
         if has_next:
             links.append({"rel": "next", "href": "http://example.com/next"})
         return {
             "results": results,
             "links": links,
-            "totalCount": len(results),
+            "totalCount": len(results) if total_count is None else total_count,
         }
 
     return _create_paginated_response
@@ -12,7 +12,7 @@ This module tests the aged resource cleanup functionality including:
 import os
 import sys
 from datetime import datetime, timedelta, timezone
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
@@ -26,7 +26,15 @@ class TestValidateAtlasCredentials:
         with patch.dict(os.environ, mock_env_vars):
             import cleanup_aged_projects_and_clusters as module
 
-            module.validate_atlas_credentials()
+            credentials = module.validate_atlas_credentials()
+
+            assert credentials == {
+                "ATLAS_PUBLIC_KEY": "test_public_key",
+                "ATLAS_PRIVATE_KEY": "test_private_key",
+                "ATLAS_ORG_ID": "test_org_id",
+            }
+            with pytest.raises(TypeError):
+                credentials["ATLAS_ORG_ID"] = "other_org_id"
 
     @pytest.mark.parametrize(
         "missing_var,present_vars",
@@ -74,6 +82,76 @@ class TestGetEnvVariable:
             assert "NONEXISTENT_VAR" in str(excinfo.value)
 
 
+class TestCreateAtlasAuth:
+    """Tests for create_atlas_auth and service account token handling."""
+
+    def test_api_keys_use_digest_auth(self, mock_env_vars):
+        """Test API keys fall back to Digest auth."""
+        with patch.dict(os.environ, mock_env_vars):
+            from requests.auth import HTTPDigestAuth
+
+            import cleanup_aged_projects_and_clusters as module
+
+            auth = module.create_atlas_auth(module.validate_atlas_credentials())
+            assert isinstance(auth, HTTPDigestAuth)
+
+    def test_service_account_uses_bearer_token(self, mock_env_vars, mock_response):
+        """Test service account credentials are exchanged for a bearer token."""
+        env = {
+            "ATLAS_ORG_ID": "test_org_id",
+            "ATLAS_CLIENT_ID": "client_id",
+            "ATLAS_CLIENT_SECRET": "client_secret",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            import cleanup_aged_projects_and_clusters as module
+
+            # API keys are not required when a service account is configured
+            credentials = module.validate_atlas_credentials()
+
+            with patch("requests.Session.request") as mock_request:
+                mock_request.return_value = mock_response(
+                    200, {"access_token": "token123", "expires_in": 3600}
+                )
+
+                auth = module.create_atlas_auth(credentials)
+
+                assert isinstance(auth, module.BearerAuth)
+                assert mock_request.call_args[0][1] == module.ATLAS_OAUTH_TOKEN_URL
+                assert mock_request.call_args[1]["data"] == {
+                    "grant_type": "client_credentials"
+                }
+
+            prepared = requests.Request("GET", "https://example.com").prepare()
+            assert auth(prepared).headers["Authorization"] == "Bearer token123"
+
+
+    def test_bearer_token_refreshed_before_expiry(self, mock_env_vars, mock_response):
+        """Test a long run swaps in a new token shortly before the old one expires."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            auth = module.BearerAuth("client_id", "client_secret")
+            clock = [1000.0]
+
+            with patch("requests.Session.request") as mock_request, patch(
+                "time.monotonic", side_effect=lambda: clock[0]
+            ):
+                mock_request.side_effect = [
+                    mock_response(200, {"access_token": "token1", "expires_in": 3600}),
+                    mock_response(200, {"access_token": "token2", "expires_in": 3600}),
+                ]
+
+                first = auth(requests.Request("GET", "https://example.com").prepare())
+                second = auth(requests.Request("GET", "https://example.com").prepare())
+                clock[0] += 3550
+                third = auth(requests.Request("GET", "https://example.com").prepare())
+
+                assert first.headers["Authorization"] == "Bearer token1"
+                assert second.headers["Authorization"] == "Bearer token1"
+                assert third.headers["Authorization"] == "Bearer token2"
+                assert mock_request.call_count == 2
+
+
 class TestMakeAtlasApiRequest:
     """Tests for make_atlas_api_request function."""
 
@@ -82,13 +160,10 @@ class TestMakeAtlasApiRequest:
         with patch.dict(os.environ, mock_env_vars):
             import cleanup_aged_projects_and_clusters as module
 
-            with patch("requests.request") as mock_request:
+            with patch("requests.Session.request") as mock_request:
                 mock_request.return_value = mock_response(200, {"data": "test"})
 
-                from requests.auth import HTTPDigestAuth
-
-                auth = HTTPDigestAuth("user", "pass")
-                result = module.make_atlas_api_request("GET", "http://test.com", auth)
+                result = module.make_atlas_api_request("GET", "http://test.com")
 
                 assert result is not None
                 assert result.status_code == 200
@@ -98,13 +173,10 @@ class TestMakeAtlasApiRequest:
         with patch.dict(os.environ, mock_env_vars):
             import cleanup_aged_projects_and_clusters as module
 
-            with patch("requests.request") as mock_request:
+            with patch("requests.Session.request") as mock_request:
                 mock_request.side_effect = requests.exceptions.RequestException("Error")
 
-                from requests.auth import HTTPDigestAuth
-
-                auth = HTTPDigestAuth("user", "pass")
-                result = module.make_atlas_api_request("GET", "http://test.com", auth)
+                result = module.make_atlas_api_request("GET", "http://test.com")
 
                 assert result is None
 
@@ -113,17 +185,154 @@ class TestMakeAtlasApiRequest:
         with patch.dict(os.environ, mock_env_vars):
             import cleanup_aged_projects_and_clusters as module
 
-            with patch("requests.request") as mock_request:
+            with patch("requests.Session.request") as mock_request:
                 mock_request.return_value = mock_response(200)
 
-                from requests.auth import HTTPDigestAuth
-
-                auth = HTTPDigestAuth("user", "pass")
-                module.make_atlas_api_request("GET", "http://test.com", auth)
+                module.make_atlas_api_request("GET", "http://test.com")
 
                 call_kwargs = mock_request.call_args[1]
                 assert call_kwargs["timeout"] == 30
 
+    def test_session_mounts_pooled_retrying_adapter(self, mock_env_vars):
+        """Test the shared session pools connections and retries transient errors."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            adapter = module.SESSION.get_adapter("https://cloud.mongodb.com")
+            assert adapter._pool_maxsize == module.MAX_CONNECTIONS
+            assert 429 in adapter.max_retries.status_forcelist
+            assert 500 in adapter.max_retries.status_forcelist
+            assert adapter.max_retries.total == 5
+            assert "DELETE" in adapter.max_retries.allowed_methods
+            # The final 429 must come back as a response for the governor
+            assert adapter.max_retries.raise_on_status is False
+
+    def test_exhausted_429_retries_pause_next_request(
+        self, mock_env_vars, mock_response
+    ):
+        """Test a 429 left over after the adapter's retries pauses other workers."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            limited = mock_response(429)
+            limited.headers = {"Retry-After": "3"}
+            limited.raise_for_status.side_effect = requests.exceptions.HTTPError(
+                "429", response=limited
+            )
+
+            with patch("requests.Session.request", return_value=limited), patch.object(
+                module.time, "monotonic", return_value=100.0
+            ), patch.object(module.time, "sleep") as mock_sleep, patch.object(
+                module.GOVERNOR, "update", wraps=module.GOVERNOR.update
+            ) as mock_update:
+                assert module.make_atlas_api_request("GET", "http://test.com") is None
+                # The failed response is counted once, not again by the error path
+                mock_update.assert_called_once_with(limited)
+
+                module.make_atlas_api_request("GET", "http://test.com")
+                mock_sleep.assert_called_once_with(3.0)
+
+    def test_exhausted_rate_limit_pauses_next_request(
+        self, mock_env_vars, mock_response
+    ):
+        """Test the governor waits out Retry-After once the limit is exhausted."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            limited = mock_response(200)
+            limited.headers = {"X-RateLimit-Remaining": "0", "Retry-After": "2"}
+
+            with patch("requests.Session.request", return_value=limited), patch.object(
+                module.time, "monotonic", return_value=100.0
+            ), patch.object(module.time, "sleep") as mock_sleep:
+                module.make_atlas_api_request("GET", "http://test.com")
+                mock_sleep.assert_not_called()
+
+                module.make_atlas_api_request("GET", "http://test.com")
+                mock_sleep.assert_called_once_with(2.0)
+
+    def test_remaining_rate_limit_does_not_pause(self, mock_env_vars, mock_response):
+        """Test requests are not delayed while the limit has capacity left."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            response = mock_response(200)
+            response.headers = {"X-RateLimit-Remaining": "57"}
+
+            with patch("requests.Session.request", return_value=response), patch.object(
+                module.time, "sleep"
+            ) as mock_sleep:
+                module.make_atlas_api_request("GET", "http://test.com")
+                module.make_atlas_api_request("GET", "http://test.com")
+
+                mock_sleep.assert_not_called()
+
+    def test_atlas_headers_set_once_on_session(self, mock_env_vars, mock_response):
+        """Test Atlas headers live on the session rather than each request."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            assert (
+                module.SESSION.headers["Accept"]
+                == "application/vnd.atlas.2025-03-12+json"
+            )
+
+            with patch("requests.Session.request") as mock_request:
+                mock_request.return_value = mock_response(200)
+                module.make_atlas_api_request("GET", "http://test.com")
+
+                assert "headers" not in mock_request.call_args[1]
+
+    def test_worker_limits_read_from_environment(self, mock_env_vars):
+        """Test concurrency limits can be tuned through environment variables."""
+        env = {**mock_env_vars, "MAX_PROJECT_WORKERS": "3", "MAX_DELETE_WORKERS": "2"}
+        with patch.dict(os.environ, env):
+            import cleanup_aged_projects_and_clusters as module
+
+            assert module.MAX_PROJECT_WORKERS == 3
+            assert module.MAX_DELETE_WORKERS == 2
+            adapter = module.SESSION.get_adapter("https://cloud.mongodb.com")
+            # 3 project + 6 fetch + 2 delete + 4 page workers
+            assert adapter._pool_maxsize == 15
+
+    def test_session_is_uncached_by_default(self, mock_env_vars):
+        """Test GET caching stays off unless HTTP_CACHE_TTL is set."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            assert module.HTTP_CACHE_TTL == 0
+            assert type(module.SESSION) is requests.Session
+
+    def test_cached_session_used_when_ttl_set(self, mock_env_vars):
+        """Test requests-cache backs GETs when installed and a TTL is set."""
+        env = {**mock_env_vars, "HTTP_CACHE_TTL": "300"}
+        fake_requests_cache = MagicMock()
+        with patch.dict(os.environ, env), patch.dict(
+            sys.modules, {"requests_cache": fake_requests_cache}
+        ):
+            import cleanup_aged_projects_and_clusters as module
+
+            fake_requests_cache.CachedSession.assert_called_once()
+            call_kwargs = fake_requests_cache.CachedSession.call_args[1]
+            assert call_kwargs["expire_after"] == 300
+            assert call_kwargs["allowable_methods"] == ["GET"]
+            assert module.SESSION is fake_requests_cache.CachedSession.return_value
+
+    def test_missing_requests_cache_with_ttl_logs_warning(self, mock_env_vars):
+        """Test a TTL without requests-cache installed is reported, not ignored."""
+        env = {**mock_env_vars, "HTTP_CACHE_TTL": "300"}
+        with patch.dict(os.environ, env), patch.dict(
+            sys.modules, {"requests_cache": None}
+        ):
+            import cleanup_aged_projects_and_clusters as module
+
+            with patch.object(module.logger, "warning") as mock_warning:
+                session = module.create_session()
+
+            assert type(session) is requests.Session
+            mock_warning.assert_called_once()
+            assert "requests-cache is not installed" in mock_warning.call_args[0][0]
+
 
 class TestGetAllPaginatedItems:
     """Tests for get_all_paginated_items function."""
@@ -135,16 +344,13 @@ class TestGetAllPaginatedItems:
         with patch.dict(os.environ, mock_env_vars):
             import cleanup_aged_projects_and_clusters as module
 
-            with patch("requests.request") as mock_request:
+            with patch("requests.Session.request") as mock_request:
                 items = [{"id": "1"}, {"id": "2"}]
                 mock_request.return_value = mock_response(
                     200, paginated_response_factory(items)
                 )
 
-                from requests.auth import HTTPDigestAuth
-
-                auth = HTTPDigestAuth("user", "pass")
-                result = module.get_all_paginated_items("http://test.com", auth)
+                result = module.get_all_paginated_items("http://test.com")
 
                 assert result == items
 
@@ -155,7 +361,7 @@ class TestGetAllPaginatedItems:
         with patch.dict(os.environ, mock_env_vars):
             import cleanup_aged_projects_and_clusters as module
 
-            with patch("requests.request") as mock_request:
+            with patch("requests.Session.request") as mock_request:
                 page1_items = [{"id": "1"}]
                 page2_items = [{"id": "2"}]
 
@@ -168,12 +374,109 @@ class TestGetAllPaginatedItems:
                     ),
                 ]
 
-                from requests.auth import HTTPDigestAuth
-
-                auth = HTTPDigestAuth("user", "pass")
-                result = module.get_all_paginated_items("http://test.com", auth)
+                result = module.get_all_paginated_items("http://test.com")
 
                 assert result == page1_items + page2_items
+                first_call = mock_request.call_args_list[0]
+                assert first_call.kwargs["params"] == {"itemsPerPage": 500}
+                second_call = mock_request.call_args_list[1]
+                assert second_call.args[1] == "http://example.com/next"
+                assert second_call.kwargs["params"] is None
+
+    def test_pages_streamed_before_next_page_is_fetched(
+        self, mock_env_vars, mock_response, paginated_response_factory
+    ):
+        """Test each page is yielded before the following page is requested."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            with patch("requests.Session.request") as mock_request:
+                mock_request.side_effect = [
+                    mock_response(
+                        200, paginated_response_factory([{"id": "1"}], has_next=True)
+                    ),
+                    mock_response(200, paginated_response_factory([{"id": "2"}])),
+                ]
+
+                pages = module.iter_paginated_pages("http://test.com")
+
+                assert next(pages) == [{"id": "1"}]
+                assert mock_request.call_count == 1
+                assert list(pages) == [[{"id": "2"}]]
+                assert mock_request.call_count == 2
+
+    def test_remaining_pages_fetched_concurrently_from_total_count(
+        self, mock_env_vars, mock_response, paginated_response_factory
+    ):
+        """Test pages 2..N are requested up front once totalCount is known."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            pages = {
+                1: [{"id": "1"}, {"id": "2"}],
+                2: [{"id": "3"}, {"id": "4"}],
+                3: [{"id": "5"}],
+            }
+
+            def route(method, url, **kwargs):
+                page = kwargs["params"].get("pageNum", 1)
+                return mock_response(
+                    200,
+                    paginated_response_factory(
+                        pages[page], has_next=page < 3, total_count=5
+                    ),
+                )
+
+            with patch("requests.Session.request", side_effect=route) as mock_request:
+                result = module.get_all_paginated_items("http://test.com")
+
+                assert result == pages[1] + pages[2] + pages[3]
+                assert mock_request.call_count == 3
+
+    def test_paging_stops_at_item_budget(
+        self, mock_env_vars, mock_response, paginated_response_factory
+    ):
+        """Test endless next links stop once MAX_ITEMS_BUDGET items are collected."""
+        env = {**mock_env_vars, "MAX_ITEMS_BUDGET": "3"}
+        with patch.dict(os.environ, env):
+            import cleanup_aged_projects_and_clusters as module
+
+            with patch("requests.Session.request") as mock_request:
+                mock_request.return_value = mock_response(
+                    200, paginated_response_factory([{"id": "1"}], has_next=True)
+                )
+
+                result = module.get_all_paginated_items("http://test.com")
+
+                assert len(result) == 3
+                assert mock_request.call_count == 3
+
+    def test_pages_decoded_with_orjson_when_installed(
+        self, mock_env_vars, mock_response, paginated_response_factory
+    ):
+        """Test page bodies are decoded from raw bytes by orjson when available."""
+        import json
+
+        fake_orjson = MagicMock()
+        fake_orjson.loads.side_effect = json.loads
+        with patch.dict(os.environ, mock_env_vars), patch.dict(
+            sys.modules, {"orjson": fake_orjson}
+        ):
+            import cleanup_aged_projects_and_clusters as module
+
+            with patch("requests.Session.request") as mock_request:
+                items = [{"id": "1"}]
+                response = mock_response(200)
+                response.content = json.dumps(
+                    paginated_response_factory(items)
+                ).encode()
+                mock_request.return_value = response
+
+                result = module.get_all_paginated_items("http://test.com")
+
+                assert result == items
+                fake_orjson.loads.assert_called_once_with(response.content)
+                response.json.assert_not_called()
 
     def test_empty_response(
         self, mock_env_vars, mock_response, paginated_response_factory
@@ -182,15 +485,12 @@ class TestGetAllPaginatedItems:
         with patch.dict(os.environ, mock_env_vars):
             import cleanup_aged_projects_and_clusters as module
 
-            with patch("requests.request") as mock_request:
+            with patch("requests.Session.request") as mock_request:
                 mock_request.return_value = mock_response(
                     200, paginated_response_factory([])
                 )
 
-                from requests.auth import HTTPDigestAuth
-
-                auth = HTTPDigestAuth("user", "pass")
-                result = module.get_all_paginated_items("http://test.com", auth)
+                result = module.get_all_paginated_items("http://test.com")
 
                 assert result == []
 
@@ -205,17 +505,16 @@ class TestGetAtlasResources:
         with patch.dict(os.environ, mock_env_vars):
             import cleanup_aged_projects_and_clusters as module
 
-            with patch("requests.request") as mock_request:
+            with patch("requests.Session.request") as mock_request:
                 mock_request.return_value = mock_response(
                     200, paginated_response_factory(sample_projects)
                 )
 
-                from requests.auth import HTTPDigestAuth
-
-                auth = HTTPDigestAuth("user", "pass")
-                result = module.get_atlas_projects("test_org", auth)
+                result = module.get_atlas_projects("test_org")
 
                 assert len(result) == 2
+                params = mock_request.call_args[1]["params"]
+                assert params["itemsPerPage"] == module.ITEMS_PER_PAGE
 
     def test_get_atlas_clusters(
         self, mock_env_vars, mock_response, sample_clusters, paginated_response_factory
@@ -224,17 +523,17 @@ class TestGetAtlasResources:
         with patch.dict(os.environ, mock_env_vars):
             import cleanup_aged_projects_and_clusters as module
 
-            with patch("requests.request") as mock_request:
+            with patch("requests.Session.request") as mock_request:
                 mock_request.return_value = mock_response(
                     200, paginated_response_factory(sample_clusters)
                 )
 
-                from requests.auth import HTTPDigestAuth
-
-                auth = HTTPDigestAuth("user", "pass")
-                result = module.get_atlas_clusters("project123", auth)
+                result = module.get_atlas_clusters("project123")
 
                 assert len(result) == 2
+                # Per-project collections use the smaller page size
+                params = mock_request.call_args[1]["params"]
+                assert params["itemsPerPage"] == module.SMALL_ITEMS_PER_PAGE
 
 
 class TestDeleteAtlasResource:
@@ -246,6 +545,7 @@ class TestDeleteAtlasResource:
             ("database_user", "testuser", 204),
             ("project_user", "user123", 202),
             ("cluster", "test-cluster", 202),
+            ("group_invitation", "invite123", 204),
         ],
     )
     def test_delete_resource_success(
@@ -255,14 +555,11 @@ class TestDeleteAtlasResource:
         with patch.dict(os.environ, mock_env_vars):
             import cleanup_aged_projects_and_clusters as module
 
-            with patch("requests.request") as mock_request:
+            with patch("requests.Session.request") as mock_request:
                 mock_request.return_value = mock_response(status_code)
 
-                from requests.auth import HTTPDigestAuth
-
-                auth = HTTPDigestAuth("user", "pass")
                 result = module.delete_atlas_resource(
-                    resource_type, "project123", resource_id, auth
+                    resource_type, "project123", resource_id
                 )
 
                 assert result is True
@@ -270,13 +567,10 @@ class TestDeleteAtlasResource:
     def test_delete_unknown_resource_type_returns_false(self, mock_env_vars):
         """Test deletion with unknown resource type returns False."""
         with patch.dict(os.environ, mock_env_vars):
-            from requests.auth import HTTPDigestAuth
-
             import cleanup_aged_projects_and_clusters as module
 
-            auth = HTTPDigestAuth("user", "pass")
             result = module.delete_atlas_resource(
-                "unknown_type", "project123", "resource123", auth
+                "unknown_type", "project123", "resource123"
             )
 
             assert result is False
@@ -286,20 +580,31 @@ class TestDeleteAtlasResource:
         with patch.dict(os.environ, mock_env_vars):
             import cleanup_aged_projects_and_clusters as module
 
-            with patch("requests.request") as mock_request:
+            with patch("requests.Session.request") as mock_request:
                 mock_request.side_effect = requests.exceptions.RequestException(
                     "API Error"
                 )
 
-                from requests.auth import HTTPDigestAuth
-
-                auth = HTTPDigestAuth("user", "pass")
                 result = module.delete_atlas_resource(
-                    "cluster", "project123", "test-cluster", auth
+                    "cluster", "project123", "test-cluster"
                 )
 
                 assert not result
 
+    def test_delete_resource_skipped_after_interrupt(self, mock_env_vars):
+        """Test no DELETE is sent once the run has been interrupted."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            module.SHUTDOWN_EVENT.set()
+            with patch("requests.Session.request") as mock_request:
+                result = module.delete_atlas_resource(
+                    "cluster", "project123", "test-cluster"
+                )
+
+            assert result is False
+            mock_request.assert_not_called()
+
 
 class TestShowWarningAndConfirm:
     """Tests for show_warning_and_confirm function."""
@@ -351,24 +656,27 @@ class TestCleanupFunctions:
         with patch.dict(os.environ, mock_env_vars):
             import cleanup_aged_projects_and_clusters as module
 
-            with patch("requests.request") as mock_request:
-                mock_request.side_effect = [
-                    mock_response(
+            # The listings are fetched concurrently, so route by URL not call order
+            def route(method, url, **kwargs):
+                if method == "DELETE":
+                    return mock_response(204)
+                if url.endswith("/databaseUsers"):
+                    return mock_response(
                         200, paginated_response_factory(sample_database_users)
-                    ),
-                    mock_response(204),  # Delete user1
-                    mock_response(204),  # Delete user2
-                    mock_response(200, paginated_response_factory(sample_atlas_users)),
-                    mock_response(204),  # Delete atlas user1
-                    mock_response(204),  # Delete atlas user2
-                ]
-
-                from requests.auth import HTTPDigestAuth
-
-                auth = HTTPDigestAuth("user", "pass")
-
+                    )
+                if url.endswith("/users"):
+                    return mock_response(
+                        200, paginated_response_factory(sample_atlas_users)
+                    )
+                return mock_response(200, [])  # group invitations
+
+            with patch("requests.Session.request", side_effect=route) as mock_request:
                 # Should not raise
-                module.cleanup_project_resources("project123", "test-project", auth)
+                module.cleanup_project_resources("project123", "test-project")
+
+                methods = [call.args[0] for call in mock_request.call_args_list]
+                assert methods.count("GET") == 3
+                assert methods.count("DELETE") == 4  # user1, user2, atlas user1, user2
 
     def test_cleanup_clusters_deletes_all(
         self, mock_env_vars, mock_response, sample_clusters, paginated_response_factory
@@ -377,18 +685,337 @@ class TestCleanupFunctions:
         with patch.dict(os.environ, mock_env_vars):
             import cleanup_aged_projects_and_clusters as module
 
-            with patch("requests.request") as mock_request:
+            with patch("requests.Session.request") as mock_request:
                 mock_request.side_effect = [
                     mock_response(200, paginated_response_factory(sample_clusters)),
                     mock_response(202),
                     mock_response(202),
                 ]
 
-                from requests.auth import HTTPDigestAuth
+                module.cleanup_project_clusters("project123", "test-project")
+
+    def test_cleanup_resources_deletes_every_user_concurrently(
+        self,
+        mock_env_vars,
+        mock_response,
+        sample_database_users,
+        sample_atlas_users,
+        paginated_response_factory,
+    ):
+        """Test every non-protected user is deleted when deletes run in parallel."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            def route(method, url, **kwargs):
+                if method == "DELETE":
+                    return mock_response(204)
+                if url.endswith("/databaseUsers"):
+                    return mock_response(
+                        200, paginated_response_factory(sample_database_users)
+                    )
+                if url.endswith("/users"):
+                    return mock_response(
+                        200, paginated_response_factory(sample_atlas_users)
+                    )
+                return mock_response(200, paginated_response_factory([]))
+
+            with patch("requests.Session.request", side_effect=route) as mock_request:
+                module.cleanup_project_resources("project123", "test-project")
+
+                deleted_urls = sorted(
+                    call.args[1]
+                    for call in mock_request.call_args_list
+                    if call.args[0] == "DELETE"
+                )
+                base = "https://cloud.mongodb.com/api/atlas/v2/groups/project123"
+                assert deleted_urls == [
+                    f"{base}/databaseUsers/admin/user1",
+                    f"{base}/databaseUsers/testdb/user2",
+                    f"{base}/users/user1",
+                    f"{base}/users/user2",
+                ]
+
+    def test_database_users_listed_in_full_before_deleting(
+        self, mock_env_vars, mock_response, paginated_response_factory
+    ):
+        """Test deletions cannot shift later pages and leave users behind."""
+        with patch.dict(os.environ, mock_env_vars):
+            import threading
+
+            import cleanup_aged_projects_and_clusters as module
 
-                auth = HTTPDigestAuth("user", "pass")
+            # Serve offset-based pages from the live collection, like Atlas does
+            live_users = [
+                {"username": f"user{i}", "databaseName": "admin"} for i in range(250)
+            ]
+            lock = threading.Lock()
+
+            def route(method, url, params=None, **kwargs):
+                with lock:
+                    if method == "DELETE":
+                        username = url.rsplit("/", 1)[1]
+                        live_users[:] = [
+                            u for u in live_users if u["username"] != username
+                        ]
+                        return mock_response(204)
+                    params = params or {}
+                    size = params.get("itemsPerPage", 100)
+                    start = (params.get("pageNum", 1) - 1) * size
+                    page = live_users[start : start + size]
+                    return mock_response(
+                        200,
+                        paginated_response_factory(
+                            page,
+                            has_next=start + size < len(live_users),
+                            total_count=len(live_users),
+                        ),
+                    )
+
+            with patch("requests.Session.request", side_effect=route):
+                futures = module.submit_database_user_deletions("project123")
+                successful, failed = module.wait_for_deletions(futures)
+
+            assert (successful, failed) == (250, 0)
+            assert live_users == []
+
+    def test_delete_all_group_invitations_uses_shared_pool(
+        self, mock_env_vars, mock_response, sample_invitations
+    ):
+        """Test invitations are deleted in parallel and missing IDs count as failed."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            invitations = sample_invitations + [{"username": "no-id@example.com"}]
+
+            def route(method, url, **kwargs):
+                if method == "GET":
+                    return mock_response(200, invitations)
+                if url.endswith("invite2"):
+                    return mock_response(500)
+                return mock_response(204)
+
+            with patch("requests.Session.request", side_effect=route) as mock_request:
+                successful, failed = module.delete_all_group_invitations(
+                    "project123", "test-project"
+                )
+
+                assert (successful, failed) == (1, 2)
+                deletes = [
+                    call
+                    for call in mock_request.call_args_list
+                    if call.args[0] == "DELETE"
+                ]
+                assert len(deletes) == 2
+
+    def test_cleanup_resources_uses_known_atlas_users(
+        self, mock_env_vars, mock_response, sample_atlas_users
+    ):
+        """Test Atlas users passed in are removed without a per-project listing."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            def route(method, url, **kwargs):
+                if method == "DELETE":
+                    return mock_response(204)
+                return mock_response(200, [])
+
+            with patch("requests.Session.request", side_effect=route) as mock_request:
+                successful, failed = module.cleanup_project_resources(
+                    "project123", "test-project", sample_atlas_users
+                )
+
+                assert (successful, failed) == (2, 0)
+                get_urls = [
+                    call.args[1]
+                    for call in mock_request.call_args_list
+                    if call.args[0] == "GET"
+                ]
+                assert not any(url.endswith("/users") for url in get_urls)
+
+    def test_map_users_to_projects_handles_both_role_shapes(self, mock_env_vars):
+        """Test org users are grouped by project for flat and nested role lists."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            flat = {
+                "id": "user1",
+                "roles": [
+                    {"orgId": "test_org_id", "roleName": "ORG_MEMBER"},
+                    {"groupId": "p1", "roleName": "GROUP_READ_ONLY"},
+                    {"groupId": "p1", "roleName": "GROUP_OWNER"},
+                ],
+            }
+            nested = {
+                "id": "user2",
+                "roles": {
+                    "orgRoles": ["ORG_MEMBER"],
+                    "groupRoleAssignments": [
+                        {"groupId": "p1", "groupRoles": ["GROUP_OWNER"]},
+                        {"groupId": "p2", "groupRoles": ["GROUP_READ_ONLY"]},
+                    ],
+                },
+            }
+
+            project_users = module.map_users_to_projects([flat, nested, {"id": "x"}])
+
+            assert project_users == {"p1": [flat, nested], "p2": [nested]}
+
+
+class TestProcessProject:
+    """Tests for process_project function."""
+
+    def test_process_project_skips_recent_project(self, mock_env_vars):
+        """Test a project younger than the thresholds is counted but untouched."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            recent = {
+                "id": "p1",
+                "name": "recent",
+                "created": datetime.now(timezone.utc).isoformat(),
+            }
+            user_cutoff = (module.CURRENT_DATE_UTC - timedelta(days=90)).strftime(
+                module.ISO_UTC_FORMAT
+            )
+            cluster_cutoff = (module.CURRENT_DATE_UTC - timedelta(days=120)).strftime(
+                module.ISO_UTC_FORMAT
+            )
+
+            with patch("requests.Session.request") as mock_request:
+                result = module.process_project(recent, user_cutoff, cluster_cutoff)
+
+                assert result == (1, 0, 0)
+                mock_request.assert_not_called()
+
+    def test_process_project_missing_data_is_error(self, mock_env_vars):
+        """Test a project with missing fields is reported as an error."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            cutoff = module.CURRENT_DATE_UTC.strftime(module.ISO_UTC_FORMAT)
+            result = module.process_project({"id": "p1"}, cutoff, cutoff)
+
+            assert result == (0, 0, 1)
+
+    def test_process_project_invalid_old_date_is_error(self, mock_env_vars):
+        """Test an unparseable timestamp before the cutoff is reported as an error."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            project = {"id": "p1", "name": "bad", "created": "2020-13-45T00:00:00Z"}
+            cutoff = module.CURRENT_DATE_UTC.strftime(module.ISO_UTC_FORMAT)
+            result = module.process_project(project, cutoff, cutoff)
+
+            assert result == (0, 0, 1)
+
+    def test_parse_atlas_timestamp_falls_back_to_fromisoformat(self, mock_env_vars):
+        """Test Zulu timestamps parse without the optional ciso8601 package."""
+        with patch.dict(os.environ, mock_env_vars), patch.dict(
+            sys.modules, {"ciso8601": None}
+        ):
+            import cleanup_aged_projects_and_clusters as module
+
+            assert module.ciso8601 is None
+            assert module.parse_atlas_timestamp("2024-01-01T00:00:00Z") == datetime(
+                2024, 1, 1, tzinfo=timezone.utc
+            )
+
+    def test_parse_atlas_timestamp_uses_ciso8601_when_installed(self, mock_env_vars):
+        """Test the C parser is preferred when ciso8601 is importable."""
+        fake_ciso8601 = MagicMock()
+        with patch.dict(os.environ, mock_env_vars), patch.dict(
+            sys.modules, {"ciso8601": fake_ciso8601}
+        ):
+            import cleanup_aged_projects_and_clusters as module
+
+            result = module.parse_atlas_timestamp("2024-01-01T00:00:00Z")
+
+            fake_ciso8601.parse_datetime.assert_called_once_with("2024-01-01T00:00:00Z")
+            assert result is fake_ciso8601.parse_datetime.return_value
+
+    def test_process_project_skips_cluster_fetch_when_count_is_zero(
+        self, mock_env_vars
+    ):
+        """Test no cluster GET is issued when the listing reports zero clusters."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            project = {
+                "id": "p1",
+                "name": "old",
+                "created": "2020-01-01T00:00:00Z",
+                "clusterCount": 0,
+            }
+            cutoff = module.CURRENT_DATE_UTC.strftime(module.ISO_UTC_FORMAT)
+
+            with patch.object(
+                module, "cleanup_project_resources", return_value=(0, 0)
+            ), patch.object(module, "cleanup_project_clusters") as mock_clusters:
+                result = module.process_project(project, cutoff, cutoff)
+
+                assert result == (1, 1, 0)
+                mock_clusters.assert_not_called()
+
+    def test_process_project_checkpoint_skips_completed_project(self, mock_env_vars):
+        """Test a project recorded as complete is not cleaned up again."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            project = {"id": "p1", "name": "old", "created": "2020-01-01T00:00:00Z"}
+            cutoff = module.CURRENT_DATE_UTC.strftime(module.ISO_UTC_FORMAT)
+            checkpoint = module.open_checkpoint(":memory:")
+
+            with patch.object(
+                module, "cleanup_project_resources", return_value=(2, 0)
+            ) as mock_resources, patch.object(
+                module, "cleanup_project_clusters", return_value=(1, 0)
+            ) as mock_clusters:
+                first = module.process_project(project, cutoff, cutoff, checkpoint)
+                second = module.process_project(project, cutoff, cutoff, checkpoint)
+
+                assert first == second == (1, 1, 0)
+                assert module.get_checkpoint(checkpoint, "p1") == "complete"
+                mock_resources.assert_called_once()
+                mock_clusters.assert_called_once()
+
+    def test_process_project_checkpoint_resumes_at_clusters(self, mock_env_vars):
+        """Test a project interrupted after its users only redoes the clusters."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
 
-                module.cleanup_project_clusters("project123", "test-project", auth)
+            project = {"id": "p1", "name": "old", "created": "2020-01-01T00:00:00Z"}
+            cutoff = module.CURRENT_DATE_UTC.strftime(module.ISO_UTC_FORMAT)
+            checkpoint = module.open_checkpoint(":memory:")
+            module.save_checkpoint(checkpoint, "p1", "resources")
+
+            with patch.object(
+                module, "cleanup_project_resources", return_value=(2, 0)
+            ) as mock_resources, patch.object(
+                module, "cleanup_project_clusters", return_value=(1, 0)
+            ) as mock_clusters:
+                module.process_project(project, cutoff, cutoff, checkpoint)
+
+                mock_resources.assert_not_called()
+                mock_clusters.assert_called_once_with("p1", "old")
+
+    def test_process_project_failed_deletion_is_error_and_not_checkpointed(
+        self, mock_env_vars
+    ):
+        """Test failed deletions are reported and left for --resume to retry."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            project = {"id": "p1", "name": "old", "created": "2020-01-01T00:00:00Z"}
+            cutoff = module.CURRENT_DATE_UTC.strftime(module.ISO_UTC_FORMAT)
+            checkpoint = module.open_checkpoint(":memory:")
+
+            with patch.object(
+                module, "cleanup_project_resources", return_value=(1, 1)
+            ), patch.object(module, "cleanup_project_clusters", return_value=(1, 0)):
+                result = module.process_project(project, cutoff, cutoff, checkpoint)
+
+                assert result == (1, 1, 1)
+                assert module.get_checkpoint(checkpoint, "p1") is None
 
 
 class TestMain:
@@ -422,7 +1049,7 @@ class TestMain:
 
                 for incorrect_confirmation in incorrect_confirmations:
                     with patch("builtins.input", return_value=incorrect_confirmation):
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             # If confirmation fails, main() should return early without making API calls
                             result = module.main()
                             assert result == 0, f"Should cancel with confirmation: '{incorrect_confirmation}'"
@@ -444,7 +1071,7 @@ class TestMain:
                 with patch(
                     "builtins.input", return_value="REAP PROJECTS OLDER THAN 90 DAYS"
                 ):
-                    with patch("requests.request") as mock_request:
+                    with patch("requests.Session.request") as mock_request:
                         mock_request.return_value = mock_response(
                             200, paginated_response_factory([])
                         )
@@ -462,13 +1089,60 @@ class TestMain:
                     result = module.main()
                     assert result == 1
 
-    def test_main_processes_old_projects(
+    def test_main_interrupt_cancels_queued_projects(
         self, mock_env_vars, mock_response, paginated_response_factory
+    ):
+        """Test Ctrl-C stops queued projects instead of waiting for all of them."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            old_date = (datetime.now(timezone.utc) - timedelta(days=150)).isoformat()
+            projects = [
+                {"id": f"p{i}", "name": f"project-{i}", "created": old_date}
+                for i in range(20)
+            ]
+            started = []
+
+            def process(project, *args):
+                started.append(project["id"])
+                # Hold the worker until the interrupt handler has run
+                module.SHUTDOWN_EVENT.wait(5)
+                return 1, 1, 0
+
+            with patch("sys.argv", ["cleanup_aged_projects_and_clusters.py", "--no-confirm"]):
+                with patch("requests.Session.request") as mock_request:
+                    mock_request.return_value = mock_response(
+                        200, paginated_response_factory(projects)
+                    )
+                    with patch.object(module, "MAX_PROJECT_WORKERS", 2), patch.object(
+                        module, "process_project", side_effect=process
+                    ), patch.object(module, "open_checkpoint"), patch.object(
+                        module, "as_completed", side_effect=KeyboardInterrupt
+                    ):
+                        result = module.main()
+
+            assert result == 1
+            assert module.SHUTDOWN_EVENT.is_set()
+            assert len(started) <= 2
+            with pytest.raises(RuntimeError):
+                module.DELETE_EXECUTOR.submit(print)
+
+    def test_main_processes_old_projects(
+        self,
+        mock_env_vars,
+        mock_response,
+        paginated_response_factory,
+        tmp_path,
+        monkeypatch,
     ):
         """Test main function processes old projects correctly."""
         with patch.dict(os.environ, mock_env_vars):
             import cleanup_aged_projects_and_clusters as module
 
+            # Keep the operator's --resume state out of the test run
+            checkpoint_db = tmp_path / "reaper_state.sqlite"
+            monkeypatch.setattr(module, "CHECKPOINT_DB", str(checkpoint_db))
+
             # Create an old project (older than 120 days)
             old_date = (datetime.now(timezone.utc) - timedelta(days=150)).isoformat()
             old_project = {
@@ -476,32 +1150,114 @@ class TestMain:
                 "name": "old-test-project",
                 "created": old_date,
             }
+            org_users = [{"id": "user1", "roles": [{"groupId": "other_project"}]}]
 
             with patch("sys.argv", ["cleanup_aged_projects_and_clusters.py"]):
                 with patch(
                     "builtins.input", return_value="REAP PROJECTS OLDER THAN 90 DAYS"
                 ):
-                    with patch("requests.request") as mock_request:
+                    with patch("requests.Session.request") as mock_request:
                         mock_request.side_effect = [
                             mock_response(200, paginated_response_factory([old_project])),
+                            mock_response(
+                                200, paginated_response_factory(org_users)
+                            ),  # org users
                             mock_response(200, []),  # group invitations
                             mock_response(200, paginated_response_factory([])),  # db users
-                            mock_response(
-                                200, paginated_response_factory([])
-                            ),  # atlas users
                             mock_response(200, paginated_response_factory([])),  # clusters
                         ]
 
                         result = module.main()
                         assert result == 0
+                        assert checkpoint_db.exists()
 
-    def test_main_with_no_confirm_flag(
+    def test_main_skips_pool_when_no_project_is_old_enough(
         self, mock_env_vars, mock_response, paginated_response_factory
+    ):
+        """Test a clean org costs only the project listing."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            recent = {
+                "id": "p1",
+                "name": "recent",
+                "created": datetime.now(timezone.utc).isoformat(),
+            }
+
+            with patch("sys.argv", ["cleanup_aged_projects_and_clusters.py"]):
+                with patch(
+                    "builtins.input", return_value="REAP PROJECTS OLDER THAN 90 DAYS"
+                ):
+                    with patch("requests.Session.request") as mock_request:
+                        mock_request.return_value = mock_response(
+                            200, paginated_response_factory([recent])
+                        )
+                        with patch.object(
+                            module, "process_project"
+                        ) as mock_process, patch.object(
+                            module, "open_checkpoint"
+                        ) as mock_checkpoint:
+                            result = module.main()
+
+                        assert result == 0
+                        assert mock_request.call_count == 1
+                        mock_process.assert_not_called()
+                        mock_checkpoint.assert_not_called()
+
+    def test_main_counts_crashed_project_as_error(
+        self,
+        mock_env_vars,
+        mock_response,
+        paginated_response_factory,
+        sample_projects,
+        tmp_path,
+        monkeypatch,
+    ):
+        """Test one project raising does not stop the others from being processed."""
+        with patch.dict(os.environ, mock_env_vars):
+            import cleanup_aged_projects_and_clusters as module
+
+            # Keep the operator's --resume state out of the test run
+            checkpoint_db = tmp_path / "reaper_state.sqlite"
+            monkeypatch.setattr(module, "CHECKPOINT_DB", str(checkpoint_db))
+
+            def process(project, *args):
+                if project["id"] == "project1":
+                    raise RuntimeError("boom")
+                return 1, 1, 0
+
+            with patch("sys.argv", ["cleanup_aged_projects_and_clusters.py"]):
+                with patch(
+                    "builtins.input", return_value="REAP PROJECTS OLDER THAN 90 DAYS"
+                ):
+                    with patch("requests.Session.request") as mock_request:
+                        mock_request.return_value = mock_response(
+                            200, paginated_response_factory(sample_projects)
+                        )
+                        with patch.object(
+                            module, "process_project", side_effect=process
+                        ) as mock_process:
+                            result = module.main()
+
+                        assert result == 1
+                        assert mock_process.call_count == 2
+
+    def test_main_with_no_confirm_flag(
+        self,
+        mock_env_vars,
+        mock_response,
+        paginated_response_factory,
+        tmp_path,
+        monkeypatch,
     ):
         """Test main function with --no-confirm flag skips confirmation."""
         with patch.dict(os.environ, mock_env_vars):
             import cleanup_aged_projects_and_clusters as module
 
+            # Keep the operator's --resume state out of the test run
+            checkpoint_db = tmp_path / "reaper_state.sqlite"
+            monkeypatch.setattr(module, "CHECKPOINT_DB", str(checkpoint_db))
+
             # Create an old project (older than 120 days)
             old_date = (datetime.now(timezone.utc) - timedelta(days=150)).isoformat()
             old_project = {
@@ -509,17 +1265,18 @@ class TestMain:
                 "name": "old-test-project",
                 "created": old_date,
             }
+            org_users = [{"id": "user1", "roles": [{"groupId": "other_project"}]}]
 
             with patch("sys.argv", ["cleanup_aged_projects_and_clusters.py", "--no-confirm"]):
                 with patch("builtins.input") as mock_input:
-                    with patch("requests.request") as mock_request:
+                    with patch("requests.Session.request") as mock_request:
                         mock_request.side_effect = [
                             mock_response(200, paginated_response_factory([old_project])),
+                            mock_response(
+                                200, paginated_response_factory(org_users)
+                            ),  # org users
                             mock_response(200, []),  # group invitations
                             mock_response(200, paginated_response_factory([])),  # db users
-                            mock_response(
-                                200, paginated_response_factory([])
-                            ),  # atlas users
                             mock_response(200, paginated_response_factory([])),  # clusters
                         ]
 
@@ -537,7 +1294,7 @@ class TestMain:
 
             with patch("sys.argv", ["cleanup_aged_projects_and_clusters.py", "--no-confirm"]):
                 with patch("builtins.input") as mock_input:
-                    with patch("requests.request") as mock_request:
+                    with patch("requests.Session.request") as mock_request:
                         mock_request.return_value = mock_response(
                             200, paginated_response_factory([])
                         )
@@ -595,3 +1352,22 @@ class TestModuleInitialization:
                     module.get_env_variable("ATLAS_PRIVATE_KEY") == "test_private_key"
                 )
                 assert module.get_env_variable("ATLAS_ORG_ID") == "test_org_id"
+
+    def test_log_records_written_by_background_listener(self, mock_env_vars):
+        """Test file and console handlers run on the queue listener thread."""
+        with patch.dict(os.environ, mock_env_vars):
+            import logging
+
+            import cleanup_aged_projects_and_clusters as module
+
+            handler_types = {type(h) for h in module.LOG_LISTENER.handlers}
+            assert handler_types == {logging.FileHandler, logging.StreamHandler}
+            assert module.LOG_LISTENER.queue is module.LOG_QUEUE
+            assert all(
+                h.formatter is module.LOG_FORMATTER
+                for h in module.LOG_LISTENER.handlers
+            )
+
+            # Records are enqueued as-is and formatted later by the listener
+            record = logging.LogRecord("x", logging.INFO, "f", 1, "a %s", ("b",), None)
+            assert module.RecordQueueHandler(module.LOG_QUEUE).prepare(record) is record
@@ -62,7 +62,7 @@ class TestMakeAtlasApiRequest:
                     with patch("delete_all_clusters_in_organization.ORGANIZATION_ID", "test_org_id"):
                         import delete_all_clusters_in_organization as module
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.return_value = mock_response(200, {"data": "test"})
                             
                             result = module.make_atlas_api_request("GET", "http://test.com")
@@ -84,7 +84,7 @@ class TestMakeAtlasApiRequest:
                     with patch("delete_all_clusters_in_organization.ORGANIZATION_ID", "test_org_id"):
                         import delete_all_clusters_in_organization as module
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.side_effect = requests.exceptions.RequestException("Error")
                             
                             result = module.make_atlas_api_request("GET", "http://test.com")
@@ -92,6 +92,31 @@ class TestMakeAtlasApiRequest:
                             assert result is None
 
 
+class TestProjectRateLimiter:
+    """Tests for the per-project request limiter."""
+
+    def test_waits_once_project_window_is_full(self):
+        """Test a full window blocks that project only until its oldest call expires."""
+        import delete_all_clusters_in_organization as module
+
+        limiter = module.ProjectRateLimiter(max_calls=2, period=60.0)
+        clock = [100.0]
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        with patch("time.monotonic", side_effect=lambda: clock[0]), patch(
+            "time.sleep", side_effect=sleep
+        ) as mock_sleep:
+            limiter.acquire("p1")
+            limiter.acquire("p1")
+            limiter.acquire("p2")  # Other projects have their own window
+            mock_sleep.assert_not_called()
+
+            limiter.acquire("p1")
+            mock_sleep.assert_called_once_with(60.0)
+
+
 class TestGetAllPaginatedProjects:
     """Tests for get_all_paginated_projects function."""
 
@@ -109,7 +134,7 @@ class TestGetAllPaginatedProjects:
                     with patch("delete_all_clusters_in_organization.ORGANIZATION_ID", "test_org_id"):
                         import delete_all_clusters_in_organization as module
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.return_value = mock_response(
                                 200, paginated_response_factory(sample_projects)
                             )
@@ -139,7 +164,7 @@ class TestGetAllPaginatedProjects:
                         page1 = [{"id": "p1", "name": "project1"}]
                         page2 = [{"id": "p2", "name": "project2"}]
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.side_effect = [
                                 mock_response(200, paginated_response_factory(page1, has_next=True)),
                                 mock_response(200, paginated_response_factory(page2, has_next=False)),
@@ -152,6 +177,9 @@ class TestGetAllPaginatedProjects:
                             result = module.get_all_paginated_projects("org123", auth, headers)
                             
                             assert len(result) == 2
+                            second_call = mock_request.call_args_list[1]
+                            assert second_call.args[1] == "http://example.com/next"
+                            assert second_call.kwargs["params"] is None
 
     def test_empty_projects(self, mock_response, paginated_response_factory):
         """Test handling empty project list."""
@@ -167,7 +195,7 @@ class TestGetAllPaginatedProjects:
                     with patch("delete_all_clusters_in_organization.ORGANIZATION_ID", "test_org_id"):
                         import delete_all_clusters_in_organization as module
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.return_value = mock_response(
                                 200, paginated_response_factory([])
                             )
@@ -180,6 +208,62 @@ class TestGetAllPaginatedProjects:
                             
                             assert len(result) == 0
 
+    def test_projects_decoded_with_orjson_when_installed(self, mock_response):
+        """Test page bodies are decoded from raw bytes by orjson when available."""
+        import json
+
+        fake_orjson = MagicMock()
+        fake_orjson.loads.side_effect = json.loads
+        env_vars = {
+            "ATLAS_PUBLIC_KEY": "test_public_key",
+            "ATLAS_PRIVATE_KEY": "test_private_key",
+            "ATLAS_ORG_ID": "test_org_id",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True), patch.dict(
+            sys.modules, {"orjson": fake_orjson}
+        ):
+            import delete_all_clusters_in_organization as module
+
+            with patch("requests.Session.request") as mock_request:
+                response = mock_response(200)
+                response.content = b'{"results": [{"id": "p1"}], "links": []}'
+                mock_request.return_value = response
+
+                result = module.get_all_paginated_projects("org123")
+
+                assert result == [{"id": "p1"}]
+                fake_orjson.loads.assert_called_once_with(response.content)
+                response.json.assert_not_called()
+
+    def test_iter_projects_yields_before_next_page(
+        self, mock_response, paginated_response_factory
+    ):
+        """Test that projects from the first page are yielded before page two is fetched."""
+        env_vars = {
+            "ATLAS_PUBLIC_KEY": "test_public_key",
+            "ATLAS_PRIVATE_KEY": "test_private_key",
+            "ATLAS_ORG_ID": "test_org_id",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            import delete_all_clusters_in_organization as module
+
+            with patch("requests.Session.request") as mock_request:
+                mock_request.side_effect = [
+                    mock_response(
+                        200, paginated_response_factory([{"id": "p1"}], has_next=True)
+                    ),
+                    mock_response(200, paginated_response_factory([{"id": "p2"}])),
+                ]
+
+                projects = module.iter_projects("org123")
+
+                assert next(projects) == {"id": "p1"}
+                assert mock_request.call_count == 1
+                assert list(projects) == [{"id": "p2"}]
+                assert mock_request.call_count == 2
+
 
 class TestGetAllPaginatedClusters:
     """Tests for cluster fetching with pagination responses."""
@@ -198,7 +282,7 @@ class TestGetAllPaginatedClusters:
                     with patch("delete_all_clusters_in_organization.ORGANIZATION_ID", "test_org_id"):
                         import delete_all_clusters_in_organization as module
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.side_effect = [
                                 mock_response(200, paginated_response_factory(sample_projects[:1])),
                                 mock_response(200, paginated_response_factory([])),  # Empty clusters
@@ -223,7 +307,7 @@ class TestGetAllPaginatedClusters:
                     with patch("delete_all_clusters_in_organization.ORGANIZATION_ID", "test_org_id"):
                         import delete_all_clusters_in_organization as module
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.side_effect = [
                                 mock_response(200, paginated_response_factory(sample_projects[:1])),
                                 mock_response(200, paginated_response_factory(sample_clusters[:1])),
@@ -252,7 +336,7 @@ class TestDeleteAllClustersInOrg:
                     with patch("delete_all_clusters_in_organization.ORGANIZATION_ID", "test_org_id"):
                         import delete_all_clusters_in_organization as module
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.side_effect = [
                                 # Get projects
                                 mock_response(200, paginated_response_factory(sample_projects[:1])),
@@ -298,7 +382,7 @@ class TestDeleteAllClustersInOrg:
                     with patch("delete_all_clusters_in_organization.ORGANIZATION_ID", "test_org_id"):
                         import delete_all_clusters_in_organization as module
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.return_value = mock_response(
                                 200, paginated_response_factory([])
                             )
@@ -321,7 +405,7 @@ class TestDeleteAllClustersInOrg:
                     with patch("delete_all_clusters_in_organization.ORGANIZATION_ID", "test_org_id"):
                         import delete_all_clusters_in_organization as module
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.side_effect = [
                                 # Get projects
                                 mock_response(200, paginated_response_factory(sample_projects[:1])),
@@ -341,6 +425,123 @@ class TestDeleteAllClustersInOrg:
                                 # When there are failures, it returns False
                                 assert result is False
 
+    def test_delete_clusters_concurrently_across_projects(
+        self, mock_response, sample_projects, sample_clusters, paginated_response_factory
+    ):
+        """Test every cluster in every project is deleted and failures are counted."""
+        env_vars = {
+            "ATLAS_PUBLIC_KEY": "test_public_key",
+            "ATLAS_PRIVATE_KEY": "test_private_key",
+            "ATLAS_ORG_ID": "test_org_id",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            import delete_all_clusters_in_organization as module
+
+            # Deletions run in parallel, so route by URL rather than call order
+            def route(method, url, **kwargs):
+                if url.endswith("/groups"):
+                    return mock_response(200, paginated_response_factory(sample_projects))
+                if method == "GET":
+                    return mock_response(200, paginated_response_factory(sample_clusters))
+                if url.endswith("project2/clusters/cluster-2"):
+                    return mock_response(500)
+                return mock_response(202)
+
+            with patch("requests.Session.request", side_effect=route) as mock_request:
+                result = module.delete_all_clusters_in_org("test_org")
+
+                assert result is False
+                deleted = sorted(
+                    call.args[1].rsplit("/groups/", 1)[1]
+                    for call in mock_request.call_args_list
+                    if call.args[0] == "DELETE"
+                )
+                assert deleted == [
+                    "project1/clusters/cluster-1",
+                    "project1/clusters/cluster-2",
+                    "project2/clusters/cluster-1",
+                    "project2/clusters/cluster-2",
+                ]
+                # Auth and headers live on the shared session, not on each call
+                assert isinstance(module.SESSION.auth, requests.auth.HTTPDigestAuth)
+                assert all(
+                    call.kwargs.get("auth") is None and call.kwargs.get("headers") is None
+                    for call in mock_request.call_args_list
+                )
+
+    def test_deletions_start_before_next_project_is_listed(
+        self, mock_response, sample_projects, sample_clusters, paginated_response_factory
+    ):
+        """Test a project's clusters are deleted while later projects are listed."""
+        env_vars = {
+            "ATLAS_PUBLIC_KEY": "test_public_key",
+            "ATLAS_PRIVATE_KEY": "test_private_key",
+            "ATLAS_ORG_ID": "test_org_id",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            import threading
+
+            import delete_all_clusters_in_organization as module
+
+            first_project_deleted = threading.Event()
+            overlapped = []
+
+            def route(method, url, **kwargs):
+                if url.endswith("/groups"):
+                    return mock_response(200, paginated_response_factory(sample_projects))
+                if method == "DELETE":
+                    if "/project1/" in url:
+                        first_project_deleted.set()
+                    return mock_response(202)
+                if "/project2/" in url:
+                    overlapped.append(first_project_deleted.wait(timeout=5))
+                return mock_response(200, paginated_response_factory(sample_clusters[:1]))
+
+            with patch("requests.Session.request", side_effect=route):
+                result = module.delete_all_clusters_in_org("test_org")
+
+            assert result is True
+            assert overlapped == [True]
+
+    def test_interrupt_cancels_queued_deletions(
+        self, mock_response, paginated_response_factory
+    ):
+        """Test Ctrl-C after a listing stops the queued DELETEs instead of sending them."""
+        env_vars = {
+            "ATLAS_PUBLIC_KEY": "test_public_key",
+            "ATLAS_PRIVATE_KEY": "test_private_key",
+            "ATLAS_ORG_ID": "test_org_id",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            import delete_all_clusters_in_organization as module
+
+            clusters = [{"name": f"cluster-{i}"} for i in range(20)]
+            deleted = []
+
+            def route(method, url, **kwargs):
+                if method == "DELETE":
+                    deleted.append(url)
+                    # Hold the worker until the interrupt handler has run
+                    module.SHUTDOWN_EVENT.wait(5)
+                    return mock_response(202)
+                if url.endswith("/groups"):
+                    return mock_response(
+                        200, paginated_response_factory([{"id": "p1", "name": "one"}])
+                    )
+                return mock_response(200, paginated_response_factory(clusters))
+
+            with patch("requests.Session.request", side_effect=route), patch.object(
+                module, "MAX_DELETE_WORKERS", 2
+            ), patch.object(module, "as_completed", side_effect=KeyboardInterrupt):
+                with pytest.raises(KeyboardInterrupt):
+                    module.delete_all_clusters_in_org("test_org")
+
+            assert module.SHUTDOWN_EVENT.is_set()
+            assert len(deleted) <= 2
+
     def test_delete_clusters_skips_missing_project_id(self, mock_response, paginated_response_factory):
         """Test skipping projects with missing ID."""
         env_vars = {
@@ -357,7 +558,7 @@ class TestDeleteAllClustersInOrg:
                         
                         projects_with_missing_id = [{"name": "no-id-project"}]
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.return_value = mock_response(
                                 200, paginated_response_factory(projects_with_missing_id)
                             )
@@ -367,6 +568,36 @@ class TestDeleteAllClustersInOrg:
                             # Should succeed as no clusters to delete
                             assert result is True
 
+    def test_delete_clusters_invalid_cluster_list_counts_failure(
+        self, mock_response, paginated_response_factory
+    ):
+        """Test an undecodable cluster list is recorded as a failure instead of crashing."""
+        env_vars = {
+            "ATLAS_PUBLIC_KEY": "test_public_key",
+            "ATLAS_PRIVATE_KEY": "test_private_key",
+            "ATLAS_ORG_ID": "test_org_id",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            import delete_all_clusters_in_organization as module
+
+            bad_clusters = mock_response(200)
+            bad_clusters.json.side_effect = ValueError("Expecting value")
+            bad_clusters.content = b"<html>"
+
+            with patch("requests.Session.request") as mock_request:
+                mock_request.side_effect = [
+                    mock_response(
+                        200, paginated_response_factory([{"id": "p1", "name": "one"}])
+                    ),
+                    bad_clusters,
+                ]
+
+                result = module.delete_all_clusters_in_org("test_org")
+
+                assert result is False
+                assert mock_request.call_count == 2
+
 
 class TestMain:
     """Tests for main function."""
@@ -404,7 +635,7 @@ class TestMain:
                         import delete_all_clusters_in_organization as module
                         
                         with patch("builtins.input", return_value="DELETE ALL CLUSTERS"):
-                            with patch("requests.request") as mock_request:
+                            with patch("requests.Session.request") as mock_request:
                                 mock_request.side_effect = [
                                     mock_response(200, paginated_response_factory(sample_projects[:1])),
                                     mock_response(200, paginated_response_factory(sample_clusters[:1])),
@@ -23,7 +23,7 @@ class TestAtlasAPI:
     def test_init_success(self, mock_env_vars, mock_response):
         """Test successful AtlasAPI initialization."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -35,6 +35,9 @@ class TestAtlasAPI:
                 assert api.org_id == "test_org_id"
                 assert api.public_key == "test_public_key"
                 assert api.private_key == "test_private_key"
+                # Auth is attached to the shared session once
+                assert isinstance(api.session.auth, requests.auth.HTTPDigestAuth)
+                assert "auth" not in mock_get.call_args.kwargs
 
     def test_init_missing_credentials(self):
         """Test AtlasAPI initialization with missing credentials."""
@@ -48,7 +51,7 @@ class TestAtlasAPI:
     def test_init_invalid_credentials(self, mock_env_vars):
         """Test AtlasAPI initialization with invalid credentials."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.side_effect = requests.exceptions.RequestException(
                     "Auth failed"
                 )
@@ -62,11 +65,12 @@ class TestAtlasAPI:
     def test_init_org_not_found(self, mock_env_vars, mock_response):
         """Test AtlasAPI initialization when org not found."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
-                # Return different org IDs
-                mock_get.return_value = mock_response(
-                    200, {"results": [{"id": "different_org_id"}]}
+            with patch("requests.Session.request") as mock_get:
+                not_found = mock_response(404, {"detail": "Not found"})
+                not_found.raise_for_status.side_effect = requests.exceptions.HTTPError(
+                    "404 Not Found", response=not_found
                 )
+                mock_get.return_value = not_found
 
                 from delete_empty_projects_in_organization import AtlasAPI
 
@@ -74,10 +78,23 @@ class TestAtlasAPI:
                     AtlasAPI()
                 assert "not found" in str(excinfo.value)
 
+    def test_init_looks_up_org_directly(self, mock_env_vars, mock_response):
+        """Test credentials are verified with one GET of the configured org."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("requests.Session.request") as mock_get:
+                mock_get.return_value = mock_response(200, {"id": "test_org_id"})
+
+                from delete_empty_projects_in_organization import AtlasAPI
+
+                AtlasAPI()
+
+                mock_get.assert_called_once()
+                assert mock_get.call_args.args[1].endswith("/orgs/test_org_id")
+
     def test_make_request_get(self, mock_env_vars, mock_response):
         """Test _make_request with GET method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -96,7 +113,7 @@ class TestAtlasAPI:
     def test_make_request_post(self, mock_env_vars, mock_response):
         """Test _make_request with POST method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -105,7 +122,7 @@ class TestAtlasAPI:
 
                 api = AtlasAPI()
 
-                with patch("requests.post") as mock_post:
+                with patch("requests.Session.request") as mock_post:
                     mock_post.return_value = mock_response(201, {"id": "new"})
                     result, success = api._make_request(
                         "post", "/test", {"name": "test"}
@@ -116,7 +133,7 @@ class TestAtlasAPI:
     def test_make_request_delete(self, mock_env_vars, mock_response):
         """Test _make_request with DELETE method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -125,17 +142,18 @@ class TestAtlasAPI:
 
                 api = AtlasAPI()
 
-                with patch("requests.delete") as mock_delete:
+                with patch("requests.Session.request") as mock_delete:
                     mock_delete.return_value = mock_response(204, {})
                     result, success = api._make_request("delete", "/test")
 
                     assert success is True
 
-    def test_make_request_with_retry(self, mock_env_vars, mock_response):
-        """Test _make_request retries on failure."""
+    def test_make_request_retries_through_session_adapter(
+        self, mock_env_vars, mock_response
+    ):
+        """Test transient errors are retried by the session's urllib3 Retry policy."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
-                # First call for init
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -144,24 +162,119 @@ class TestAtlasAPI:
 
                 api = AtlasAPI()
 
-                # Second call fails, third succeeds
-                mock_get.side_effect = [
-                    requests.exceptions.RequestException("Temp error"),
-                    mock_response(200, {"data": "test"}),
-                ]
+                retries = api.session.get_adapter("https://cloud.mongodb.com").max_retries
+                assert retries.total == 3
+                assert 429 in retries.status_forcelist
+                assert retries.respect_retry_after_header is True
 
-                with patch("time.sleep"):  # Skip sleep
-                    result, success = api._make_request("get", "/test", retry=1)
+                # An error that survives the adapter's retries fails immediately
+                mock_get.side_effect = requests.exceptions.RequestException("Error")
+                result, success = api._make_request("get", "/test")
 
-                    # Should succeed after retry
-                    assert success is True
+                assert success is False
+                assert mock_get.call_count == 2  # Init plus one failed call
+
+    def test_make_request_empty_body_returns_empty_dict(
+        self, mock_env_vars, mock_response
+    ):
+        """Test a 204 with no body succeeds without decoding JSON."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("requests.Session.request") as mock_request:
+                mock_request.return_value = mock_response(
+                    200, {"results": [{"id": "test_org_id"}]}
+                )
+
+                from delete_empty_projects_in_organization import AtlasAPI
+
+                api = AtlasAPI()
+
+                response = mock_response(204)
+                response.content = b""
+                mock_request.return_value = response
+
+                result, success = api._make_request("delete", "/groups/p1")
+
+                assert (result, success) == ({}, True)
+                response.json.assert_not_called()
+
+    def test_make_request_accepted_skips_body(self, mock_env_vars, mock_response):
+        """Test 202/204 responses succeed without decoding a body that is present."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("requests.Session.request") as mock_request:
+                mock_request.return_value = mock_response(
+                    200, {"results": [{"id": "test_org_id"}]}
+                )
+
+                from delete_empty_projects_in_organization import AtlasAPI
+
+                api = AtlasAPI()
+
+                for status in (202, 204):
+                    response = mock_response(status)
+                    response.content = b"{}"
+                    mock_request.return_value = response
+
+                    result, success = api._make_request("delete", "/groups/p1")
+
+                    assert (result, success) == ({}, True)
+                    response.json.assert_not_called()
+                    response.raise_for_status.assert_not_called()
+
+    def test_make_request_decodes_with_orjson_when_installed(
+        self, mock_env_vars, mock_response
+    ):
+        """Test response bodies are decoded from raw bytes by orjson when available."""
+        fake_orjson = MagicMock()
+        fake_orjson.loads.side_effect = json.loads
+        with patch.dict(os.environ, mock_env_vars), patch.dict(
+            sys.modules, {"orjson": fake_orjson}
+        ):
+            with patch("requests.Session.request") as mock_request:
+                response = mock_response(200)
+                response.content = b'{"results": [{"id": "test_org_id"}]}'
+                mock_request.return_value = response
+
+                from delete_empty_projects_in_organization import AtlasAPI
+
+                api = AtlasAPI()
+
+                fake_orjson.loads.assert_called_once_with(response.content)
+                response.json.assert_not_called()
+                assert api.org_id == "test_org_id"
+
+    def test_make_request_error_body_not_read_without_debug(
+        self, mock_env_vars, mock_response
+    ):
+        """Test an error response body is neither read nor logged at INFO level."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("requests.Session.request") as mock_request:
+                mock_request.return_value = mock_response(200, {"id": "test_org_id"})
+
+                from delete_empty_projects_in_organization import AtlasAPI
+
+                api = AtlasAPI()
+
+                failed = MagicMock()
+                failed.status_code = 500
+                failed.raise_for_status.side_effect = requests.exceptions.HTTPError(
+                    "500", response=failed
+                )
+                type(failed).text = property(
+                    lambda self: pytest.fail("response body was decoded")
+                )
+                mock_request.return_value = failed
+
+                result, success = api._make_request("get", "/test")
+
+                assert success is False
+                assert result["status_code"] == 500
 
     def test_get_projects_in_org(
         self, mock_env_vars, mock_response, sample_projects, paginated_response_factory
     ):
         """Test get_projects_in_org method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 # Init call
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
@@ -185,7 +298,7 @@ class TestAtlasAPI:
     ):
         """Test get_projects_in_org with multiple pages."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 # Init call
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
@@ -211,13 +324,46 @@ class TestAtlasAPI:
                 result = api.get_projects_in_org()
 
                 assert len(result) == 2
+                second_call = mock_get.call_args_list[-1]
+                assert second_call.args[1] == "http://example.com/next"
+                assert second_call.kwargs["params"] is None
+
+    def test_iter_projects_yields_before_next_page(
+        self, mock_env_vars, mock_response, paginated_response_factory
+    ):
+        """Test iter_projects yields the first page before fetching the next one."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("requests.Session.request") as mock_get:
+                # Init call
+                mock_get.return_value = mock_response(
+                    200, {"results": [{"id": "test_org_id"}]}
+                )
+
+                from delete_empty_projects_in_organization import AtlasAPI
+
+                api = AtlasAPI()
+                init_calls = mock_get.call_count
+
+                mock_get.side_effect = [
+                    mock_response(
+                        200, paginated_response_factory([{"id": "p1"}], has_next=True)
+                    ),
+                    mock_response(200, paginated_response_factory([{"id": "p2"}])),
+                ]
+
+                projects = api.iter_projects()
+
+                assert next(projects) == {"id": "p1"}
+                assert mock_get.call_count == init_calls + 1
+                assert list(projects) == [{"id": "p2"}]
+                assert mock_get.call_count == init_calls + 2
 
     def test_get_clusters_in_project(
         self, mock_env_vars, mock_response, sample_clusters, paginated_response_factory
     ):
         """Test get_clusters_in_project method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 # Init call
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
@@ -241,7 +387,7 @@ class TestAtlasAPI:
     ):
         """Test get_clusters_in_project with empty result."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -261,7 +407,7 @@ class TestAtlasAPI:
     def test_delete_project_success(self, mock_env_vars, mock_response):
         """Test delete_project method success."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -270,7 +416,7 @@ class TestAtlasAPI:
 
                 api = AtlasAPI()
 
-                with patch("requests.delete") as mock_delete:
+                with patch("requests.Session.request") as mock_delete:
                     mock_delete.return_value = mock_response(204, {})
 
                     result = api.delete_project("project123")
@@ -280,7 +426,7 @@ class TestAtlasAPI:
     def test_delete_project_failure(self, mock_env_vars, mock_response):
         """Test delete_project method failure."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -289,7 +435,7 @@ class TestAtlasAPI:
 
                 api = AtlasAPI()
 
-                with patch("requests.delete") as mock_delete:
+                with patch("requests.Session.request") as mock_delete:
                     mock_delete.side_effect = requests.exceptions.RequestException(
                         "Error"
                     )
@@ -305,7 +451,7 @@ class TestAtlasEmptyProjectsCleaner:
     def test_init(self, mock_env_vars, mock_response):
         """Test AtlasEmptyProjectsCleaner initialization."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -324,7 +470,7 @@ class TestAtlasEmptyProjectsCleaner:
     ):
         """Test delete_empty_projects in dry run mode."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 # Init call
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
@@ -355,7 +501,7 @@ class TestAtlasEmptyProjectsCleaner:
     ):
         """Test delete_empty_projects with actual deletion."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -372,15 +518,14 @@ class TestAtlasEmptyProjectsCleaner:
                     mock_response(
                         200, paginated_response_factory([])
                     ),  # Empty clusters
+                    mock_response(204, {}),  # Delete project
                 ]
 
-                with patch("requests.delete") as mock_delete:
-                    mock_delete.return_value = mock_response(204, {})
-
-                    cleaner.delete_empty_projects(dry_run=False)
+                cleaner.delete_empty_projects(dry_run=False)
 
-                    assert len(cleaner.deleted_projects) == 1
-                    assert cleaner.deleted_projects[0]["deleted"] is True
+                assert len(cleaner.deleted_projects) == 1
+                assert cleaner.deleted_projects[0]["deleted"] is True
+                assert mock_get.call_args.args[0] == "DELETE"
 
     def test_delete_empty_projects_skips_non_empty(
         self,
@@ -392,7 +537,7 @@ class TestAtlasEmptyProjectsCleaner:
     ):
         """Test that projects with clusters are skipped."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -415,10 +560,161 @@ class TestAtlasEmptyProjectsCleaner:
                 assert len(cleaner.skipped_projects) == 1
                 assert len(cleaner.deleted_projects) == 0
 
+    def test_delete_empty_projects_lists_clusters_concurrently(
+        self,
+        mock_env_vars,
+        mock_response,
+        sample_projects,
+        sample_clusters,
+        paginated_response_factory,
+    ):
+        """Test cluster counts fetched in parallel are matched to their projects."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("requests.Session.request") as mock_request:
+                mock_request.return_value = mock_response(
+                    200, {"results": [{"id": "test_org_id"}]}
+                )
+
+                from delete_empty_projects_in_organization import (
+                    AtlasEmptyProjectsCleaner,
+                )
+
+                cleaner = AtlasEmptyProjectsCleaner()
+
+                # Cluster listings run concurrently, so route by URL not call order
+                def route(method, url, **kwargs):
+                    if url.endswith("/groups"):
+                        return mock_response(
+                            200, paginated_response_factory(sample_projects)
+                        )
+                    if url.endswith("project1/clusters"):
+                        return mock_response(
+                            200, paginated_response_factory(sample_clusters)
+                        )
+                    return mock_response(200, paginated_response_factory([]))
+
+                mock_request.side_effect = route
+
+                cleaner.delete_empty_projects(dry_run=True)
+
+                assert cleaner.skipped_projects == [
+                    {"id": "project1", "name": "test-project-1", "cluster_count": 2}
+                ]
+                assert [p["id"] for p in cleaner.deleted_projects] == ["project2"]
+
+    def test_delete_empty_projects_uses_listed_cluster_count(
+        self, mock_env_vars, mock_response, paginated_response_factory
+    ):
+        """Test clusterCount from the project listing avoids per-project GETs."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("requests.Session.request") as mock_request:
+                mock_request.return_value = mock_response(
+                    200, {"results": [{"id": "test_org_id"}]}
+                )
+
+                from delete_empty_projects_in_organization import (
+                    AtlasEmptyProjectsCleaner,
+                )
+
+                cleaner = AtlasEmptyProjectsCleaner()
+
+                projects = [
+                    {"id": "p1", "name": "empty", "clusterCount": 0},
+                    {"id": "p2", "name": "busy", "clusterCount": 3},
+                ]
+                mock_request.reset_mock()
+                mock_request.return_value = mock_response(
+                    200, paginated_response_factory(projects)
+                )
+
+                cleaner.delete_empty_projects(dry_run=True)
+
+                assert mock_request.call_count == 1  # Only the project listing
+                assert [p["id"] for p in cleaner.deleted_projects] == ["p1"]
+                assert cleaner.skipped_projects[0]["cluster_count"] == 3
+
+    def test_delete_empty_projects_deletes_only_empty_ones_concurrently(
+        self, mock_env_vars, mock_response, paginated_response_factory
+    ):
+        """Test only empty projects are deleted and each gets its own result."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("requests.Session.request") as mock_request:
+                mock_request.return_value = mock_response(200, {"id": "test_org_id"})
+
+                from delete_empty_projects_in_organization import (
+                    AtlasEmptyProjectsCleaner,
+                )
+
+                cleaner = AtlasEmptyProjectsCleaner()
+
+                projects = [
+                    {"id": "p1", "name": "empty-1", "clusterCount": 0},
+                    {"id": "p2", "name": "busy", "clusterCount": 1},
+                    {"id": "p3", "name": "empty-2", "clusterCount": 0},
+                ]
+
+                def route(method, url, **kwargs):
+                    if method == "GET":
+                        return mock_response(200, paginated_response_factory(projects))
+                    if url.endswith("/p3"):
+                        failed = mock_response(500)
+                        failed.raise_for_status.side_effect = (
+                            requests.exceptions.HTTPError("500", response=failed)
+                        )
+                        return failed
+                    return mock_response(204)
+
+                mock_request.side_effect = route
+
+                cleaner.delete_empty_projects(dry_run=False)
+
+                deleted_urls = sorted(
+                    call.args[1]
+                    for call in mock_request.call_args_list
+                    if call.args[0] == "DELETE"
+                )
+                assert [url.rsplit("/", 1)[1] for url in deleted_urls] == ["p1", "p3"]
+                assert [(p["id"], p["reason"]) for p in cleaner.deleted_projects] == [
+                    ("p1", "success"),
+                    ("p3", "api_error"),
+                ]
+
+    def test_delete_empty_projects_interrupt_cancels_queued_deletions(
+        self, mock_env_vars, mock_response
+    ):
+        """Test Ctrl-C stops queued deletions instead of running them all."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("requests.Session.request") as mock_request:
+                mock_request.return_value = mock_response(200, {"id": "test_org_id"})
+
+                import delete_empty_projects_in_organization as module
+
+                cleaner = module.AtlasEmptyProjectsCleaner()
+
+                projects = [
+                    {"id": f"p{i}", "name": f"empty-{i}", "clusterCount": 0}
+                    for i in range(20)
+                ]
+                deleted = []
+
+                def delete_project(project_id):
+                    deleted.append(project_id)
+                    if project_id == "p0":
+                        raise KeyboardInterrupt
+                    return True
+
+                with patch.object(module, "MAX_PROJECT_WORKERS", 1), patch.object(
+                    cleaner.api, "iter_projects", return_value=iter(projects)
+                ), patch.object(cleaner.api, "delete_project", side_effect=delete_project):
+                    with pytest.raises(KeyboardInterrupt):
+                        cleaner.delete_empty_projects(dry_run=False)
+
+                assert len(deleted) <= 2
+
     def test_generate_report(self, mock_env_vars, mock_response, tmp_path):
         """Test generate_report method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -455,6 +751,37 @@ class TestAtlasEmptyProjectsCleaner:
                 assert report["summary"]["empty_projects_found"] == 1
                 assert report["summary"]["successful_deletions"] == 1
 
+    def test_generate_report_written_with_orjson_when_installed(
+        self, mock_env_vars, mock_response
+    ):
+        """Test the report is serialized once by orjson and written as bytes."""
+        fake_orjson = MagicMock()
+        fake_orjson.dumps.return_value = b"{}"
+        with patch.dict(os.environ, mock_env_vars), patch.dict(
+            sys.modules, {"orjson": fake_orjson}
+        ):
+            with patch("requests.Session.request") as mock_get:
+                response = mock_response(200)
+                response.content = b'{"id": "test_org_id"}'
+                fake_orjson.loads.return_value = {"id": "test_org_id"}
+                mock_get.return_value = response
+
+                from delete_empty_projects_in_organization import (
+                    AtlasEmptyProjectsCleaner,
+                )
+
+                cleaner = AtlasEmptyProjectsCleaner()
+
+                with patch("builtins.open", mock_open()) as mock_file:
+                    report = cleaner.generate_report()
+
+                fake_orjson.dumps.assert_called_once()
+                assert fake_orjson.dumps.call_args.args[0] == report
+                mock_file.assert_called_once_with(
+                    "logs/atlas_empty_projects_report.json", "wb"
+                )
+                mock_file().write.assert_called_once_with(b"{}")
+
 
 class TestValidateCredentials:
     """Tests for validate_credentials function."""
@@ -485,7 +812,7 @@ class TestMain:
     ):
         """Test main function in dry run mode."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -507,7 +834,7 @@ class TestMain:
     def test_main_cancelled(self, mock_env_vars, mock_response):
         """Test main function when user cancels."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -522,7 +849,7 @@ class TestMain:
     def test_main_keyboard_interrupt(self, mock_env_vars, mock_response):
         """Test main function handles KeyboardInterrupt."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -585,7 +912,7 @@ class TestModuleInitialization:
                 ), "load_dotenv() should be called at module level during import"
 
                 # Now instantiate - should work because env vars are in os.environ
-                with patch("requests.get") as mock_get:
+                with patch("requests.Session.request") as mock_get:
                     mock_get.return_value = mock_response(
                         200, {"results": [{"id": "test_org_id"}]}
                     )
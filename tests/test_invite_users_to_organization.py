@@ -8,6 +8,7 @@ This module tests the user invitation functionality including:
 - User invitation process
 """
 
+import json
 import logging
 import os
 import sys
@@ -94,6 +95,22 @@ class TestLoadEmailsFromCsv:
                         assert email == email.strip()
 
 
+    def test_iter_emails_streams_rows(self, temp_csv_file):
+        """Test that emails are yielded lazily from the CSV."""
+        csv_path = temp_csv_file(["user1@example.com", "", " user2@example.com "])
+
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_key",
+            "ATLAS_ORG_ID": "test_org"
+        }):
+            from invite_users_to_organization import iter_emails_from_csv
+
+            emails = iter_emails_from_csv(csv_path)
+
+            assert next(emails) == "user1@example.com"
+            assert list(emails) == ["user2@example.com"]
+
 class TestValidateEmail:
     """Tests for validate_email function."""
 
@@ -175,6 +192,71 @@ class TestValidateAtlasCredentials:
             invite_users_to_organization.validate_atlas_credentials()
         assert "ATLAS_PUBLIC_KEY" in str(excinfo.value)
 
+    def test_validate_service_account_without_keys(self):
+        """Test that service account credentials replace the API keys."""
+        import invite_users_to_organization
+
+        invite_users_to_organization.PUBLIC_KEY = None
+        invite_users_to_organization.PRIVATE_KEY = None
+        invite_users_to_organization.CLIENT_ID = "client_id"
+        invite_users_to_organization.CLIENT_SECRET = "client_secret"
+        invite_users_to_organization.ORGANIZATION_ID = "test_org"
+
+        # Should not raise
+        invite_users_to_organization.validate_atlas_credentials()
+
+
+class TestServiceAccountAuth:
+    """Tests for service account bearer token auth."""
+
+    def test_session_uses_bearer_auth_when_configured(self):
+        """Test the shared session authenticates with a bearer token, not Digest."""
+        with patch.dict(os.environ, {
+            "ATLAS_CLIENT_ID": "client_id",
+            "ATLAS_CLIENT_SECRET": "client_secret",
+            "ATLAS_ORG_ID": "test_org"
+        }):
+            import invite_users_to_organization
+
+            assert isinstance(
+                invite_users_to_organization.SESSION.auth,
+                invite_users_to_organization.BearerAuth,
+            )
+
+    def test_token_cached_until_near_expiry(self, mock_response):
+        """Test the token is fetched once and refreshed shortly before it expires."""
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_key",
+            "ATLAS_ORG_ID": "test_org"
+        }):
+            import invite_users_to_organization
+
+            auth = invite_users_to_organization.BearerAuth("client_id", "client_secret")
+            clock = [1000.0]
+
+            with patch("requests.Session.request") as mock_request, patch(
+                "time.monotonic", side_effect=lambda: clock[0]
+            ):
+                mock_request.side_effect = [
+                    mock_response(200, {"access_token": "token1", "expires_in": 3600}),
+                    mock_response(200, {"access_token": "token2", "expires_in": 3600}),
+                ]
+
+                first = auth(requests.Request("GET", "https://example.com").prepare())
+                second = auth(requests.Request("GET", "https://example.com").prepare())
+                clock[0] += 3550
+                third = auth(requests.Request("GET", "https://example.com").prepare())
+
+                assert first.headers["Authorization"] == "Bearer token1"
+                assert second.headers["Authorization"] == "Bearer token1"
+                assert third.headers["Authorization"] == "Bearer token2"
+                assert mock_request.call_count == 2
+                token_call = mock_request.call_args_list[0]
+                assert token_call.args[0] == "POST"
+                assert token_call.args[1] == invite_users_to_organization.ATLAS_OAUTH_TOKEN_URL
+                assert token_call.kwargs["data"] == {"grant_type": "client_credentials"}
+
 
 class TestMakeAtlasApiRequest:
     """Tests for make_atlas_api_request function."""
@@ -191,7 +273,7 @@ class TestMakeAtlasApiRequest:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     mock_request.return_value = mock_response(200, {"data": "test"})
                     
                     result = invite_users_to_organization.make_atlas_api_request(
@@ -213,7 +295,7 @@ class TestMakeAtlasApiRequest:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     mock_request.side_effect = requests.exceptions.RequestException("Error")
                     
                     result = invite_users_to_organization.make_atlas_api_request(
@@ -222,6 +304,32 @@ class TestMakeAtlasApiRequest:
                     
                     assert result is None
 
+    def test_requests_share_authenticated_session(self, mock_response):
+        """Test requests go through one pooled session with Digest auth preset."""
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_secret",
+            "ATLAS_ORG_ID": "test_org"
+        }):
+            with patch("builtins.open", mock_open(read_data="")):
+                import invite_users_to_organization
+
+                session = invite_users_to_organization.SESSION
+                assert isinstance(session.auth, requests.auth.HTTPDigestAuth)
+                assert session.auth.username == "test_key"
+                assert session.auth.password == "test_secret"
+                assert session.get_adapter("https://cloud.mongodb.com")._pool_maxsize == 16
+
+                with patch("requests.Session.request") as mock_request:
+                    mock_request.return_value = mock_response(201)
+
+                    invite_users_to_organization.invite_users_to_org(
+                        "test_org", ["user@example.com"]
+                    )
+
+                    for call in mock_request.call_args_list:
+                        assert "auth" not in call.kwargs
+
 
 class TestInviteUsersToOrg:
     """Tests for invite_users_to_org function."""
@@ -238,7 +346,7 @@ class TestInviteUsersToOrg:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     mock_request.return_value = mock_response(200)
                     
                     result = invite_users_to_organization.invite_users_to_org(
@@ -293,7 +401,7 @@ class TestInviteUsersToOrg:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     mock_request.return_value = mock_response(200)
                     
                     # Include invalid email
@@ -316,7 +424,7 @@ class TestInviteUsersToOrg:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     mock_request.side_effect = requests.exceptions.RequestException("Error")
                     
                     result = invite_users_to_organization.invite_users_to_org(
@@ -337,7 +445,7 @@ class TestInviteUsersToOrg:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     # Mock get_existing_org_users to return empty set (no existing users)
                     with patch.object(
                         invite_users_to_organization,
@@ -361,6 +469,160 @@ class TestInviteUsersToOrg:
                         assert mock_request.call_count == 3
 
 
+    def test_invite_from_generator(self, mock_response):
+        """Test that invitations can be fed from a lazy iterator."""
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_key",
+            "ATLAS_ORG_ID": "test_org"
+        }):
+            with patch("builtins.open", mock_open(read_data="")):
+                import invite_users_to_organization
+
+                with patch.object(
+                    invite_users_to_organization,
+                    "get_existing_org_users",
+                    return_value=set(),
+                ), patch("requests.Session.request") as mock_request:
+                    mock_request.return_value = mock_response(201)
+
+                    emails = (f"user{i}@example.com" for i in range(3))
+                    result = invite_users_to_organization.invite_users_to_org(
+                        "org123", emails
+                    )
+
+                    assert result is True
+                    assert mock_request.call_count == 3
+
+    def test_invite_empty_generator(self):
+        """Test that an empty iterator returns early without fetching users."""
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_key",
+            "ATLAS_ORG_ID": "test_org"
+        }):
+            with patch("builtins.open", mock_open(read_data="")):
+                import invite_users_to_organization
+
+                with patch.object(
+                    invite_users_to_organization, "get_existing_org_users"
+                ) as mock_get_users:
+                    result = invite_users_to_organization.invite_users_to_org(
+                        "org123", iter([])
+                    )
+
+                    assert result is True
+                    mock_get_users.assert_not_called()
+
+    def test_invite_only_invalid_emails_skips_users_fetch(self):
+        """Test that input with no valid addresses fails without fetching org users."""
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_key",
+            "ATLAS_ORG_ID": "test_org"
+        }):
+            with patch("builtins.open", mock_open(read_data="")):
+                import invite_users_to_organization
+
+                with patch.object(
+                    invite_users_to_organization, "get_existing_org_users"
+                ) as mock_get_users, patch("requests.Session.request") as mock_request:
+                    result = invite_users_to_organization.invite_users_to_org(
+                        "org123", ["not-an-email", "NOT-AN-EMAIL"]
+                    )
+
+                    assert result is False
+                    mock_get_users.assert_not_called()
+                    mock_request.assert_not_called()
+
+    def test_duplicate_emails_invited_once(self, mock_response):
+        """Test that repeated addresses (any case) are only invited once."""
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_key",
+            "ATLAS_ORG_ID": "test_org"
+        }):
+            with patch("builtins.open", mock_open(read_data="")):
+                import invite_users_to_organization
+
+                with patch.object(
+                    invite_users_to_organization,
+                    "get_existing_org_users",
+                    return_value=frozenset(),
+                ), patch("requests.Session.request") as mock_request:
+                    mock_request.return_value = mock_response(201)
+
+                    result = invite_users_to_organization.invite_users_to_org(
+                        "org123",
+                        ["user@example.com", "USER@example.com", "user@example.com"],
+                    )
+
+                    assert result is True
+                    assert mock_request.call_count == 1
+
+    def test_invites_sent_concurrently(self, mock_response):
+        """Test that a burst of invitations is sent from several workers at once."""
+        import threading
+
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_key",
+            "ATLAS_ORG_ID": "test_org"
+        }):
+            with patch("builtins.open", mock_open(read_data="")):
+                import invite_users_to_organization
+
+                both_in_flight = threading.Barrier(2, timeout=5)
+
+                def fake_request(method, url, **kwargs):
+                    # Each POST only returns once the other one is also in flight
+                    both_in_flight.wait()
+                    return mock_response(201)
+
+                with patch.object(
+                    invite_users_to_organization,
+                    "get_existing_org_users",
+                    return_value=set(),
+                ), patch("requests.Session.request", side_effect=fake_request):
+                    result = invite_users_to_organization.invite_users_to_org(
+                        "org123", ["user1@example.com", "user2@example.com"]
+                    )
+
+                    assert result is True
+
+    def test_interrupt_cancels_queued_invitations(self, mock_response):
+        """Test Ctrl-C stops queued invitations instead of sending them all."""
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_key",
+            "ATLAS_ORG_ID": "test_org"
+        }):
+            with patch("builtins.open", mock_open(read_data="")):
+                import invite_users_to_organization as module
+
+                sent = []
+
+                def fake_request(method, url, **kwargs):
+                    sent.append(kwargs["json"]["username"])
+                    # Hold the worker until the interrupt handler has run
+                    module.SHUTDOWN_EVENT.wait(5)
+                    return mock_response(201)
+
+                emails = [f"user{i}@example.com" for i in range(30)]
+
+                with patch.object(
+                    module, "get_existing_org_users", return_value=set()
+                ), patch("requests.Session.request", side_effect=fake_request), patch.object(
+                    module, "MAX_INVITE_WORKERS", 2
+                ), patch.object(
+                    module, "as_completed", side_effect=KeyboardInterrupt
+                ):
+                    with pytest.raises(KeyboardInterrupt):
+                        module.invite_users_to_org("org123", emails)
+
+                assert module.SHUTDOWN_EVENT.is_set()
+                assert len(sent) <= 2
+
 class TestMain:
     """Tests for main function."""
 
@@ -376,7 +638,7 @@ class TestMain:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch.object(invite_users_to_organization, "EMAILS_TO_PROVISION", []):
+                with patch.object(invite_users_to_organization, "iter_emails_from_csv", return_value=iter([])):
                     result = invite_users_to_organization.main()
                     assert result == 0
 
@@ -392,7 +654,7 @@ class TestMain:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch.object(invite_users_to_organization, "EMAILS_TO_PROVISION", ["user@example.com"]):
+                with patch.object(invite_users_to_organization, "iter_emails_from_csv", return_value=iter(["user@example.com"])):
                     with patch("sys.argv", ["invite_users_to_organization.py"]):
                         with patch("builtins.input", return_value="n"):
                             result = invite_users_to_organization.main()
@@ -410,10 +672,10 @@ class TestMain:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch.object(invite_users_to_organization, "EMAILS_TO_PROVISION", ["user@example.com"]):
+                with patch.object(invite_users_to_organization, "iter_emails_from_csv", return_value=iter(["user@example.com"])):
                     with patch("sys.argv", ["invite_users_to_organization.py"]):
                         with patch("builtins.input", return_value="y"):
-                            with patch("requests.request") as mock_request:
+                            with patch("requests.Session.request") as mock_request:
                                 mock_request.return_value = mock_response(200)
                                 
                                 result = invite_users_to_organization.main()
@@ -431,10 +693,10 @@ class TestMain:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch.object(invite_users_to_organization, "EMAILS_TO_PROVISION", ["user@example.com"]):
+                with patch.object(invite_users_to_organization, "iter_emails_from_csv", return_value=iter(["user@example.com"])):
                     with patch("sys.argv", ["invite_users_to_organization.py", "--no-confirm"]):
                         with patch("builtins.input") as mock_input:
-                            with patch("requests.request") as mock_request:
+                            with patch("requests.Session.request") as mock_request:
                                 mock_request.return_value = mock_response(200)
                                 
                                 result = invite_users_to_organization.main()
@@ -442,6 +704,82 @@ class TestMain:
                                 # Verify input was never called when --no-confirm is used
                                 mock_input.assert_not_called()
 
+    def test_main_yes_flag_skips_prompt_and_lists_users(self, capsys):
+        """Test that --yes skips the prompt and the preview lists every address."""
+        import invite_users_to_organization
+
+        invite_users_to_organization.PUBLIC_KEY = "test_key"
+        invite_users_to_organization.PRIVATE_KEY = "test_key"
+        invite_users_to_organization.ORGANIZATION_ID = "test_org"
+
+        emails = ["user1@example.com", "user2@example.com"]
+        with patch.object(invite_users_to_organization, "iter_emails_from_csv", return_value=iter(emails)):
+            with patch("sys.argv", ["invite_users_to_organization.py", "--yes"]):
+                with patch("builtins.input") as mock_input:
+                    with patch.object(
+                        invite_users_to_organization, "invite_users_to_org", return_value=True
+                    ) as mock_invite:
+                        result = invite_users_to_organization.main()
+
+                        assert result == 0
+                        mock_input.assert_not_called()
+                        mock_invite.assert_called_once()
+                        assert mock_invite.call_args.args[0] == "test_org"
+                        assert list(mock_invite.call_args.args[1]) == emails
+                        output = capsys.readouterr().out
+                        assert "Users to invite:\n  - user1@example.com\n  - user2@example.com\n" in output
+
+    def test_main_streams_csv_past_the_preview(self, capsys):
+        """Test that main reads only the preview before the invites start."""
+        import invite_users_to_organization
+
+        invite_users_to_organization.PUBLIC_KEY = "test_key"
+        invite_users_to_organization.PRIVATE_KEY = "test_key"
+        invite_users_to_organization.ORGANIZATION_ID = "test_org"
+
+        limit = invite_users_to_organization.INVITEE_PREVIEW_LIMIT
+        emails = [f"user{i}@example.com" for i in range(limit + 5)]
+        rows_read = []
+
+        def fake_rows(csv_file_path):
+            for email in emails:
+                rows_read.append(email)
+                yield email
+
+        def fake_invite(org_id, invitees):
+            # Only the preview (plus one look-ahead row) is read before inviting
+            assert len(rows_read) == limit + 1
+            assert list(invitees) == emails
+            return True
+
+        with patch.object(invite_users_to_organization, "iter_emails_from_csv", side_effect=fake_rows):
+            with patch("sys.argv", ["invite_users_to_organization.py", "--yes"]):
+                with patch.object(
+                    invite_users_to_organization, "invite_users_to_org", side_effect=fake_invite
+                ) as mock_invite:
+                    result = invite_users_to_organization.main()
+
+        assert result == 0
+        mock_invite.assert_called_once()
+        output = capsys.readouterr().out
+        assert f"  - user{limit - 1}@example.com\n  - ...and more\n" in output
+        assert f"user{limit}@example.com" not in output
+
+    def test_main_missing_csv(self):
+        """Test that a missing invitees.csv is reported on the first read."""
+        import invite_users_to_organization
+
+        invite_users_to_organization.PUBLIC_KEY = "test_key"
+        invite_users_to_organization.PRIVATE_KEY = "test_key"
+        invite_users_to_organization.ORGANIZATION_ID = "test_org"
+
+        with patch("builtins.open", side_effect=FileNotFoundError):
+            with patch.object(invite_users_to_organization, "invite_users_to_org") as mock_invite:
+                result = invite_users_to_organization.main()
+
+        assert result == 1
+        mock_invite.assert_not_called()
+
     def test_main_keyboard_interrupt(self):
         """Test main function handles KeyboardInterrupt."""
         import invite_users_to_organization
@@ -451,8 +789,8 @@ class TestMain:
         invite_users_to_organization.PRIVATE_KEY = "test_key"
         invite_users_to_organization.ORGANIZATION_ID = "test_org"
         
-        # Mock load_emails_from_csv to return test emails and load_dotenv to do nothing
-        with patch.object(invite_users_to_organization, "load_emails_from_csv", return_value=["user@example.com"]):
+        # Mock iter_emails_from_csv to return test emails and load_dotenv to do nothing
+        with patch.object(invite_users_to_organization, "iter_emails_from_csv", return_value=iter(["user@example.com"])):
             with patch.object(invite_users_to_organization, "load_dotenv"):
                 with patch("sys.argv", ["invite_users_to_organization.py"]):
                     with patch("builtins.input", side_effect=KeyboardInterrupt):
@@ -468,8 +806,8 @@ class TestMain:
         invite_users_to_organization.PRIVATE_KEY = "test_key"
         invite_users_to_organization.ORGANIZATION_ID = "test_org"
         
-        # Mock load_emails_from_csv to return test emails and load_dotenv to do nothing
-        with patch.object(invite_users_to_organization, "load_emails_from_csv", return_value=["user@example.com"]):
+        # Mock iter_emails_from_csv to return test emails and load_dotenv to do nothing
+        with patch.object(invite_users_to_organization, "iter_emails_from_csv", return_value=iter(["user@example.com"])):
             with patch.object(invite_users_to_organization, "load_dotenv"):
                 with patch("sys.argv", ["invite_users_to_organization.py"]):
                     with patch("builtins.input", return_value="y"):
@@ -556,8 +894,8 @@ class TestRateLimiting:
                 
                 assert invite_users_to_organization.RATE_LIMIT_DELAY_SECONDS == 10.5
 
-    def test_delay_applied_between_requests(self, mock_response):
-        """Test that delay is applied between invitation requests."""
+    def test_burst_within_window_is_not_delayed(self, mock_response):
+        """Test that invitations within the rate limit window are sent without waiting."""
         with patch.dict(os.environ, {
             "ATLAS_PUBLIC_KEY": "test_key",
             "ATLAS_PRIVATE_KEY": "test_key",
@@ -568,7 +906,7 @@ class TestRateLimiting:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     mock_request.return_value = mock_response(200)
                     with patch("time.sleep") as mock_sleep:
                         emails = ["user1@example.com", "user2@example.com", "user3@example.com"]
@@ -577,11 +915,40 @@ class TestRateLimiting:
                             "org123", emails
                         )
                         
-                        # Should sleep 2 times (between 3 emails, skip last)
-                        assert mock_sleep.call_count == 2
-                        # Each sleep should be the rate limit delay
-                        for call in mock_sleep.call_args_list:
-                            assert call[0][0] == 6.0
+                        mock_sleep.assert_not_called()
+                        assert result is True
+
+    def test_delay_applied_once_window_is_full(self, mock_response):
+        """Test that the eleventh invitation waits for the rate limit window to slide."""
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_key",
+            "ATLAS_ORG_ID": "test_org"
+        }):
+            with patch("builtins.open", mock_open(read_data="")):
+                import importlib
+                import invite_users_to_organization
+                importlib.reload(invite_users_to_organization)
+
+                clock = [1000.0]
+
+                def fake_sleep(seconds):
+                    clock[0] += seconds
+
+                with patch("requests.Session.request") as mock_request:
+                    mock_request.return_value = mock_response(200)
+                    with patch("time.monotonic", side_effect=lambda: clock[0]), patch(
+                        "time.sleep", side_effect=fake_sleep
+                    ) as mock_sleep:
+                        emails = [f"user{i}@example.com" for i in range(11)]
+
+                        result = invite_users_to_organization.invite_users_to_org(
+                            "org123", emails
+                        )
+
+                        # 10 invitations per 60 second window by default
+                        assert mock_sleep.call_count == 1
+                        assert mock_sleep.call_args_list[0][0][0] == 60.0
                         assert result is True
 
     def test_no_delay_after_last_email(self, mock_response):
@@ -596,7 +963,7 @@ class TestRateLimiting:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     mock_request.return_value = mock_response(200)
                     with patch("time.sleep") as mock_sleep:
                         # Single email - no delay should be applied
@@ -619,7 +986,7 @@ class TestRateLimiting:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     # First two attempts return 429, third succeeds
                     mock_request.side_effect = [
                         mock_response(429),
@@ -652,7 +1019,7 @@ class TestRateLimiting:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     # Create response with Retry-After header
                     response_429 = mock_response(429)
                     response_429.headers = {"Retry-After": "5"}
@@ -684,7 +1051,7 @@ class TestRateLimiting:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     # All attempts return 429
                     mock_request.return_value = mock_response(429)
                     with patch("time.sleep") as mock_sleep:
@@ -713,7 +1080,7 @@ class TestRateLimiting:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     # First attempt raises exception with 429 response, second succeeds
                     error = requests.exceptions.HTTPError("Rate limited")
                     error.response = mock_response(429)
@@ -743,7 +1110,7 @@ class TestRateLimiting:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     mock_request.side_effect = requests.exceptions.RequestException("Connection error")
                     
                     with patch("time.sleep") as mock_sleep:
@@ -769,21 +1136,103 @@ class TestRateLimiting:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                clock = [1000.0]
+
+                def fake_sleep(seconds):
+                    clock[0] += seconds
+
+                with patch("requests.Session.request") as mock_request:
                     mock_request.return_value = mock_response(200)
-                    with patch("time.sleep") as mock_sleep:
-                        emails = ["user1@example.com", "user2@example.com"]
-                        
+                    with patch("time.monotonic", side_effect=lambda: clock[0]), patch(
+                        "time.sleep", side_effect=fake_sleep
+                    ) as mock_sleep:
+                        emails = [f"user{i}@example.com" for i in range(11)]
+
                         result = invite_users_to_organization.invite_users_to_org(
                             "org123", emails
                         )
-                        
-                        # Should use the configured delay from environment
+
+                        # Window is 10 invitations x the configured delay
                         assert mock_sleep.call_count == 1
-                        assert mock_sleep.call_args_list[0][0][0] == 3.5
+                        assert mock_sleep.call_args_list[0][0][0] == 35.0
                         assert result is True
 
 
+    def test_server_budget_replaces_local_window(self, mock_response):
+        """Test that rate limit headers with budget left let invitations go out without waiting."""
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_key",
+            "ATLAS_ORG_ID": "test_org"
+        }):
+            import invite_users_to_organization
+
+            limiter = invite_users_to_organization.RateLimiter(1, 60.0)
+            response = mock_response(201)
+            response.headers = {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "30"}
+
+            with patch("time.sleep") as mock_sleep:
+                limiter.acquire()
+                limiter.after_response(response)
+                limiter.acquire()
+
+                mock_sleep.assert_not_called()
+
+    def test_exhausted_server_budget_waits_for_reset(self, mock_response):
+        """Test that X-RateLimit-Remaining of 0 waits until X-RateLimit-Reset."""
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_key",
+            "ATLAS_ORG_ID": "test_org"
+        }):
+            import invite_users_to_organization
+
+            limiter = invite_users_to_organization.RateLimiter(10, 60.0)
+            response = mock_response(201)
+            response.headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "12"}
+            clock = [1000.0]
+
+            def fake_sleep(seconds):
+                clock[0] += seconds
+
+            with patch("time.monotonic", side_effect=lambda: clock[0]), patch(
+                "time.sleep", side_effect=fake_sleep
+            ) as mock_sleep:
+                limiter.after_response(response)
+                limiter.acquire()
+
+                mock_sleep.assert_called_once_with(12.0)
+
+    def test_server_budget_spent_locally_between_responses(self, mock_response):
+        """Test a reported budget of 1 lets one invitation through, not every worker."""
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_key",
+            "ATLAS_ORG_ID": "test_org"
+        }):
+            import invite_users_to_organization
+
+            limiter = invite_users_to_organization.RateLimiter(10, 60.0)
+            response = mock_response(201)
+            response.headers = {"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "30"}
+            stale = mock_response(201)
+            stale.headers = {"X-RateLimit-Remaining": "4", "X-RateLimit-Reset": "30"}
+            clock = [1000.0]
+
+            def fake_sleep(seconds):
+                clock[0] += seconds
+
+            with patch("time.monotonic", side_effect=lambda: clock[0]), patch(
+                "time.sleep", side_effect=fake_sleep
+            ) as mock_sleep:
+                limiter.after_response(response)
+                limiter.acquire()
+                # A late response from an earlier request must not refill the budget
+                limiter.after_response(stale)
+                limiter.acquire()
+
+                mock_sleep.assert_called_once_with(30.0)
+
 class Test409ConflictHandling:
     """Tests for handling 409 Conflict errors (invitation already exists)."""
 
@@ -799,7 +1248,7 @@ class Test409ConflictHandling:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     # Return 409 Conflict
                     mock_request.return_value = mock_response(409)
                     
@@ -823,7 +1272,7 @@ class Test409ConflictHandling:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     # Mock get_existing_org_users to return empty set
                     with patch.object(
                         invite_users_to_organization,
@@ -853,7 +1302,7 @@ class Test409ConflictHandling:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     # Simulate real scenario: response has 409, raise_for_status raises HTTPError
                     response_409 = mock_response(409)
                     error = requests.exceptions.HTTPError("409 Client Error: Conflict")
@@ -883,7 +1332,7 @@ class Test409ConflictHandling:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     # Mock get_existing_org_users to return empty set
                     with patch.object(
                         invite_users_to_organization,
@@ -917,7 +1366,7 @@ class Test409ConflictHandling:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     mock_request.return_value = mock_response(409)
                     
                     invite_users_to_organization.invite_users_to_org(
@@ -947,7 +1396,7 @@ class TestGetExistingOrgUsers:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     # Mock response with users
                     users_data = {
                         "results": [
@@ -959,7 +1408,7 @@ class TestGetExistingOrgUsers:
                     
                     result = invite_users_to_organization.get_existing_org_users("org123")
                     
-                    assert isinstance(result, set)
+                    assert isinstance(result, frozenset)
                     assert len(result) == 2
                     assert "user1@example.com" in result
                     assert "user2@example.com" in result
@@ -976,7 +1425,7 @@ class TestGetExistingOrgUsers:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     users_data = {
                         "results": [
                             {"username": "User1@Example.com"},
@@ -1002,7 +1451,7 @@ class TestGetExistingOrgUsers:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     # First page
                     page1_data = {
                         "results": [{"username": "user1@example.com"}],
@@ -1025,6 +1474,61 @@ class TestGetExistingOrgUsers:
                     assert "user2@example.com" in result
                     assert mock_request.call_count == 2
 
+    def test_get_existing_users_fetches_remaining_pages_from_total_count(
+        self, mock_response
+    ):
+        """Test that pages after the first are requested from totalCount, not next links."""
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_key",
+            "ATLAS_ORG_ID": "test_org"
+        }):
+            with patch("builtins.open", mock_open(read_data="")):
+                import invite_users_to_organization
+
+                def fake_request(method, url, **kwargs):
+                    page = kwargs["params"]["pageNum"]
+                    return mock_response(200, {
+                        "results": [{"username": f"User{page}@example.com"}],
+                        "links": [],
+                        "totalCount": 1200,
+                    })
+
+                with patch("requests.Session.request", side_effect=fake_request) as mock_request:
+                    result = invite_users_to_organization.get_existing_org_users("org123")
+
+                    assert result == frozenset(
+                        {"user1@example.com", "user2@example.com", "user3@example.com"}
+                    )
+                    requested_pages = sorted(
+                        call.kwargs["params"]["pageNum"]
+                        for call in mock_request.call_args_list
+                    )
+                    assert requested_pages == [1, 2, 3]
+
+    def test_get_existing_users_decoded_with_orjson_when_installed(self, mock_response):
+        """Test that users pages are decoded from raw bytes by orjson when available."""
+        fake_orjson = MagicMock()
+        fake_orjson.loads.side_effect = json.loads
+
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_key",
+            "ATLAS_ORG_ID": "test_org"
+        }), patch.dict(sys.modules, {"orjson": fake_orjson}):
+            import invite_users_to_organization
+
+            with patch("requests.Session.request") as mock_request:
+                response = mock_response(200)
+                response.content = b'{"results": [{"username": "User@example.com"}]}'
+                mock_request.return_value = response
+
+                result = invite_users_to_organization.get_existing_org_users("org123")
+
+                assert result == frozenset({"user@example.com"})
+                fake_orjson.loads.assert_called_once_with(response.content)
+                response.json.assert_not_called()
+
     def test_get_existing_users_api_failure(self, mock_response):
         """Test graceful handling of API failure."""
         with patch.dict(os.environ, {
@@ -1037,13 +1541,13 @@ class TestGetExistingOrgUsers:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     mock_request.side_effect = requests.exceptions.RequestException("Error")
                     
                     result = invite_users_to_organization.get_existing_org_users("org123")
                     
                     # Should return empty set on failure (fail-safe)
-                    assert isinstance(result, set)
+                    assert isinstance(result, frozenset)
                     assert len(result) == 0
 
     def test_get_existing_users_no_org_id(self):
@@ -1060,7 +1564,7 @@ class TestGetExistingOrgUsers:
                 
                 result = invite_users_to_organization.get_existing_org_users("")
                 
-                assert isinstance(result, set)
+                assert isinstance(result, frozenset)
                 assert len(result) == 0
 
     def test_get_existing_users_list_response(self, mock_response):
@@ -1075,7 +1579,7 @@ class TestGetExistingOrgUsers:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     # Some APIs return list directly
                     users_list = [
                         {"username": "user1@example.com"},
@@ -1108,7 +1612,7 @@ class TestSkipExistingUsers:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     # Mock get_existing_org_users to return existing user
                     existing_users = {"existing@example.com"}
                     with patch.object(
@@ -1141,7 +1645,7 @@ class TestSkipExistingUsers:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     # Existing user stored as lowercase
                     existing_users = {"user@example.com"}
                     with patch.object(
@@ -1171,7 +1675,7 @@ class TestSkipExistingUsers:
                     import invite_users_to_organization
                     importlib.reload(invite_users_to_organization)
                     
-                    with patch("requests.request") as mock_request:
+                    with patch("requests.Session.request") as mock_request:
                         existing_users = {"existing@example.com"}
                         with patch.object(
                             invite_users_to_organization,
@@ -1203,7 +1707,7 @@ class TestSkipExistingUsers:
                 import invite_users_to_organization
                 importlib.reload(invite_users_to_organization)
                 
-                with patch("requests.request") as mock_request:
+                with patch("requests.Session.request") as mock_request:
                     # Mock get_existing_org_users to fail
                     with patch.object(
                         invite_users_to_organization,
@@ -8,6 +8,7 @@ This module tests the cluster pause functionality including:
 - Cluster pause operations
 """
 
+import json
 import os
 import sys
 from unittest.mock import MagicMock, patch
@@ -87,7 +88,7 @@ class TestMakeAtlasApiRequest:
                     with patch("pause_all_clusters_in_organization.ORGANIZATION_ID", "test_org"):
                         import pause_all_clusters_in_organization as module
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.return_value = mock_response(200, {"data": "test"})
                             
                             result = module.make_atlas_api_request("GET", "http://test.com")
@@ -109,7 +110,7 @@ class TestMakeAtlasApiRequest:
                     with patch("pause_all_clusters_in_organization.ORGANIZATION_ID", "test_org"):
                         import pause_all_clusters_in_organization as module
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.return_value = mock_response(200)
                             
                             result = module.make_atlas_api_request(
@@ -132,7 +133,7 @@ class TestMakeAtlasApiRequest:
                     with patch("pause_all_clusters_in_organization.ORGANIZATION_ID", "test_org"):
                         import pause_all_clusters_in_organization as module
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.side_effect = requests.exceptions.RequestException("Error")
                             
                             result = module.make_atlas_api_request("GET", "http://test.com")
@@ -140,6 +141,71 @@ class TestMakeAtlasApiRequest:
                             assert result is None
 
 
+    def test_error_status_returned_without_raising(self, mock_response):
+        """Test HTTP error statuses are returned for callers to inspect."""
+        env_vars = {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_secret",
+            "ATLAS_ORG_ID": "test_org",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            import pause_all_clusters_in_organization as module
+
+            with patch("requests.Session.request") as mock_request:
+                response = mock_response(404, raise_error=True)
+                mock_request.return_value = response
+
+                result = module.make_atlas_api_request("GET", "http://test.com")
+
+                assert result is response
+                response.raise_for_status.assert_not_called()
+                assert module.get_project_clusters("p1", "one") is None
+                assert module.pause_cluster("p1", "one", "c1") is False
+
+
+class TestCreateSession:
+    """Tests for the shared HTTP session."""
+
+    def test_session_is_uncached_by_default(self, mock_env_vars):
+        """Test GET caching stays off unless HTTP_CACHE_TTL is set."""
+        with patch.dict(os.environ, mock_env_vars):
+            import pause_all_clusters_in_organization as module
+
+            assert module.HTTP_CACHE_TTL == 0
+            assert type(module.SESSION) is requests.Session
+
+    def test_cached_session_used_when_ttl_set(self, mock_env_vars):
+        """Test requests-cache backs listing GETs, not PATCHes, when a TTL is set."""
+        env = {**mock_env_vars, "HTTP_CACHE_TTL": "60"}
+        fake_requests_cache = MagicMock()
+        with patch.dict(os.environ, env), patch.dict(
+            sys.modules, {"requests_cache": fake_requests_cache}
+        ):
+            import pause_all_clusters_in_organization as module
+
+            fake_requests_cache.CachedSession.assert_called_once()
+            call_kwargs = fake_requests_cache.CachedSession.call_args[1]
+            assert call_kwargs["expire_after"] == 60
+            assert call_kwargs["allowable_methods"] == ["GET"]
+            assert module.SESSION is fake_requests_cache.CachedSession.return_value
+
+    def test_missing_requests_cache_with_ttl_logs_warning(self, mock_env_vars):
+        """Test a TTL without requests-cache installed is reported, not ignored."""
+        env = {**mock_env_vars, "HTTP_CACHE_TTL": "300"}
+        with patch.dict(os.environ, env), patch.dict(
+            sys.modules, {"requests_cache": None}
+        ):
+            import pause_all_clusters_in_organization as module
+
+            with patch.object(module.logger, "warning") as mock_warning:
+                session = module.create_session()
+
+            assert type(session) is requests.Session
+            mock_warning.assert_called_once()
+            assert "requests-cache is not installed" in mock_warning.call_args[0][0]
+
+
 class TestGetAllPaginatedProjects:
     """Tests for get_all_paginated_projects function."""
 
@@ -157,7 +223,7 @@ class TestGetAllPaginatedProjects:
                     with patch("pause_all_clusters_in_organization.ORGANIZATION_ID", "test_org"):
                         import pause_all_clusters_in_organization as module
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.return_value = mock_response(
                                 200, paginated_response_factory(sample_projects)
                             )
@@ -187,10 +253,10 @@ class TestGetAllPaginatedProjects:
                         page1 = [{"id": "p1", "name": "project1"}]
                         page2 = [{"id": "p2", "name": "project2"}]
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.side_effect = [
-                                mock_response(200, paginated_response_factory(page1, has_next=True)),
-                                mock_response(200, paginated_response_factory(page2, has_next=False)),
+                                mock_response(200, paginated_response_factory(page1, has_next=True, total_count=501)),
+                                mock_response(200, paginated_response_factory(page2, has_next=False, total_count=501)),
                             ]
                             
                             from requests.auth import HTTPDigestAuth
@@ -200,6 +266,31 @@ class TestGetAllPaginatedProjects:
                             result = module.get_all_paginated_projects("org123", auth, headers)
                             
                             assert len(result) == 2
+                            pages = [c.kwargs["params"]["pageNum"] for c in mock_request.call_args_list]
+                            assert pages == [1, 2]
+                            assert mock_request.call_args_list[0].kwargs["params"]["itemsPerPage"] == 500
+
+    def test_follows_next_links_without_total_count(self, mock_response):
+        """Test pages are followed sequentially when totalCount is not reported."""
+        env_vars = {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_secret",
+            "ATLAS_ORG_ID": "test_org",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            import pause_all_clusters_in_organization as module
+
+            with patch("requests.Session.request") as mock_request:
+                mock_request.side_effect = [
+                    mock_response(200, {"results": [{"id": "p1"}], "links": [{"rel": "next"}]}),
+                    mock_response(200, {"results": [{"id": "p2"}], "links": [{"rel": "next"}]}),
+                    mock_response(200, {"results": [{"id": "p3"}], "links": []}),
+                ]
+
+                result = module.get_all_paginated_projects("org123")
+
+                assert [p["id"] for p in result] == ["p1", "p2", "p3"]
 
     def test_api_failure(self):
         """Test handling API failure."""
@@ -215,7 +306,7 @@ class TestGetAllPaginatedProjects:
                     with patch("pause_all_clusters_in_organization.ORGANIZATION_ID", "test_org"):
                         import pause_all_clusters_in_organization as module
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.side_effect = requests.exceptions.RequestException("Error")
                             
                             from requests.auth import HTTPDigestAuth
@@ -226,6 +317,46 @@ class TestGetAllPaginatedProjects:
                             
                             assert len(result) == 0
 
+    def test_pages_decoded_with_orjson_when_installed(self, mock_response):
+        """Test listing pages are decoded from raw bytes by orjson when available."""
+        fake_orjson = MagicMock()
+        fake_orjson.loads.side_effect = json.loads
+
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_secret",
+            "ATLAS_ORG_ID": "test_org",
+        }), patch.dict(sys.modules, {"orjson": fake_orjson}):
+            import pause_all_clusters_in_organization as module
+
+            with patch("requests.Session.request") as mock_request:
+                response = mock_response(200)
+                response.content = b'{"results": [{"id": "p1"}], "totalCount": 1}'
+                mock_request.return_value = response
+
+                result = module.get_all_paginated_projects("org123")
+
+                assert result == [{"id": "p1"}]
+                fake_orjson.loads.assert_called_once_with(response.content)
+                response.json.assert_not_called()
+
+    def test_malformed_page_treated_as_failure(self, mock_response):
+        """Test an undecodable listing page is reported as a failed fetch."""
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_secret",
+            "ATLAS_ORG_ID": "test_org",
+        }):
+            import pause_all_clusters_in_organization as module
+
+            with patch("requests.Session.request") as mock_request:
+                response = mock_response(200)
+                response.json.side_effect = ValueError("Expecting value")
+                response.content = b"<html>"
+                mock_request.return_value = response
+
+                assert module.get_project_clusters("p1", "one") is None
+
 
 class TestGetAllPaginatedClusters:
     """Tests for cluster fetching with pagination responses."""
@@ -244,7 +375,7 @@ class TestGetAllPaginatedClusters:
                     with patch("pause_all_clusters_in_organization.ORGANIZATION_ID", "test_org"):
                         import pause_all_clusters_in_organization as module
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.side_effect = [
                                 mock_response(200, paginated_response_factory(sample_projects[:1])),
                                 mock_response(200, paginated_response_factory([])),  # Empty clusters
@@ -271,7 +402,7 @@ class TestGetAllPaginatedClusters:
                         
                         running_clusters = [{"name": "cluster1", "paused": False}]
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.side_effect = [
                                 mock_response(200, paginated_response_factory(sample_projects[:1])),
                                 mock_response(200, paginated_response_factory(running_clusters)),
@@ -282,6 +413,36 @@ class TestGetAllPaginatedClusters:
                             
                             assert result is True
 
+    def test_get_clusters_fetches_every_page(self, mock_response, paginated_response_factory):
+        """Test clusters beyond the first page are listed and paused."""
+        env_vars = {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_secret",
+            "ATLAS_ORG_ID": "test_org",
+        }
+        pages = {
+            1: [{"name": f"c{i}", "paused": True} for i in range(500)],
+            2: [{"name": "last", "paused": False}],
+        }
+
+        def route(method, url, **kwargs):
+            if url.endswith("/orgs/test_org/groups"):
+                return mock_response(200, paginated_response_factory([{"id": "p1", "name": "one"}]))
+            if method == "GET":
+                page = kwargs["params"]["pageNum"]
+                return mock_response(200, paginated_response_factory(pages[page], total_count=501))
+            return mock_response(202)
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            import pause_all_clusters_in_organization as module
+
+            with patch("requests.Session.request", side_effect=route) as mock_request:
+                assert module.pause_all_clusters_in_org("test_org") is True
+
+                patched = [c.args[1] for c in mock_request.call_args_list if c.args[0] == "PATCH"]
+                assert len(patched) == 1
+                assert patched[0].endswith("/clusters/last")
+
 
 class TestPauseAllClustersInOrg:
     """Tests for pause_all_clusters_in_org function."""
@@ -303,7 +464,7 @@ class TestPauseAllClustersInOrg:
                         # Use only running cluster
                         running_clusters = [{"name": "cluster1", "paused": False}]
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.side_effect = [
                                 # Get projects
                                 mock_response(200, paginated_response_factory(sample_projects[:1])),
@@ -317,6 +478,118 @@ class TestPauseAllClustersInOrg:
                             
                             assert result is True
 
+    def test_pause_uses_authenticated_session(self, mock_response, paginated_response_factory):
+        """Test requests share one session carrying auth, headers and retries."""
+        env_vars = {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_secret",
+            "ATLAS_ORG_ID": "test_org",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            import pause_all_clusters_in_organization as module
+
+            with patch("requests.Session.request") as mock_request:
+                mock_request.side_effect = [
+                    mock_response(200, paginated_response_factory([{"id": "p1", "name": "one"}])),
+                    mock_response(200, paginated_response_factory([{"name": "c1", "paused": False}])),
+                    mock_response(200),
+                ]
+
+                assert module.pause_all_clusters_in_org("test_org") is True
+
+                assert isinstance(module.SESSION.auth, requests.auth.HTTPDigestAuth)
+                assert module.SESSION.headers["Accept"] == "application/vnd.atlas.2025-02-19+json"
+                retries = module.SESSION.get_adapter("https://cloud.mongodb.com").max_retries
+                assert "PATCH" in retries.allowed_methods
+                assert 429 in retries.status_forcelist
+                # Throttled requests wait out Atlas's Retry-After before retrying
+                assert retries.respect_retry_after_header is True
+                assert retries.is_retry("PATCH", 429, has_retry_after=True)
+                for call in mock_request.call_args_list:
+                    assert call.kwargs.get("auth") is None
+                    assert call.kwargs.get("headers") is None
+
+    def test_pause_processes_projects_concurrently(self, mock_response, paginated_response_factory):
+        """Test every project's clusters are listed and paused through the worker pool."""
+        env_vars = {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_secret",
+            "ATLAS_ORG_ID": "test_org",
+        }
+        projects = [{"id": f"p{i}", "name": f"project{i}"} for i in range(5)]
+
+        def route(method, url, **kwargs):
+            if url.endswith("/orgs/test_org/groups"):
+                return mock_response(200, paginated_response_factory(projects))
+            if method == "GET" and url.endswith("/p3/clusters"):
+                raise requests.exceptions.RequestException("listing failed")
+            if method == "GET":
+                project_id = url.split("/groups/")[1].split("/")[0]
+                return mock_response(200, paginated_response_factory([
+                    {"name": f"{project_id}-a", "paused": False},
+                    {"name": f"{project_id}-b", "paused": True},
+                ]))
+            return mock_response(202)
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            import pause_all_clusters_in_organization as module
+
+            with patch("requests.Session.request", side_effect=route) as mock_request:
+                result = module.pause_all_clusters_in_org("test_org")
+
+                # One project's listing failed, so the run is reported as failed
+                assert result is False
+                patched = sorted(
+                    call.args[1].rsplit("/", 1)[1]
+                    for call in mock_request.call_args_list
+                    if call.args[0] == "PATCH"
+                )
+                assert patched == ["p0-a", "p1-a", "p2-a", "p4-a"]
+
+    def test_pause_interrupt_cancels_queued_pauses(self, mock_response, paginated_response_factory):
+        """Test Ctrl-C after a listing stops the queued PATCHes instead of sending them."""
+        import time
+        from concurrent.futures import as_completed
+
+        env_vars = {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_secret",
+            "ATLAS_ORG_ID": "test_org",
+        }
+        clusters = [{"name": f"cluster-{i}", "paused": False} for i in range(30)]
+        patched = []
+
+        def route(method, url, **kwargs):
+            if url.endswith("/orgs/test_org/groups"):
+                return mock_response(200, paginated_response_factory([{"id": "p1", "name": "one"}]))
+            if method == "GET":
+                return mock_response(200, paginated_response_factory(clusters))
+            patched.append(url)
+            # Keep each PATCH in flight long enough for the interrupt to land
+            time.sleep(0.2)
+            return mock_response(202)
+
+        def interrupt_pauses(futures):
+            # The first call waits on the listings; the second on the pauses
+            if interrupt_pauses.calls:
+                raise KeyboardInterrupt
+            interrupt_pauses.calls += 1
+            return as_completed(futures)
+
+        interrupt_pauses.calls = 0
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            import pause_all_clusters_in_organization as module
+
+            with patch("requests.Session.request", side_effect=route), patch.object(
+                module, "MAX_PAUSE_WORKERS", 2
+            ), patch.object(module, "as_completed", side_effect=interrupt_pauses):
+                with pytest.raises(KeyboardInterrupt):
+                    module.pause_all_clusters_in_org("test_org")
+
+            assert len(patched) <= 2
+
     def test_pause_clusters_no_org_id(self):
         """Test handling missing org ID."""
         env_vars = {
@@ -349,7 +622,7 @@ class TestPauseAllClustersInOrg:
                     with patch("pause_all_clusters_in_organization.ORGANIZATION_ID", "test_org"):
                         import pause_all_clusters_in_organization as module
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.return_value = mock_response(
                                 200, paginated_response_factory([])
                             )
@@ -374,7 +647,7 @@ class TestPauseAllClustersInOrg:
                         
                         paused_clusters = [{"name": "cluster1", "paused": True}]
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.side_effect = [
                                 mock_response(200, paginated_response_factory(sample_projects[:1])),
                                 mock_response(200, paginated_response_factory(paused_clusters)),
@@ -385,6 +658,114 @@ class TestPauseAllClustersInOrg:
                             # Should succeed - no clusters needed pausing
                             assert result is True
 
+    def test_pause_prefilters_clusters_with_one_summary_line(self, mock_response, paginated_response_factory, caplog):
+        """Test only running, named clusters are patched and skips are logged once."""
+        env_vars = {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_secret",
+            "ATLAS_ORG_ID": "test_org",
+        }
+        clusters = [
+            {"name": "running", "paused": False},
+            {"name": "paused1", "paused": True},
+            {"name": "paused2", "paused": True},
+            {"paused": False},
+        ]
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            import pause_all_clusters_in_organization as module
+
+            with patch("requests.Session.request") as mock_request:
+                mock_request.side_effect = [
+                    mock_response(200, paginated_response_factory([{"id": "p1", "name": "one"}])),
+                    mock_response(200, paginated_response_factory(clusters)),
+                    mock_response(202),
+                ]
+
+                with caplog.at_level("INFO", logger=module.logger.name):
+                    assert module.pause_all_clusters_in_org("test_org") is True
+
+                assert mock_request.call_count == 3
+                assert mock_request.call_args_list[2].args[1].endswith("/clusters/running")
+                assert "one: 1 to pause, 3 skipped (2 already paused)" in caplog.text
+                assert "is already paused" not in caplog.text
+
+    def test_pause_success_logged_at_debug(self, mock_response, paginated_response_factory, caplog):
+        """Test per-cluster success stays out of INFO logs while the summary is kept."""
+        env_vars = {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_secret",
+            "ATLAS_ORG_ID": "test_org",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            import pause_all_clusters_in_organization as module
+
+            with patch("requests.Session.request") as mock_request:
+                mock_request.side_effect = [
+                    mock_response(200, paginated_response_factory([{"id": "p1", "name": "one"}])),
+                    mock_response(200, paginated_response_factory([{"name": "c1", "paused": False}])),
+                    mock_response(202),
+                ]
+
+                with caplog.at_level("INFO", logger=module.logger.name):
+                    assert module.pause_all_clusters_in_org("test_org") is True
+
+                assert "Successfully initiated pause" not in caplog.text
+                assert "Clusters paused: 1, Already paused: 0, Failures: 0" in caplog.text
+
+    def test_pause_url_segments_are_encoded(self, mock_response, paginated_response_factory):
+        """Test project IDs and cluster names are percent-encoded in request paths."""
+        env_vars = {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_secret",
+            "ATLAS_ORG_ID": "test_org",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            import pause_all_clusters_in_organization as module
+
+            with patch("requests.Session.request") as mock_request:
+                mock_request.side_effect = [
+                    mock_response(200, paginated_response_factory([{"id": "p/1", "name": "one"}])),
+                    mock_response(200, paginated_response_factory([{"name": "dev cluster", "paused": False}])),
+                    mock_response(202),
+                ]
+
+                assert module.pause_all_clusters_in_org("test_org") is True
+
+                urls = [call.args[1] for call in mock_request.call_args_list]
+                base = "https://cloud.mongodb.com/api/atlas/v2"
+                assert urls[1] == f"{base}/groups/p%2F1/clusters"
+                assert urls[2] == f"{base}/groups/p%2F1/clusters/dev%20cluster"
+
+    def test_pause_dry_run_sends_no_patches(self, mock_response, paginated_response_factory, caplog):
+        """Test a dry run lists clusters and logs them without pausing."""
+        env_vars = {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_secret",
+            "ATLAS_ORG_ID": "test_org",
+        }
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            import pause_all_clusters_in_organization as module
+
+            with patch("requests.Session.request") as mock_request:
+                mock_request.side_effect = [
+                    mock_response(200, paginated_response_factory([{"id": "p1", "name": "one"}])),
+                    mock_response(200, paginated_response_factory([
+                        {"name": "c1", "paused": False},
+                        {"name": "c2", "paused": True},
+                    ])),
+                ]
+
+                with caplog.at_level("INFO", logger=module.logger.name):
+                    assert module.pause_all_clusters_in_org("test_org", dry_run=True) is True
+
+                assert all(call.args[0] == "GET" for call in mock_request.call_args_list)
+                assert "would pause cluster c1 in project one" in caplog.text
+                assert "Clusters that would be paused: 1, Already paused: 1" in caplog.text
+
     def test_pause_skips_missing_project_id(self, mock_response, paginated_response_factory):
         """Test skipping projects with missing ID."""
         env_vars = {
@@ -401,7 +782,7 @@ class TestPauseAllClustersInOrg:
                         
                         projects_no_id = [{"name": "project1"}]  # Missing ID
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.return_value = mock_response(
                                 200, paginated_response_factory(projects_no_id)
                             )
@@ -426,7 +807,7 @@ class TestPauseAllClustersInOrg:
                         
                         running_clusters = [{"name": "cluster1", "paused": False}]
                         
-                        with patch("requests.request") as mock_request:
+                        with patch("requests.Session.request") as mock_request:
                             mock_request.side_effect = [
                                 mock_response(200, paginated_response_factory(sample_projects[:1])),
                                 mock_response(200, paginated_response_factory(running_clusters)),
@@ -457,7 +838,8 @@ class TestMain:
                         import pause_all_clusters_in_organization as module
                         
                         with patch("builtins.input", return_value="no"):
-                            result = module.main()
+                            with patch("sys.argv", ["pause_all_clusters_in_organization.py"]):
+                                result = module.main()
                             assert result == 0
 
     def test_main_confirmed_success(self, mock_response, sample_projects, paginated_response_factory):
@@ -475,13 +857,14 @@ class TestMain:
                         import pause_all_clusters_in_organization as module
                         
                         with patch("builtins.input", return_value="PAUSE ALL CLUSTERS"):
-                            with patch("requests.request") as mock_request:
+                            with patch("requests.Session.request") as mock_request:
                                 mock_request.side_effect = [
                                     mock_response(200, paginated_response_factory(sample_projects[:1])),
                                     mock_response(200, paginated_response_factory([])),  # No clusters
                                 ]
                                 
-                                result = module.main()
+                                with patch("sys.argv", ["pause_all_clusters_in_organization.py"]):
+                                    result = module.main()
                                 # No clusters to pause, but operation succeeds
                                 assert result == 0
 
@@ -500,7 +883,8 @@ class TestMain:
                         import pause_all_clusters_in_organization as module
                         
                         with patch("builtins.input", side_effect=KeyboardInterrupt):
-                            result = module.main()
+                            with patch("sys.argv", ["pause_all_clusters_in_organization.py"]):
+                                result = module.main()
                             assert result == 1
 
     def test_main_unexpected_exception(self):
@@ -519,10 +903,117 @@ class TestMain:
                         
                         with patch("builtins.input", return_value="PAUSE ALL CLUSTERS"):
                             with patch.object(module, "pause_all_clusters_in_org", side_effect=Exception("Error")):
-                                result = module.main()
+                                with patch("sys.argv", ["pause_all_clusters_in_organization.py"]):
+                                    result = module.main()
                                 assert result == 1
 
 
+    def test_main_yes_skips_prompt(self):
+        """Test --yes pauses without asking for confirmation."""
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_secret",
+            "ATLAS_ORG_ID": "test_org",
+        }):
+            import pause_all_clusters_in_organization as module
+
+            with patch("sys.argv", ["pause_all_clusters_in_organization.py", "--yes"]):
+                with patch("builtins.input") as mock_input:
+                    with patch.object(module, "pause_all_clusters_in_org", return_value=True) as mock_pause:
+                        assert module.main() == 0
+
+                mock_input.assert_not_called()
+                mock_pause.assert_called_once_with("test_org", dry_run=False)
+
+    def test_main_dry_run_with_org_override(self):
+        """Test --dry-run skips the prompt and --org-id replaces ATLAS_ORG_ID."""
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_secret",
+        }, clear=True):
+            import pause_all_clusters_in_organization as module
+
+            argv = ["pause_all_clusters_in_organization.py", "--dry-run", "--org-id", "other_org"]
+            with patch("sys.argv", argv):
+                with patch("builtins.input") as mock_input:
+                    with patch.object(module, "pause_all_clusters_in_org", return_value=True) as mock_pause:
+                        assert module.main() == 0
+
+                mock_input.assert_not_called()
+                mock_pause.assert_called_once_with("other_org", dry_run=True)
+
+    def test_main_concurrency_resizes_pools(self):
+        """Test --concurrency sets the worker count and the connection pool size."""
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_secret",
+            "ATLAS_ORG_ID": "test_org",
+        }):
+            import pause_all_clusters_in_organization as module
+
+            argv = ["pause_all_clusters_in_organization.py", "--yes", "--concurrency", "16"]
+            with patch("sys.argv", argv):
+                with patch.object(module, "pause_all_clusters_in_org", return_value=True):
+                    assert module.main() == 0
+
+            assert module.MAX_PAUSE_WORKERS == 16
+            adapter = module.SESSION.get_adapter("https://cloud.mongodb.com")
+            assert adapter._pool_maxsize == 16
+
+
+class TestLogging:
+    """Tests for the queued logging setup."""
+
+    def test_import_does_not_configure_logging(self, mock_env_vars):
+        """Test importing the module opens no log file and starts no listener."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("logging.FileHandler") as mock_file_handler:
+                import pause_all_clusters_in_organization as module
+
+                mock_file_handler.assert_not_called()
+                assert not hasattr(module, "LOG_LISTENER")
+
+    def test_setup_logging_writes_from_background_listener(self, mock_env_vars):
+        """Test file and console handlers run on the queue listener thread."""
+        with patch.dict(os.environ, mock_env_vars):
+            import logging
+
+            import pause_all_clusters_in_organization as module
+
+            with patch("os.makedirs") as mock_makedirs, patch("logging.basicConfig"):
+                listener = module.setup_logging()
+            try:
+                mock_makedirs.assert_called_once_with("logs", exist_ok=True)
+                handler_types = {type(h) for h in listener.handlers}
+                assert handler_types == {logging.FileHandler, logging.StreamHandler}
+                assert listener.queue is module.LOG_QUEUE
+                assert all(h.formatter is module.LOG_FORMATTER for h in listener.handlers)
+            finally:
+                listener.stop()
+                for handler in listener.handlers:
+                    handler.close()
+
+            # Records are enqueued as-is and formatted later by the listener
+            record = logging.LogRecord("x", logging.INFO, "f", 1, "a %s", ("b",), None)
+            assert module.RecordQueueHandler(module.LOG_QUEUE).prepare(record) is record
+
+    def test_main_stops_listener(self):
+        """Test main sets up logging first and flushes it on exit."""
+        with patch.dict(os.environ, {
+            "ATLAS_PUBLIC_KEY": "test_key",
+            "ATLAS_PRIVATE_KEY": "test_secret",
+            "ATLAS_ORG_ID": "test_org",
+        }):
+            import pause_all_clusters_in_organization as module
+
+            with patch.object(module, "setup_logging") as mock_setup:
+                with patch("builtins.input", return_value="no"):
+                    with patch("sys.argv", ["pause_all_clusters_in_organization.py"]):
+                        assert module.main() == 0
+
+                mock_setup.return_value.stop.assert_called_once()
+
+
 class TestModuleInitialization:
     """Regression tests that verify load_dotenv() is called at module level.
 
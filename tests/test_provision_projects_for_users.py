@@ -24,7 +24,7 @@ class TestAtlasAPI:
     def test_init_success(self, mock_env_vars, mock_response):
         """Test successful AtlasAPI initialization."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -48,7 +48,7 @@ class TestAtlasAPI:
     def test_init_invalid_credentials(self, mock_env_vars):
         """Test AtlasAPI initialization with invalid credentials."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.side_effect = requests.exceptions.RequestException("Auth failed")
                 
                 from provision_projects_for_users import AtlasAPI
@@ -60,7 +60,7 @@ class TestAtlasAPI:
     def test_init_org_not_found(self, mock_env_vars, mock_response):
         """Test AtlasAPI initialization when org not found."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "different_org"}]}
                 )
@@ -74,7 +74,7 @@ class TestAtlasAPI:
     def test_make_request_get(self, mock_env_vars, mock_response):
         """Test _make_request with GET method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -91,7 +91,7 @@ class TestAtlasAPI:
     def test_make_request_post(self, mock_env_vars, mock_response):
         """Test _make_request with POST method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -99,7 +99,7 @@ class TestAtlasAPI:
                 from provision_projects_for_users import AtlasAPI
                 api = AtlasAPI()
                 
-                with patch("requests.post") as mock_post:
+                with patch("requests.Session.request") as mock_post:
                     mock_post.return_value = mock_response(201, {"id": "new"})
                     result, success = api._make_request("post", "/test", {"name": "test"})
                     
@@ -108,7 +108,7 @@ class TestAtlasAPI:
     def test_make_request_delete(self, mock_env_vars, mock_response):
         """Test _make_request with DELETE method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -116,7 +116,7 @@ class TestAtlasAPI:
                 from provision_projects_for_users import AtlasAPI
                 api = AtlasAPI()
                 
-                with patch("requests.delete") as mock_delete:
+                with patch("requests.Session.request") as mock_delete:
                     mock_delete.return_value = mock_response(204, {})
                     result, success = api._make_request("delete", "/test")
                     
@@ -125,7 +125,7 @@ class TestAtlasAPI:
     def test_make_request_handles_existing_group(self, mock_env_vars):
         """Test _make_request handles GROUP_ALREADY_EXISTS error."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 init_response = MagicMock()
                 init_response.status_code = 200
                 init_response.json.return_value = {"results": [{"id": "test_org_id"}]}
@@ -135,7 +135,7 @@ class TestAtlasAPI:
                 from provision_projects_for_users import AtlasAPI
                 api = AtlasAPI()
                 
-                with patch("requests.post") as mock_post:
+                with patch("requests.Session.request") as mock_post:
                     error_response = MagicMock()
                     error_response.status_code = 409
                     error_response.json.return_value = {
@@ -155,7 +155,7 @@ class TestAtlasAPI:
     def test_make_request_handles_existing_user(self, mock_env_vars):
         """Test _make_request handles USER_ALREADY_EXISTS error."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 init_response = MagicMock()
                 init_response.status_code = 200
                 init_response.json.return_value = {"results": [{"id": "test_org_id"}]}
@@ -165,7 +165,7 @@ class TestAtlasAPI:
                 from provision_projects_for_users import AtlasAPI
                 api = AtlasAPI()
                 
-                with patch("requests.post") as mock_post:
+                with patch("requests.Session.request") as mock_post:
                     error_response = MagicMock()
                     error_response.status_code = 409
                     error_response.json.return_value = {
@@ -182,10 +182,182 @@ class TestAtlasAPI:
                     assert success is False
                     assert api.successful_requests >= 1
 
+    def test_make_request_retries_with_exponential_backoff(self, mock_env_vars, mock_response):
+        """Test transient failures are retried with growing, jittered delays."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("requests.Session.request") as mock_get:
+                mock_get.return_value = mock_response(
+                    200, {"results": [{"id": "test_org_id"}]}
+                )
+
+                from provision_projects_for_users import AtlasAPI
+                api = AtlasAPI()
+
+                mock_get.side_effect = requests.exceptions.ConnectionError("reset")
+                with patch("time.sleep") as mock_sleep, patch("random.uniform", return_value=0.1):
+                    result, success = api._make_request("get", "/test", retry=3)
+
+                assert success is False
+                assert mock_get.call_count == 5  # 1 init + 4 attempts
+                delays = [c.args[0] for c in mock_sleep.call_args_list]
+                assert delays == pytest.approx([0.35, 0.6, 1.1])
+
+    def test_make_request_honors_retry_after(self, mock_env_vars, mock_response):
+        """Test a throttled request waits for the server's Retry-After before retrying."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("requests.Session.request") as mock_get:
+                mock_get.return_value = mock_response(
+                    200, {"results": [{"id": "test_org_id"}]}
+                )
+
+                from provision_projects_for_users import AtlasAPI
+                api = AtlasAPI()
+
+                throttled = mock_response(429, {"error": 429, "errorCode": "RATE_LIMITED"})
+                throttled.headers = {"Retry-After": "7"}
+                throttled.raise_for_status.side_effect = requests.exceptions.HTTPError(
+                    "429", response=throttled
+                )
+                mock_get.side_effect = [throttled, mock_response(200, {"data": "ok"})]
+
+                with patch("time.sleep") as mock_sleep:
+                    result, success = api._make_request("get", "/test", retry=2)
+
+                assert success is True
+                assert result == {"data": "ok"}
+                mock_sleep.assert_called_once_with(7.0)
+
+    def test_make_request_does_not_retry_client_errors(self, mock_env_vars, mock_response):
+        """Test client errors such as 404 fail immediately without retrying."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("requests.Session.request") as mock_get:
+                mock_get.return_value = mock_response(
+                    200, {"results": [{"id": "test_org_id"}]}
+                )
+
+                from provision_projects_for_users import AtlasAPI
+                api = AtlasAPI()
+
+                not_found = mock_response(404, {"error": 404, "errorCode": "RESOURCE_NOT_FOUND"})
+                not_found.raise_for_status.side_effect = requests.exceptions.HTTPError(
+                    "404", response=not_found
+                )
+                mock_get.return_value = not_found
+
+                with patch("time.sleep") as mock_sleep:
+                    result, success = api._make_request("get", "/test", retry=2)
+
+                assert success is False
+                assert mock_get.call_count == 2  # 1 init + 1 attempt
+                mock_sleep.assert_not_called()
+                assert api.get_failure_details()[-1]["status_code"] == 404
+
+    def test_make_request_reuses_session(self, mock_env_vars, mock_response):
+        """Test every call goes through one session carrying auth and headers."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("requests.Session.request") as mock_request:
+                mock_request.return_value = mock_response(
+                    200, {"results": [{"id": "test_org_id"}]}
+                )
+
+                from provision_projects_for_users import AtlasAPI
+                api = AtlasAPI()
+                session = api.session
+
+                mock_request.return_value = mock_response(201, {"id": "new"})
+                api._make_request("post", "/groups", {"name": "p1"})
+
+                assert api.session is session
+                assert isinstance(session.auth, requests.auth.HTTPDigestAuth)
+                assert session.headers["Accept"] == "application/vnd.atlas.2025-02-19+json"
+                mock_request.assert_called_with(
+                    "POST",
+                    "https://cloud.mongodb.com/api/atlas/v2/groups",
+                    json={"name": "p1"},
+                    timeout=30,
+                )
+
+    def test_make_request_caches_get_responses(self, mock_env_vars, mock_response):
+        """Test repeated GETs within the TTL are served from the cache."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("requests.Session.request") as mock_get:
+                mock_get.return_value = mock_response(
+                    200, {"results": [{"id": "test_org_id"}]}
+                )
+
+                from provision_projects_for_users import AtlasAPI
+                api = AtlasAPI()
+
+                mock_get.return_value = mock_response(200, {"results": ["c1"]})
+                first = api._make_request("get", "/groups/p1/clusters")
+                second = api._make_request("get", "/groups/p1/clusters")
+
+                assert first == second == ({"results": ["c1"]}, True)
+                assert mock_get.call_count == 2  # 1 init + 1 fetch
+                assert api.total_requests == 2
+
+    def test_make_request_get_cache_expires(self, mock_env_vars, mock_response):
+        """Test cached GETs are refetched once the TTL has passed."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("requests.Session.request") as mock_get:
+                mock_get.return_value = mock_response(
+                    200, {"results": [{"id": "test_org_id"}]}
+                )
+
+                from provision_projects_for_users import AtlasAPI
+                api = AtlasAPI(cache_ttl=30)
+
+                with patch("time.monotonic", return_value=1000.0):
+                    api._make_request("get", "/groups/p1/clusters")
+                with patch("time.monotonic", return_value=1031.0):
+                    api._make_request("get", "/groups/p1/clusters")
+
+                assert mock_get.call_count == 3  # 1 init + 2 fetches
+
+    def test_make_request_write_invalidates_cache(self, mock_env_vars, mock_response):
+        """Test a successful write drops the cached listings it affects."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("requests.Session.request") as mock_get:
+                mock_get.return_value = mock_response(
+                    200, {"results": [{"id": "test_org_id"}]}
+                )
+
+                from provision_projects_for_users import AtlasAPI
+                api = AtlasAPI()
+
+                mock_get.return_value = mock_response(200, {"results": []})
+                api._make_request("get", "/groups/p1/clusters")
+                api._make_request("get", "/groups/p1/users")
+                api._make_request("get", "/groups/p2/clusters")
+
+                with patch("requests.Session.request") as mock_delete:
+                    mock_delete.return_value = mock_response(204, {})
+                    api._make_request("delete", "/groups/p1/clusters/c1")
+
+                assert "/groups/p1/clusters" not in api._get_cache
+                assert "/groups/p1/users" in api._get_cache
+                assert "/groups/p2/clusters" in api._get_cache
+
+    def test_make_request_cache_disabled(self, mock_env_vars, mock_response):
+        """Test a zero TTL sends every GET to Atlas."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("requests.Session.request") as mock_get:
+                mock_get.return_value = mock_response(
+                    200, {"results": [{"id": "test_org_id"}]}
+                )
+
+                from provision_projects_for_users import AtlasAPI
+                api = AtlasAPI(cache_ttl=0)
+
+                api._make_request("get", "/groups/p1/clusters")
+                api._make_request("get", "/groups/p1/clusters")
+
+                assert mock_get.call_count == 3
+
     def test_get_projects_in_org(self, mock_env_vars, mock_response, sample_projects, paginated_response_factory):
         """Test get_projects_in_org method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -204,7 +376,7 @@ class TestAtlasAPI:
     def test_get_projects_in_org_pagination(self, mock_env_vars, mock_response, paginated_response_factory):
         """Test get_projects_in_org with multiple pages."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -228,7 +400,7 @@ class TestAtlasAPI:
     def test_create_project(self, mock_env_vars, mock_response):
         """Test create_project method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -236,7 +408,7 @@ class TestAtlasAPI:
                 from provision_projects_for_users import AtlasAPI
                 api = AtlasAPI()
                 
-                with patch("requests.post") as mock_post:
+                with patch("requests.Session.request") as mock_post:
                     mock_post.return_value = mock_response(201, {"id": "new_project"})
                     
                     project_id, success = api.create_project("test-project", "owner@example.com")
@@ -247,7 +419,7 @@ class TestAtlasAPI:
     def test_invite_user_to_project(self, mock_env_vars, mock_response):
         """Test invite_user_to_project method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -255,7 +427,7 @@ class TestAtlasAPI:
                 from provision_projects_for_users import AtlasAPI
                 api = AtlasAPI()
                 
-                with patch("requests.post") as mock_post:
+                with patch("requests.Session.request") as mock_post:
                     mock_post.return_value = mock_response(200, {})
                     
                     result = api.invite_user_to_project("project123", "user@example.com")
@@ -265,7 +437,7 @@ class TestAtlasAPI:
     def test_get_project_users(self, mock_env_vars, mock_response, sample_atlas_users, paginated_response_factory):
         """Test get_project_users method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -284,7 +456,7 @@ class TestAtlasAPI:
     def test_get_project_users_pagination(self, mock_env_vars, mock_response, paginated_response_factory):
         """Test get_project_users with multiple pages."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -308,7 +480,7 @@ class TestAtlasAPI:
     def test_get_clusters_in_project(self, mock_env_vars, mock_response, sample_clusters, paginated_response_factory):
         """Test get_clusters_in_project method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -327,7 +499,7 @@ class TestAtlasAPI:
     def test_get_clusters_in_project_pagination(self, mock_env_vars, mock_response, paginated_response_factory):
         """Test get_clusters_in_project with multiple pages."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -351,7 +523,7 @@ class TestAtlasAPI:
     def test_create_cluster(self, mock_env_vars, mock_response):
         """Test create_cluster method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -359,7 +531,7 @@ class TestAtlasAPI:
                 from provision_projects_for_users import AtlasAPI
                 api = AtlasAPI()
                 
-                with patch("requests.post") as mock_post:
+                with patch("requests.Session.request") as mock_post:
                     mock_post.return_value = mock_response(201, {"id": "cluster123"})
                     
                     result = api.create_cluster("project123", "test-cluster", "owner@example.com")
@@ -369,7 +541,7 @@ class TestAtlasAPI:
     def test_delete_cluster(self, mock_env_vars, mock_response):
         """Test delete_cluster method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -377,7 +549,7 @@ class TestAtlasAPI:
                 from provision_projects_for_users import AtlasAPI
                 api = AtlasAPI()
                 
-                with patch("requests.delete") as mock_delete:
+                with patch("requests.Session.request") as mock_delete:
                     mock_delete.return_value = mock_response(202, {})
                     
                     result = api.delete_cluster("project123", "test-cluster")
@@ -387,7 +559,7 @@ class TestAtlasAPI:
     def test_delete_project(self, mock_env_vars, mock_response):
         """Test delete_project method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -395,7 +567,7 @@ class TestAtlasAPI:
                 from provision_projects_for_users import AtlasAPI
                 api = AtlasAPI()
                 
-                with patch("requests.delete") as mock_delete:
+                with patch("requests.Session.request") as mock_delete:
                     mock_delete.return_value = mock_response(204, {})
                     
                     result = api.delete_project("project123")
@@ -405,7 +577,7 @@ class TestAtlasAPI:
     def test_get_request_summary(self, mock_env_vars, mock_response):
         """Test get_request_summary method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -423,7 +595,7 @@ class TestAtlasAPI:
     def test_has_failures(self, mock_env_vars, mock_response):
         """Test has_failures method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -441,7 +613,7 @@ class TestAtlasAPI:
     def test_reset_request_tracking(self, mock_env_vars, mock_response):
         """Test reset_request_tracking method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -461,6 +633,97 @@ class TestAtlasAPI:
                 assert api.successful_requests == 0
 
 
+class TestRateLimiter:
+    """Tests for the client-side API rate limiter."""
+
+    def test_window_blocks_once_budget_is_spent(self, mock_env_vars):
+        """Test requests beyond max_calls wait until the oldest leaves the window."""
+        with patch.dict(os.environ, mock_env_vars):
+            from provision_projects_for_users import RateLimiter
+
+            limiter = RateLimiter(2, 60.0)
+            clock = [1000.0]
+
+            def fake_sleep(seconds):
+                clock[0] += seconds
+
+            with patch("time.monotonic", side_effect=lambda: clock[0]), patch(
+                "time.sleep", side_effect=fake_sleep
+            ) as mock_sleep:
+                limiter.acquire()
+                clock[0] += 10
+                limiter.acquire()
+                limiter.acquire()
+
+                mock_sleep.assert_called_once_with(50.0)
+
+    def test_exhausted_server_budget_waits_for_reset(self, mock_env_vars, mock_response):
+        """Test that X-RateLimit-Remaining of 0 waits until X-RateLimit-Reset."""
+        with patch.dict(os.environ, mock_env_vars):
+            from provision_projects_for_users import RateLimiter
+
+            limiter = RateLimiter(100, 60.0)
+            response = mock_response(200)
+            response.headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "12"}
+            clock = [1000.0]
+
+            def fake_sleep(seconds):
+                clock[0] += seconds
+
+            with patch("time.monotonic", side_effect=lambda: clock[0]), patch(
+                "time.sleep", side_effect=fake_sleep
+            ) as mock_sleep:
+                limiter.after_response(response)
+                limiter.acquire()
+
+                mock_sleep.assert_called_once_with(12.0)
+
+    def test_server_budget_spent_locally_between_responses(self, mock_env_vars, mock_response):
+        """Test a reported budget of 1 lets one request through, not every worker."""
+        with patch.dict(os.environ, mock_env_vars):
+            from provision_projects_for_users import RateLimiter
+
+            limiter = RateLimiter(100, 60.0)
+            response = mock_response(200)
+            response.headers = {"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "30"}
+            clock = [1000.0]
+
+            def fake_sleep(seconds):
+                clock[0] += seconds
+
+            with patch("time.monotonic", side_effect=lambda: clock[0]), patch(
+                "time.sleep", side_effect=fake_sleep
+            ) as mock_sleep:
+                limiter.after_response(response)
+                limiter.acquire()
+                limiter.acquire()
+
+                mock_sleep.assert_called_once_with(30.0)
+
+    def test_every_attempt_goes_through_limiter(self, mock_env_vars, mock_response):
+        """Test each request attempt, retries included, acquires from the limiter."""
+        with patch.dict(os.environ, {**mock_env_vars, "ATLAS_REQUESTS_PER_MINUTE": "30"}):
+            with patch("requests.Session.request") as mock_get:
+                mock_get.return_value = mock_response(
+                    200, {"results": [{"id": "test_org_id"}]}
+                )
+
+                from provision_projects_for_users import AtlasAPI
+                api = AtlasAPI()
+
+                assert api.limiter.max_calls == 30
+                mock_get.side_effect = [
+                    requests.exceptions.ConnectionError("reset"),
+                    mock_response(200, {"data": "ok"}),
+                ]
+
+                with patch.object(api.limiter, "acquire") as mock_acquire, patch("time.sleep"):
+                    result, success = api._make_request("get", "/test", retry=1)
+
+                assert success is True
+                assert mock_acquire.call_count == 2
+
+
 class TestAtlasOwnershipTracker:
     """Tests for AtlasOwnershipTracker class."""
 
@@ -564,7 +827,7 @@ class TestAtlasProvisioner:
     def test_init(self, mock_env_vars, mock_response, tmp_path):
         """Test AtlasProvisioner initialization."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -583,7 +846,7 @@ class TestAtlasProvisioner:
     def test_provision_for_emails(self, mock_env_vars, mock_response, tmp_path, paginated_response_factory):
         """Test provision_for_emails method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -602,7 +865,7 @@ class TestAtlasProvisioner:
                         mock_response(200, paginated_response_factory([])),
                     ]
                     
-                    with patch("requests.post") as mock_post:
+                    with patch("requests.Session.request") as mock_post:
                         mock_post.return_value = mock_response(201, {"id": "new_project"})
                         
                         # Mock get for clusters
@@ -618,7 +881,7 @@ class TestAtlasProvisioner:
     def test_provision_deduplicates_emails(self, mock_env_vars, mock_response, paginated_response_factory):
         """Test that provision_for_emails deduplicates emails."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -640,10 +903,45 @@ class TestAtlasProvisioner:
                         # Should only be called once
                         assert mock_provision.call_count == 1
 
+    def test_provision_for_emails_processes_emails_concurrently(self, mock_env_vars, mock_response, paginated_response_factory):
+        """Test every email is provisioned and tallied when run from the worker pool."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("requests.Session.request") as mock_get:
+                mock_get.return_value = mock_response(
+                    200, {"results": [{"id": "test_org_id"}]}
+                )
+
+                with patch("provision_projects_for_users.AtlasOwnershipTracker") as MockTracker:
+                    tracker_instance = MagicMock()
+                    tracker_instance.get_project_id.return_value = None
+                    MockTracker.return_value = tracker_instance
+
+                    from provision_projects_for_users import AtlasProvisioner
+                    provisioner = AtlasProvisioner()
+
+                    mock_get.return_value = mock_response(200, paginated_response_factory([]))
+                    emails = [f"user{i}@example.com" for i in range(12)]
+
+                    def create_cluster(project_id, name, owner_email):
+                        return owner_email != "user3@example.com"
+
+                    with patch.object(provisioner.api, "create_project", side_effect=lambda name, email: (f"p-{email}", True)):
+                        with patch.object(provisioner.api, "invite_user_to_project", return_value=True):
+                            with patch.object(provisioner.api, "get_clusters_in_project", return_value=[]):
+                                with patch.object(provisioner.api, "create_cluster", side_effect=create_cluster):
+                                    provisioner.provision_for_emails(emails)
+
+                    results = provisioner.operation_results["provision"]
+                    assert results["success"] == 11
+                    assert results["failed"] == 1
+                    assert results["failed_emails"] == ["user3@example.com"]
+                    added = {c.args[0] for c in tracker_instance.add_project.call_args_list}
+                    assert added == set(emails)
+
     def test_delete_clusters_for_emails(self, mock_env_vars, mock_response, sample_clusters, paginated_response_factory):
         """Test delete_clusters_for_emails method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -665,7 +963,7 @@ class TestAtlasProvisioner:
     def test_delete_projects_for_emails(self, mock_env_vars, mock_response):
         """Test delete_projects_for_emails method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -684,10 +982,35 @@ class TestAtlasProvisioner:
                         # Verify tracker was updated
                         tracker_instance.remove_project.assert_called_with("user@example.com")
 
+    def test_delete_projects_for_emails_interrupt_cancels_queued_emails(self, mock_env_vars, mock_response):
+        """Test Ctrl-C stops queued project deletions instead of running them all."""
+        with patch.dict(os.environ, mock_env_vars):
+            with patch("requests.Session.request") as mock_get:
+                mock_get.return_value = mock_response(
+                    200, {"results": [{"id": "test_org_id"}]}
+                )
+
+                with patch("provision_projects_for_users.AtlasOwnershipTracker") as MockTracker:
+                    tracker_instance = MagicMock()
+                    tracker_instance.get_project_id.side_effect = lambda email: f"p-{email}"
+                    MockTracker.return_value = tracker_instance
+
+                    import provision_projects_for_users as module
+                    provisioner = module.AtlasProvisioner()
+
+                    emails = [f"user{i}@example.com" for i in range(20)]
+
+                    with patch.object(module, "MAX_PROVISION_WORKERS", 1):
+                        with patch.object(provisioner.api, "delete_project", side_effect=[KeyboardInterrupt] + [True] * 19) as mock_delete:
+                            with pytest.raises(KeyboardInterrupt):
+                                provisioner.delete_projects_for_emails(emails)
+
+                    assert mock_delete.call_count <= 2
+
     def test_delete_all_clusters(self, mock_env_vars, mock_response, sample_clusters):
         """Test delete_all_clusters method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -712,7 +1035,7 @@ class TestAtlasProvisioner:
     def test_delete_all_projects(self, mock_env_vars, mock_response):
         """Test delete_all_projects method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -736,7 +1059,7 @@ class TestAtlasProvisioner:
     def test_get_operation_summary(self, mock_env_vars, mock_response):
         """Test get_operation_summary method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -758,7 +1081,7 @@ class TestAtlasProvisioner:
     def test_has_any_failures(self, mock_env_vars, mock_response):
         """Test has_any_failures method."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -804,7 +1127,7 @@ class TestMain:
     def test_main_provision_no_emails(self, mock_env_vars, mock_response):
         """Test main function with no emails to provision."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -823,7 +1146,7 @@ class TestMain:
     def test_main_cancelled(self, mock_env_vars, mock_response):
         """Test main function when user cancels destructive operation."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -841,7 +1164,7 @@ class TestMain:
     def test_main_keyboard_interrupt(self, mock_env_vars, mock_response):
         """Test main function handles KeyboardInterrupt."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -868,7 +1191,7 @@ class TestMain:
     def test_main_delete_clusters_no_emails(self, mock_env_vars, mock_response):
         """Test delete-clusters action without emails."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -887,7 +1210,7 @@ class TestMain:
     def test_main_delete_projects_no_emails(self, mock_env_vars, mock_response):
         """Test delete-projects action without emails."""
         with patch.dict(os.environ, mock_env_vars):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.request") as mock_get:
                 mock_get.return_value = mock_response(
                     200, {"results": [{"id": "test_org_id"}]}
                 )
@@ -943,7 +1266,7 @@ class TestModuleInitialization:
                 ), "load_dotenv() should be called at module level during import"
                 
                 # Now instantiate - should work because env vars are in os.environ
-                with patch("requests.get") as mock_get:
+                with patch("requests.Session.request") as mock_get:
                     mock_get.return_value = mock_response(
                         200, {"results": [{"id": "test_org_id"}]}
                     )